@@ -0,0 +1,6 @@
+"""
+VocalIA SDK benchmarks.
+
+Everything here runs offline against :mod:`benchmarks.mockserver`; see
+:mod:`benchmarks.suite` for the full scenario suite.
+"""
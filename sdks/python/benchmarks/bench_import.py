@@ -0,0 +1,113 @@
+"""
+Import-time benchmark and regression guard.
+
+Runs each import statement below in fresh interpreters under
+``python -X importtime`` and reports the median cumulative time of the
+``vocalia`` package, plus whether httpx / pydantic were pulled in.
+
+    python benchmarks/bench_import.py            # report
+    python benchmarks/bench_import.py --check    # exit 1 on regression
+
+With ``--check``, the cheap statements must not import httpx or pydantic
+and must stay under ``--max-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# (statement, must stay free of httpx/pydantic)
+STATEMENTS: List[Tuple[str, bool]] = [
+    ("import vocalia", True),
+    ("from vocalia import WebhookVerificationError", True),
+    ("from vocalia import VocalIAError, RateLimitError", True),
+    ("from vocalia import CallSession", False),
+    ("from vocalia import VocalIA", False),
+]
+
+HEAVY = ("httpx", "pydantic")
+
+
+def measure(statement: str) -> Tuple[float, List[str]]:
+    """Return (cumulative ms of vocalia modules, heavy packages imported)."""
+    probe = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    path = os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))
+    env = dict(os.environ, PYTHONPATH=path)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        # Top-level entries have a single space after the separator;
+        # lazily loaded submodules show up as top-level entries too
+        if parts[2].startswith(" vocalia"):
+            total_us += int(parts[1])
+    heavy = [m for m in proc.stdout.strip().split(",") if m]
+    return total_us / 1000.0, heavy
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument(
+        "--max-ms", type=float, default=25.0, help="budget for cheap statements"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Dict[str, object]] = {}
+    failures = []
+    for statement, must_be_light in STATEMENTS:
+        samples = []
+        heavy: List[str] = []
+        for _ in range(args.runs):
+            ms, heavy = measure(statement)
+            samples.append(ms)
+        median = statistics.median(samples)
+        results[statement] = {"median_ms": median, "heavy": heavy}
+        if args.check and must_be_light:
+            if heavy:
+                failures.append(f"{statement!r} imports {', '.join(heavy)}")
+            if median > args.max_ms:
+                failures.append(
+                    f"{statement!r} took {median:.1f} ms (budget {args.max_ms} ms)"
+                )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'statement':<52} {'median ms':>10}  heavy imports")
+        for statement, r in results.items():
+            heavy_list = ", ".join(r["heavy"]) or "-"  # type: ignore[arg-type]
+            print(f"{statement:<52} {r['median_ms']:>10.1f}  {heavy_list}")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Connection pool benchmark.
+
+Drives ``AsyncVocalIA.telephony.get_call`` at a fixed concurrency against
+the mock API server (:mod:`benchmarks.mockserver`) with a fixed service
+delay, once per pool configuration, and reports throughput and latency
+percentiles.
+
+    python benchmarks/bench_pool.py --concurrency 500 --requests 5000
+
+Pass ``--base-url`` (and ``VOCALIA_API_KEY``) to run against a staging API
+instead; HTTP/2 configurations are only measured there, since the local
+server speaks HTTP/1.1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.mockserver import MockConfig, MockServer  # noqa: E402
+from vocalia import AsyncVocalIA  # noqa: E402
+
+CONFIGS: List[Tuple[str, Dict[str, Any]]] = [
+    ("default (100 / 20 keepalive)", {}),
+    ("keepalive 100", {"max_keepalive": 100}),
+    ("pool 500 / keepalive 20", {"max_connections": 500}),
+    ("pool 500 / keepalive 500", {"max_connections": 500, "max_keepalive": 500}),
+    (
+        "pool 500 / keepalive 500 / expiry 60s",
+        {"max_connections": 500, "max_keepalive": 500, "keepalive_expiry": 60.0},
+    ),
+    ("http2", {"http2": True}),
+]
+
+
+async def run_config(
+    base_url: str,
+    api_key: str,
+    options: Dict[str, Any],
+    concurrency: int,
+    requests: int,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async with AsyncVocalIA(
+        api_key=api_key, base_url=base_url, max_retries=0, **options
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    await client.telephony.get_call("call_bench")
+                except Exception:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        if not latencies:
+            return float("nan")
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1e3
+
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": pct(0.50),
+        "p99_ms": pct(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1e3 if latencies else float("nan"),
+        "errors": errors,
+    }
+
+
+def _has_h2() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument(
+        "--delay", type=float, default=0.02, help="server delay (local only)"
+    )
+    parser.add_argument("--base-url", help="benchmark a real API instead")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.base_url:
+        base_url = args.base_url
+        api_key = os.environ.get("VOCALIA_API_KEY", "")
+    else:
+        server = MockServer(MockConfig(latency=args.delay))
+        base_url = await server.start()
+        api_key = "bench"
+
+    results = {}
+    try:
+        for name, options in CONFIGS:
+            if options.get("http2") and (server is not None or not _has_h2()):
+                continue
+            results[name] = await run_config(
+                base_url, api_key, options, args.concurrency, args.requests
+            )
+    finally:
+        if server is not None:
+            await server.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'configuration':<40} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'err':>5}")
+    for name, r in results.items():
+        print(
+            f"{name:<40} {r['rps']:>9.0f} {r['p50_ms']:>8.1f} "
+            f"{r['p99_ms']:>8.1f} {r['errors']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,519 @@
+"""
+Local stand-in for the VocalIA API.
+
+Serves every ``/v1/voice/*`` and ``/v1/telephony/*`` route the SDK calls,
+with canned but well-formed payloads, over a minimal keep-alive HTTP/1.1
+implementation so the server itself costs as little CPU as possible.
+Latency, payload sizes and an error rate are configurable.
+
+    python -m benchmarks.mockserver --port 8080 --latency 0.02 --error-rate 0.01
+
+In-process use:
+
+    async with MockServer(MockConfig(latency=0.005)) as server:
+        client = AsyncVocalIA(api_key="bench", base_url=server.url)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qsl, urlsplit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@dataclass
+class MockConfig:
+    """
+    Behaviour of the mock server.
+
+    Attributes:
+        latency: Seconds added before every response
+        jitter: Latency varies uniformly by up to this many seconds
+        error_rate: Fraction of requests answered with ``error_status``
+        error_status: Status used for injected errors
+        personas: Personas returned by ``/v1/voice/personas``
+        languages: Languages returned by ``/v1/voice/languages``
+        total_calls: Calls available to ``list_calls`` / ``iter_calls``
+        transcript_turns: Messages in a call transcript
+        audio_bytes: Size of synthesized audio and recordings
+        chunk_size: Chunk size of streamed audio
+        stream_chunks: Text deltas in a streamed ``generate`` response
+        seed: Random seed for jitter and error injection
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    personas: int = 40
+    languages: int = 10
+    total_calls: int = 10_000
+    transcript_turns: int = 20
+    audio_bytes: int = 256 * 1024
+    chunk_size: int = 16 * 1024
+    stream_chunks: int = 20
+    seed: Optional[int] = None
+
+    @classmethod
+    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
+        """Add one ``--option`` per field to ``parser``."""
+        for field in dataclasses.fields(cls):
+            default = field.default
+            kind = type(default) if default is not None else int
+            parser.add_argument(
+                "--" + field.name.replace("_", "-"),
+                type=kind,
+                default=default,
+                dest=field.name,
+            )
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "MockConfig":
+        return cls(**{f.name: getattr(args, f.name) for f in dataclasses.fields(cls)})
+
+    def to_args(self) -> List[str]:
+        """Command line reproducing this configuration."""
+        argv = []
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if value is not None:
+                argv += ["--" + field.name.replace("_", "-"), str(value)]
+        return argv
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "headers", "body")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+
+# (status, headers, body); an iterator body is sent chunk-encoded
+Response = Tuple[int, List[Tuple[str, str]], Union[bytes, Iterator[bytes]]]
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    206: "Partial Content",
+    304: "Not Modified",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    416: "Range Not Satisfiable",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+_CALL_PATH = r"/v1/telephony/calls/(?P<call_id>[^/]+)"
+
+
+def _json(data: Any, status: int = 200) -> Response:
+    body = json.dumps(data, separators=(",", ":")).encode()
+    return status, [("Content-Type", "application/json")], body
+
+
+class MockServer:
+    """
+    Asyncio mock of the VocalIA API.
+
+    ``requests`` counts the requests served per route name.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None) -> None:
+        self.config = config or MockConfig()
+        self.requests: Counter[str] = Counter()
+        self.url = ""
+        self._random = random.Random(self.config.seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes: List[Tuple[str, "re.Pattern[str]", str]] = [
+            ("POST", re.compile(r"/v1/voice/generate"), "generate"),
+            ("POST", re.compile(r"/v1/voice/transcribe"), "transcribe"),
+            ("POST", re.compile(r"/v1/voice/synthesize"), "synthesize"),
+            ("GET", re.compile(r"/v1/voice/personas"), "personas"),
+            ("GET", re.compile(r"/v1/voice/languages"), "languages"),
+            ("POST", re.compile(r"/v1/voice/widget-token"), "widget_token"),
+            ("POST", re.compile(r"/v1/telephony/calls"), "initiate_call"),
+            ("GET", re.compile(r"/v1/telephony/calls"), "list_calls"),
+            ("GET", re.compile(_CALL_PATH), "get_call"),
+            ("POST", re.compile(_CALL_PATH + "/end"), "end_call"),
+            ("POST", re.compile(_CALL_PATH + "/transfer"), "transfer_call"),
+            ("GET", re.compile(_CALL_PATH + "/transcript"), "transcript"),
+            ("GET", re.compile(_CALL_PATH + "/recording"), "recording"),
+            ("GET", re.compile(r"/v1/telephony/analytics"), "analytics"),
+            ("POST", re.compile(r"/v1/telephony/webhooks"), "webhooks"),
+        ]
+        size = self.config.audio_bytes
+        self._audio = random.Random(0).getrandbits(8 * size).to_bytes(size, "little")
+        self._audio_sha256 = hashlib.sha256(self._audio).hexdigest()
+        self._catalogs = {
+            "personas": self._catalog("personas", self._persona),
+            "languages": self._catalog("languages", self._language),
+        }
+
+    # Lifecycle
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening and return the base URL."""
+        self._server = await asyncio.start_server(
+            self._serve, host, port, backlog=4096
+        )
+        bound = self._server.sockets[0].getsockname()
+        self.url = f"http://{bound[0]}:{bound[1]}"
+        return self.url
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MockServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    # Connection handling
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                status, headers, body = await self._handle(request)
+                await _write_response(writer, status, headers, body)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, request: Request) -> Response:
+        config = self.config
+        delay = config.latency
+        if config.jitter:
+            delay += self._random.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        name, params = self._match(request)
+        self.requests[name or "unknown"] += 1
+        if name is None:
+            return _json({"error": "not_found", "message": request.path}, 404)
+        if config.error_rate and self._random.random() < config.error_rate:
+            status, headers, body = _json(
+                {"error": "unavailable", "message": "Injected error"},
+                config.error_status,
+            )
+            return status, headers + [("Retry-After", "0")], body
+        handler: Callable[..., Response] = getattr(self, "_" + name)
+        return handler(request, **params)
+
+    def _match(self, request: Request) -> Tuple[Optional[str], Dict[str, str]]:
+        for method, pattern, name in self._routes:
+            if method == request.method:
+                match = pattern.fullmatch(request.path)
+                if match is not None:
+                    return name, match.groupdict()
+        return None, {}
+
+    # Payloads
+
+    def _call(self, call_id: str, status: str = "in_progress") -> Dict[str, Any]:
+        return {
+            "id": call_id,
+            "status": status,
+            "to": "+212600000000",
+            "from": "+212500000000",
+            "persona": "DENTAL",
+            "language": "fr",
+            "started_at": "2024-05-01T10:00:00Z",
+            "duration_seconds": 42,
+            "direction": "outbound",
+            "metadata": {"campaign": "bench"},
+            "cost": 0.12,
+        }
+
+    def _persona(self, i: int) -> Dict[str, Any]:
+        return {
+            "key": f"PERSONA_{i}",
+            "name": f"Persona {i}",
+            "description": "Benchmark persona " * 4,
+            "industry": "healthcare",
+            "languages": ["fr", "ar", "en"],
+            "voice_style": "friendly",
+        }
+
+    def _language(self, i: int) -> Dict[str, Any]:
+        return {
+            "code": f"l{i}",
+            "name": f"Language {i}",
+            "native_name": f"Langue {i}",
+            "supported_features": ["voice", "telephony"],
+        }
+
+    def _catalog(self, key: str, item: Callable[[int], Dict[str, Any]]) -> Response:
+        count = self.config.personas if key == "personas" else self.config.languages
+        status, headers, body = _json({key: [item(i) for i in range(count)]})
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        return status, headers + [("ETag", etag)], body
+
+    # Voice routes
+
+    def _generate(self, request: Request) -> Response:
+        payload = request.json()
+        response = {
+            "text": "Bonjour, comment puis-je vous aider aujourd'hui ?",
+            "persona": payload.get("persona", "AGENCY"),
+            "language": payload.get("language", "fr"),
+            "duration_ms": 1800,
+            "confidence": 0.93,
+        }
+        if not payload.get("stream"):
+            return _json(response)
+
+        def events() -> Iterator[bytes]:
+            for i in range(self.config.stream_chunks):
+                yield b'{"type":"text","delta":"mot%d "}\n' % i
+            final = {"type": "done", "response": response}
+            yield json.dumps(final).encode() + b"\n"
+
+        return 200, [("Content-Type", "application/x-ndjson")], events()
+
+    def _transcribe(self, request: Request) -> Response:
+        return _json({"text": "Je voudrais prendre rendez-vous.", "duration_ms": 2100})
+
+    def _synthesize(self, request: Request) -> Response:
+        headers = [("Content-Type", "audio/mpeg")]
+        if not request.json().get("stream"):
+            return 200, headers, self._audio
+        size = self.config.chunk_size
+        audio = self._audio
+        chunks = (audio[i : i + size] for i in range(0, len(audio), size))
+        return 200, headers, chunks
+
+    def _personas(self, request: Request) -> Response:
+        return self._conditional(request, self._catalogs["personas"])
+
+    def _languages(self, request: Request) -> Response:
+        return self._conditional(request, self._catalogs["languages"])
+
+    def _conditional(self, request: Request, response: Response) -> Response:
+        etag = dict(response[1])["ETag"]
+        if request.headers.get("if-none-match") == etag:
+            return 304, [("ETag", etag)], b""
+        return response
+
+    def _widget_token(self, request: Request) -> Response:
+        return _json({"token": "wt_" + "x" * 48, "expires_in": 3600})
+
+    # Telephony routes
+
+    def _initiate_call(self, request: Request) -> Response:
+        return _json(self._call(f"call_{self._random.getrandbits(48):012x}", "queued"))
+
+    def _list_calls(self, request: Request) -> Response:
+        limit = int(request.query.get("limit", 50))
+        offset = int(request.query.get("offset", 0))
+        end = min(offset + limit, self.config.total_calls)
+        calls = [self._call(f"call_{i:08d}") for i in range(offset, end)]
+        total = self.config.total_calls
+        return _json({"calls": calls, "total": total, "has_more": end < total})
+
+    def _get_call(self, request: Request, call_id: str) -> Response:
+        return _json(self._call(call_id))
+
+    def _end_call(self, request: Request, call_id: str) -> Response:
+        return _json(self._call(call_id, "completed"))
+
+    def _transfer_call(self, request: Request, call_id: str) -> Response:
+        return _json(self._call(call_id))
+
+    def _transcript(self, request: Request, call_id: str) -> Response:
+        turns = [
+            {
+                "role": "user" if i % 2 else "assistant",
+                "content": f"Message {i} de la conversation.",
+                "timestamp": "2024-05-01T10:00:%02dZ" % (i % 60),
+            }
+            for i in range(self.config.transcript_turns)
+        ]
+        return _json({"call_id": call_id, "transcript": turns})
+
+    def _recording(self, request: Request, call_id: str) -> Response:
+        audio = self._audio
+        headers = [
+            ("Content-Type", "audio/mpeg"),
+            ("Accept-Ranges", "bytes"),
+            ("X-Checksum-SHA256", self._audio_sha256),
+        ]
+        match = re.fullmatch(r"bytes=(\d+)-", request.headers.get("range", ""))
+        if match is None:
+            return 200, headers, audio
+        start = int(match.group(1))
+        if start >= len(audio):
+            return 416, [("Content-Range", f"bytes */{len(audio)}")], b""
+        content_range = f"bytes {start}-{len(audio) - 1}/{len(audio)}"
+        return 206, headers + [("Content-Range", content_range)], audio[start:]
+
+    def _analytics(self, request: Request) -> Response:
+        return _json(
+            {
+                "total_calls": self.config.total_calls,
+                "completed": int(self.config.total_calls * 0.8),
+                "average_duration_seconds": 94.5,
+                "total_cost": 1234.5,
+            }
+        )
+
+    def _webhooks(self, request: Request) -> Response:
+        payload = request.json()
+        return _json({"id": "wh_bench", "url": payload.get("url"), "active": True})
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        parts = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                await reader.readuntil(b"\r\n")
+                break
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(parts)
+    else:
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+
+    url = urlsplit(target)
+    return Request(method, url.path, dict(parse_qsl(url.query)), headers, body)
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter,
+    status: int,
+    headers: List[Tuple[str, str]],
+    body: Union[bytes, Iterator[bytes]],
+) -> None:
+    head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}"]
+    head += [f"{name}: {value}" for name, value in headers]
+    if isinstance(body, bytes):
+        head.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+        return
+
+    head.append("Transfer-Encoding: chunked")
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+    for chunk in body:
+        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+@contextlib.contextmanager
+def spawn(config: Optional[MockConfig] = None) -> Iterator[str]:
+    """
+    Run the mock server in a child process and yield its base URL.
+
+    Keeping the server out of the benchmarked process means its CPU time
+    and allocations are not counted against the SDK.
+    """
+    config = config or MockConfig()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.mockserver", "--port", "0"]
+        + config.to_args(),
+        stdout=subprocess.PIPE,
+        cwd=ROOT,
+        text=True,
+    )
+    try:
+        assert proc.stdout is not None
+        url = proc.stdout.readline().strip()
+        if not url:
+            raise RuntimeError("mock server failed to start")
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+async def _serve_forever(config: MockConfig, host: str, port: int) -> None:
+    server = MockServer(config)
+    print(await server.start(host, port), flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    MockConfig.add_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve_forever(MockConfig.from_args(args), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Offline SDK benchmark suite.
+
+Runs each scenario below against the local mock API server (started in a
+child process so its CPU time is not counted) and reports throughput,
+latency percentiles, client CPU per request and memory allocated. Results
+are written as JSON so runs of different SDK releases can be compared.
+
+    python -m benchmarks.suite                          # all scenarios
+    python -m benchmarks.suite --only 'sync.list_calls*' --ops 500
+    python -m benchmarks.suite --latency 0.005 --error-rate 0.01
+    python -m benchmarks.suite --compare benchmarks/results/old.json
+
+With ``--compare``, the exit status is 1 when a scenario's CPU per
+request grew, or its throughput fell, by more than ``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import vocalia  # noqa: E402
+from benchmarks.mockserver import MockConfig, spawn  # noqa: E402
+from vocalia import AsyncVocalIA, VocalIA, VocalIAError  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Keys compared by --compare, with the direction that counts as better
+COMPARED = {"cpu_ms_per_op": "lower", "ops_per_sec": "higher"}
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmarked operation.
+
+    Attributes:
+        name: Dotted identifier, ``<sync|async>.<operation>[.<variant>]``
+        op: Called with the client for every operation; a coroutine
+            function for async scenarios
+        asynchronous: Use AsyncVocalIA instead of VocalIA
+        options: Extra client constructor arguments
+        concurrency: Threads (sync) or tasks (async) issuing operations
+    """
+
+    name: str
+    op: Callable[[Any], Any]
+    asynchronous: bool = False
+    options: Dict[str, Any] = field(default_factory=dict)
+    concurrency: int = 1
+
+
+def _synthesize_streamed(client: VocalIA) -> int:
+    with client.voice.synthesize_stream("Bonjour") as stream:
+        return sum(len(chunk) for chunk in stream)
+
+
+def _stream_response(client: VocalIA) -> str:
+    with client.voice.stream_response("Bonjour") as stream:
+        for _ in stream:
+            pass
+        return stream.response.text
+
+
+async def _async_stream_response(client: AsyncVocalIA) -> str:
+    async with client.voice.stream_response("Bonjour") as stream:
+        async for _ in stream:
+            pass
+        return stream.response.text
+
+
+async def _async_synthesize_streamed(client: AsyncVocalIA) -> int:
+    total = 0
+    async with client.voice.synthesize_stream("Bonjour") as stream:
+        async for chunk in stream:
+            total += len(chunk)
+    return total
+
+
+def _pool(size: int) -> Dict[str, Any]:
+    return {"max_connections": size, "max_keepalive": size}
+
+
+SCENARIOS: List[Scenario] = [
+    # Per-call overhead, small JSON
+    Scenario("sync.get_call", lambda c: c.telephony.get_call("call_1")),
+    Scenario(
+        "async.get_call",
+        lambda c: c.telephony.get_call("call_1"),
+        asynchronous=True,
+    ),
+    Scenario(
+        "sync.get_call.threads8",
+        lambda c: c.telephony.get_call("call_1"),
+        concurrency=8,
+    ),
+    Scenario(
+        "sync.initiate_call", lambda c: c.telephony.initiate_call("+212600000000")
+    ),
+    Scenario("sync.get_transcript", lambda c: c.telephony.get_transcript("call_1")),
+    Scenario(
+        "sync.list_personas.uncached",
+        lambda c: c.voice.list_personas(),
+        options={"catalog_ttl": None},
+    ),
+    Scenario("sync.list_personas.cached", lambda c: c.voice.list_personas()),
+    # Pool sizes under concurrency
+    Scenario(
+        "async.get_call.c100.pool10",
+        lambda c: c.telephony.get_call("call_1"),
+        asynchronous=True,
+        options=_pool(10),
+        concurrency=100,
+    ),
+    Scenario(
+        "async.get_call.c100.pool100",
+        lambda c: c.telephony.get_call("call_1"),
+        asynchronous=True,
+        options=_pool(100),
+        concurrency=100,
+    ),
+    # Validation modes on a 100-call page
+    *(
+        Scenario(
+            f"sync.list_calls.{mode}",
+            lambda c: c.telephony.list_calls(limit=100),
+            options={"validation": mode},
+        )
+        for mode in ("strict", "trusted", "lazy")
+    ),
+    # Streaming vs buffered
+    Scenario("sync.synthesize.buffered", lambda c: c.voice.synthesize("Bonjour")),
+    Scenario("sync.synthesize.streamed", _synthesize_streamed),
+    Scenario(
+        "async.synthesize.buffered",
+        lambda c: c.voice.synthesize("Bonjour"),
+        asynchronous=True,
+    ),
+    Scenario(
+        "async.synthesize.streamed", _async_synthesize_streamed, asynchronous=True
+    ),
+    Scenario(
+        "sync.generate.buffered", lambda c: c.voice.generate_response("Bonjour")
+    ),
+    Scenario("sync.generate.streamed", _stream_response),
+    Scenario(
+        "async.generate.buffered",
+        lambda c: c.voice.generate_response("Bonjour"),
+        asynchronous=True,
+    ),
+    Scenario("async.generate.streamed", _async_stream_response, asynchronous=True),
+]
+
+
+def _summarize(
+    latencies: List[float], errors: int, elapsed: float, cpu: float
+) -> Dict[str, float]:
+    latencies.sort()
+    done = len(latencies)
+
+    def pct(p: float) -> float:
+        if not latencies:
+            return float("nan")
+        return latencies[min(done - 1, int(p * done))] * 1e3
+
+    ops = done + errors
+    return {
+        "ops": ops,
+        "errors": errors,
+        "duration_s": elapsed,
+        "ops_per_sec": done / elapsed if elapsed else 0.0,
+        "p50_ms": pct(0.50),
+        "p99_ms": pct(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1e3 if latencies else float("nan"),
+        "cpu_ms_per_op": cpu * 1e3 / ops if ops else float("nan"),
+    }
+
+
+@contextlib.contextmanager
+def _traced(result: Dict[str, float], ops: int) -> Iterator[None]:
+    """Record peak and retained traced memory of the ``ops`` run inside."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        yield
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result["alloc_peak_kib"] = (peak - base) / 1024
+    result["retained_bytes_per_op"] = max(0, current - base) / max(ops, 1)
+
+
+def run_sync(
+    scenario: Scenario, base_url: str, ops: int, warmup: int, alloc_ops: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+
+    with VocalIA(api_key="bench", base_url=base_url, **scenario.options) as client:
+
+        def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                try:
+                    scenario.op(client)
+                except VocalIAError:
+                    with lock:
+                        errors[0] += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        worker(warmup)
+        latencies.clear()
+        errors[0] = 0
+
+        workers = scenario.concurrency
+        shares = [ops // workers + (i < ops % workers) for i in range(workers)]
+        cpu = time.process_time()
+        started = time.perf_counter()
+        if workers == 1:
+            worker(ops)
+        else:
+            with ThreadPoolExecutor(workers) as pool:
+                list(pool.map(worker, shares))
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu
+
+        result = _summarize(latencies, errors[0], elapsed, cpu)
+        with _traced(result, alloc_ops):
+            worker(alloc_ops)
+    return result
+
+
+async def run_async(
+    scenario: Scenario, base_url: str, ops: int, warmup: int, alloc_ops: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+
+    async with AsyncVocalIA(
+        api_key="bench", base_url=base_url, **scenario.options
+    ) as client:
+
+        async def worker(remaining: Any) -> None:
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    await scenario.op(client)
+                except VocalIAError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        await worker(range(warmup))
+        latencies.clear()
+        errors = 0
+
+        remaining = iter(range(ops))
+        cpu = time.process_time()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(remaining) for _ in range(scenario.concurrency)))
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu
+
+        result = _summarize(latencies, errors, elapsed, cpu)
+        with _traced(result, alloc_ops):
+            await worker(range(alloc_ops))
+    return result
+
+
+def environment(config: MockConfig) -> Dict[str, Any]:
+    from vocalia.codec import get_codec
+
+    return {
+        "vocalia": vocalia.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "json_codec": get_codec().name,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "server": asdict(config),
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Print per-scenario changes against ``baseline``; return regressions."""
+    regressions = []
+    print(f"\nvs {baseline.get('vocalia', '?')} ({baseline.get('timestamp', '?')})")
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        changes = []
+        for key, better in COMPARED.items():
+            old, new = previous.get(key), current.get(key)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            changes.append(f"{key} {change:+.1%}")
+            worse = change > tolerance if better == "lower" else change < -tolerance
+            if worse:
+                regressions.append(f"{name}: {key} {old:.4g} -> {new:.4g}")
+        print(f"  {name:<34} {', '.join(changes)}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", action="append", help="glob of scenario names")
+    parser.add_argument("--ops", type=int, default=2000, help="operations per run")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--alloc-ops", type=int, default=100, help="operations traced for memory"
+    )
+    parser.add_argument("--base-url", help="use a running mock server")
+    parser.add_argument("--out", help="results file (default: benchmarks/results/)")
+    parser.add_argument("--compare", help="baseline results file")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument("--list", action="store_true", help="list scenarios")
+    MockConfig.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        s
+        for s in SCENARIOS
+        if not args.only or any(fnmatch.fnmatch(s.name, p) for p in args.only)
+    ]
+    if args.list:
+        for scenario in scenarios:
+            print(scenario.name)
+        return 0
+
+    config = MockConfig.from_args(args)
+    results: Dict[str, Any] = environment(config)
+    results["scenarios"] = {}
+
+    def run_all(base_url: str) -> None:
+        for scenario in scenarios:
+            if scenario.asynchronous:
+                result = asyncio.run(
+                    run_async(
+                        scenario, base_url, args.ops, args.warmup, args.alloc_ops
+                    )
+                )
+            else:
+                result = run_sync(
+                    scenario, base_url, args.ops, args.warmup, args.alloc_ops
+                )
+            results["scenarios"][scenario.name] = result
+            print(
+                f"{scenario.name:<34} {result['ops_per_sec']:>9.0f} "
+                f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+                f"{result['cpu_ms_per_op']:>8.3f} {result['alloc_peak_kib']:>9.0f} "
+                f"{result['errors']:>5}",
+                flush=True,
+            )
+
+    print(
+        f"{'scenario':<34} {'ops/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'cpu ms':>8} {'peak KiB':>9} {'err':>5}"
+    )
+    if args.base_url:
+        run_all(args.base_url)
+    else:
+        with spawn(config) as base_url:
+            run_all(base_url)
+
+    out = args.out
+    if out is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        out = os.path.join(RESULTS_DIR, f"vocalia-{vocalia.__version__}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nresults written to {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Shared fixtures: clients whose requests are answered by an in-process
+``httpx.MockTransport`` handler instead of the network.
+"""
+
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+
+from vocalia import AsyncVocalIA, RetryPolicy, VocalIA
+
+Handler = Callable[[httpx.Request], Any]
+
+# No real waiting between retries
+FAST_RETRY = RetryPolicy(max_retries=2, backoff_base=0.001, backoff_max=0.001)
+
+
+def call_payload(call_id: str = "call_1", status: str = "queued") -> dict:
+    return {
+        "id": call_id,
+        "status": status,
+        "to": "+212600000000",
+        "persona": "AGENCY",
+        "language": "fr",
+    }
+
+
+@pytest.fixture
+def make_client() -> Callable[..., VocalIA]:
+    clients: List[VocalIA] = []
+
+    def make(handler: Handler, **options: Any) -> VocalIA:
+        options.setdefault("retry", FAST_RETRY)
+        client = VocalIA(api_key="test-key", **options)
+        client._http_client._transport = httpx.MockTransport(handler)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncVocalIA]:
+    def make(handler: Handler, **options: Any) -> AsyncVocalIA:
+        options.setdefault("retry", FAST_RETRY)
+        client = AsyncVocalIA(api_key="test-key", **options)
+        client._http_client._transport = httpx.MockTransport(handler)
+        return client
+
+    return make
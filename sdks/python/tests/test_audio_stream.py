@@ -0,0 +1,146 @@
+"""Streamed synthesis: chunk iteration and write_to sinks."""
+
+import asyncio
+import io
+import json
+import socket
+
+import httpx
+import pytest
+
+from vocalia import ValidationError
+
+CHUNKS = [b"ID3", b"\xff\xfb" * 500, b"tail"]
+AUDIO = b"".join(CHUNKS)
+
+
+def _handler(seen):
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(
+            200, headers={"content-type": "audio/mpeg"}, content=iter(CHUNKS)
+        )
+
+    return handler
+
+
+def test_chunks_are_yielded_as_received(make_client):
+    seen = []
+    client = make_client(_handler(seen))
+
+    with client.voice.synthesize_stream("Bienvenue", speed=1.5) as audio:
+        chunks = list(audio)
+
+    assert chunks == CHUNKS
+    assert audio.content_type == "audio/mpeg"
+    assert json.loads(seen[0].content)["stream"] is True
+    assert json.loads(seen[0].content)["speed"] == 1.5
+
+
+def test_chunk_size_rechunks(make_client):
+    client = make_client(_handler([]))
+
+    chunks = list(client.voice.synthesize_stream("Bienvenue", chunk_size=256))
+
+    assert b"".join(chunks) == AUDIO
+    assert all(len(c) == 256 for c in chunks[:-1])
+
+
+def test_request_is_lazy(make_client):
+    seen = []
+    client = make_client(_handler(seen))
+
+    audio = client.voice.synthesize_stream("Bienvenue")
+    assert seen == []
+    next(audio)
+    audio.close()
+    assert len(seen) == 1
+
+
+def test_write_to_path_and_file(make_client, tmp_path):
+    client = make_client(_handler([]))
+    path = tmp_path / "out.mp3"
+    buffer = io.BytesIO()
+
+    assert client.voice.synthesize_stream("a").write_to(path) == len(AUDIO)
+    assert client.voice.synthesize_stream("a").write_to(buffer) == len(AUDIO)
+
+    assert path.read_bytes() == AUDIO
+    assert buffer.getvalue() == AUDIO
+
+
+def test_write_to_socket(make_client):
+    client = make_client(_handler([]))
+    left, right = socket.socketpair()
+    with left, right:
+        written = client.voice.synthesize_stream("a").write_to(left)
+        left.shutdown(socket.SHUT_WR)
+        received = b"".join(iter(lambda: right.recv(65536), b""))
+
+    assert written == len(AUDIO)
+    assert received == AUDIO
+
+
+def test_write_to_rejects_unknown_target(make_client):
+    client = make_client(_handler([]))
+
+    with pytest.raises(TypeError):
+        client.voice.synthesize_stream("a").write_to(42)
+
+
+def test_error_status_raises(make_client):
+    def handler(request):
+        return httpx.Response(400, json={"error": "text too long"})
+
+    client = make_client(handler)
+
+    with pytest.raises(ValidationError, match="text too long"):
+        list(client.voice.synthesize_stream("a"))
+
+
+def test_async_write_to_path_socket_and_writer(make_async_client, tmp_path):
+    async def body():
+        for chunk in CHUNKS:
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(200, content=body())
+
+    class Writer:
+        def __init__(self):
+            self.data = b""
+            self.drains = 0
+
+        def write(self, chunk):
+            self.data += chunk
+
+        async def drain(self):
+            self.drains += 1
+
+    path = tmp_path / "out.mp3"
+    writer = Writer()
+    left, right = socket.socketpair()
+
+    async def main():
+        client = make_async_client(handler)
+        try:
+            voice = client.voice
+            assert await voice.synthesize_stream("a").write_to(path) == len(AUDIO)
+            assert await voice.synthesize_stream("a").write_to(writer) == len(AUDIO)
+            assert await voice.synthesize_stream("a").write_to(left) == len(AUDIO)
+            async with voice.synthesize_stream("a") as audio:
+                return [chunk async for chunk in audio]
+        finally:
+            await client.close()
+
+    with left, right:
+        chunks = asyncio.run(main())
+        left.shutdown(socket.SHUT_WR)
+        received = b"".join(iter(lambda: right.recv(65536), b""))
+        # The socket's blocking mode is restored afterwards
+        assert left.gettimeout() is None
+
+    assert chunks == CHUNKS
+    assert path.read_bytes() == AUDIO
+    assert writer.data == AUDIO and writer.drains == len(CHUNKS)
+    assert received == AUDIO
@@ -0,0 +1,124 @@
+"""Two-tier synthesis cache."""
+
+import asyncio
+import mmap
+import os
+
+import httpx
+import pytest
+
+from vocalia.audiocache import SynthesisCache, synthesis_key
+
+KEY = synthesis_key("Bonjour", None, "fr", 1.0)
+OTHER = synthesis_key("Au revoir", None, "fr", 1.0)
+
+
+def _open_fds() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+def test_memory_only_cache():
+    cache = SynthesisCache(memory_bytes=100)
+    cache.put(KEY, b"abc")
+
+    assert cache.get(KEY) == b"abc"
+    assert cache.get(OTHER) is None
+
+
+def test_disk_hit_from_another_instance(tmp_path):
+    SynthesisCache(tmp_path).put(KEY, b"x" * 5000)
+
+    audio = SynthesisCache(tmp_path).get(KEY)
+
+    assert isinstance(audio, bytes)
+    assert audio == b"x" * 5000
+
+
+def test_large_files_are_mapped(tmp_path):
+    SynthesisCache(tmp_path).put(KEY, b"x" * 5000)
+
+    audio = SynthesisCache(tmp_path, map_above=1000).get(KEY)
+
+    assert isinstance(audio, mmap.mmap)
+    assert audio[:3] == b"xxx" and len(audio) == 5000
+    audio.close()
+
+
+def test_files_over_a_mebibyte_are_mapped_by_default(tmp_path):
+    cache = SynthesisCache(tmp_path)
+    cache.put(KEY, b"x" * (2 * 1024 * 1024))
+
+    audio = SynthesisCache(tmp_path).get(KEY)
+
+    assert isinstance(audio, mmap.mmap)
+    audio.close()
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs procfs")
+def test_repeated_hits_do_not_leak_descriptors(tmp_path):
+    SynthesisCache(tmp_path).put(KEY, b"x" * 20000)
+    cache = SynthesisCache(tmp_path)
+    before = _open_fds()
+
+    for _ in range(200):
+        cache.get(KEY)
+
+    assert _open_fds() == before
+
+
+def test_overwrite_is_not_double_counted(tmp_path):
+    cache = SynthesisCache(tmp_path)
+    cache.put(KEY, b"a" * 1000)
+    cache.put(OTHER, b"b" * 10)
+    cache.put(KEY, b"c" * 1000)
+
+    assert cache._disk_size == 1010
+
+
+def test_eviction_keeps_directory_under_cap(tmp_path):
+    cache = SynthesisCache(tmp_path, max_bytes=10_000, memory_bytes=0)
+    for i in range(20):
+        cache.put(synthesis_key(f"text {i}", None, "fr", 1.0), b"x" * 1000)
+
+    sizes = [
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(tmp_path)
+        for name in names
+    ]
+    assert sum(sizes) <= 10_000
+
+
+def test_synthesize_served_from_cache(make_client, tmp_path):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, content=b"ID3 audio")
+
+    client = make_client(handler, synthesis_cache=SynthesisCache(tmp_path))
+
+    assert client.voice.synthesize("Bonjour") == b"ID3 audio"
+    assert client.voice.synthesize("Bonjour") == b"ID3 audio"
+    assert len(seen) == 1
+
+
+def test_async_synthesize_served_from_cache(make_async_client, tmp_path):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, content=b"ID3 audio")
+
+    async def main():
+        cache = SynthesisCache(tmp_path)
+        client = make_async_client(handler, synthesis_cache=cache)
+        try:
+            first = await client.voice.synthesize("Bonjour")
+            cache._memory.clear()
+            second = await client.voice.synthesize("Bonjour")
+        finally:
+            await client.close()
+        return first, second
+
+    assert asyncio.run(main()) == (b"ID3 audio", b"ID3 audio")
+    assert len(seen) == 1
@@ -0,0 +1,68 @@
+"""Bulk dialling with a resumable journal."""
+
+import asyncio
+import threading
+from typing import List
+
+import httpx
+
+from vocalia import campaign
+
+from .conftest import call_payload
+
+BATCH = [{"to": "+212600000001"}, {"to": "+212600000002"}]
+
+
+def _handler(sent: List[httpx.Request]):
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json=call_payload(f"call_{len(sent)}"))
+
+    return handler
+
+
+def test_journal_skips_placed_calls_on_rerun(make_client, tmp_path):
+    journal = tmp_path / "campaign.jsonl"
+    sent: List[httpx.Request] = []
+    client = make_client(_handler(sent))
+
+    first = client.telephony.initiate_calls(BATCH, campaign_id="c1", journal=journal)
+    again = client.telephony.initiate_calls(BATCH, campaign_id="c1", journal=journal)
+
+    assert [r.ok for r in first] == [True, True] and len(sent) == 2
+    assert [r.resumed for r in again] == [True, True]
+    assert sorted(r.call.id for r in again) == sorted(r.call.id for r in first)
+
+
+def test_async_run_loads_journal_off_the_loop(make_async_client, tmp_path, monkeypatch):
+    journal = tmp_path / "campaign.jsonl"
+    sent: List[httpx.Request] = []
+    loaded_on: List[threading.Thread] = []
+    load = campaign.CallJournal.__init__
+
+    def spy(self, path):
+        loaded_on.append(threading.current_thread())
+        load(self, path)
+
+    monkeypatch.setattr(campaign.CallJournal, "__init__", spy)
+    progress: List[int] = []
+
+    async def main():
+        client = make_async_client(_handler(sent))
+        try:
+            for _ in range(2):
+                results = await client.telephony.initiate_calls(
+                    BATCH,
+                    campaign_id="c1",
+                    journal=journal,
+                    on_progress=lambda done, total, result: progress.append(done),
+                )
+            return results
+        finally:
+            await client.close()
+
+    results = asyncio.run(main())
+
+    assert len(sent) == 2 and all(r.resumed for r in results)
+    assert progress == [1, 2, 1, 2]
+    assert threading.main_thread() not in loaded_on and len(loaded_on) == 2
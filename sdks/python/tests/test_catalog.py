@@ -0,0 +1,179 @@
+"""Persona and language catalog cache with ETag revalidation."""
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from vocalia import APIConnectionError
+
+PERSONAS = {
+    "personas": [
+        {
+            "key": "DENTAL",
+            "name": "Dental",
+            "description": "Dental clinic",
+            "industry": "health",
+        },
+        {
+            "key": "AGENCY",
+            "name": "Agency",
+            "description": "Web agency",
+            "industry": "tech",
+        },
+    ]
+}
+
+
+def _server(requests: List[httpx.Request], etag: str = '"v1"'):
+    """Answers 304 when the client already holds ``etag``."""
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, json=PERSONAS, headers={"etag": etag})
+
+    return handler
+
+
+def test_fresh_entry_served_from_memory(make_client):
+    requests: List[httpx.Request] = []
+    client = make_client(_server(requests))
+
+    first = client.voice.list_personas()
+    assert client.voice.list_personas() is first
+    assert client.voice.get_persona("DENTAL").name == "Dental"
+    assert client.voice.get_persona("UNKNOWN") is None
+    assert len(requests) == 1
+
+
+def test_expired_entry_revalidates_with_etag(make_client):
+    requests: List[httpx.Request] = []
+    client = make_client(_server(requests), catalog_ttl=0)
+
+    first = client.voice.list_personas()
+    second = client.voice.list_personas()
+
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    # The 304 kept the parsed list instead of rebuilding it
+    assert second is first
+
+
+def test_changed_etag_replaces_entry(make_client):
+    requests: List[httpx.Request] = []
+    etags = ['"v1"', '"v2"']
+
+    def handler(request):
+        requests.append(request)
+        etag = etags[min(len(requests), 2) - 1]
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, json=PERSONAS, headers={"etag": etag})
+
+    client = make_client(handler, catalog_ttl=0)
+
+    first = client.voice.list_personas()
+    second = client.voice.list_personas()
+    third = client.voice.list_personas()
+
+    assert second is not first
+    assert third is second
+    assert requests[2].headers["if-none-match"] == '"v2"'
+
+
+def test_stale_entry_served_on_connection_error(make_client):
+    requests: List[httpx.Request] = []
+    healthy = _server(requests)
+    down = [False]
+
+    def handler(request):
+        if down[0]:
+            raise httpx.ConnectError("connection refused", request=request)
+        return healthy(request)
+
+    client = make_client(handler, catalog_ttl=0)
+    first = client.voice.list_personas()
+    down[0] = True
+
+    assert client.voice.list_personas() is first
+    assert client.voice.get_persona("AGENCY").industry == "tech"
+
+
+def test_connection_error_without_entry_raises(make_client):
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = make_client(handler)
+
+    with pytest.raises(APIConnectionError):
+        client.voice.list_personas()
+
+
+def test_invalidate_refetches(make_client):
+    requests: List[httpx.Request] = []
+    client = make_client(_server(requests))
+
+    client.voice.list_personas()
+    client.catalog.invalidate("/v1/voice/personas")
+    client.voice.list_personas()
+
+    assert len(requests) == 2
+    assert "if-none-match" not in requests[1].headers
+
+
+def test_without_catalog_every_call_fetches(make_client):
+    requests: List[httpx.Request] = []
+    client = make_client(_server(requests), catalog_ttl=None)
+
+    client.voice.list_personas()
+    client.voice.get_persona("DENTAL")
+
+    assert len(requests) == 2
+
+
+def test_async_concurrent_lookups_fetch_once(make_async_client):
+    requests: List[httpx.Request] = []
+
+    async def main():
+        client = make_async_client(_server(requests))
+        try:
+            return await asyncio.gather(
+                *(client.voice.get_persona("DENTAL") for _ in range(5))
+            )
+        finally:
+            await client.close()
+
+    personas = asyncio.run(main())
+
+    assert {p.key for p in personas} == {"DENTAL"}
+    assert len(requests) == 1
+
+
+def test_async_revalidation_and_stale_on_error(make_async_client):
+    requests: List[httpx.Request] = []
+    healthy = _server(requests)
+    down = [False]
+
+    def handler(request):
+        if down[0]:
+            raise httpx.ConnectError("connection refused", request=request)
+        return healthy(request)
+
+    async def main():
+        client = make_async_client(handler, catalog_ttl=0)
+        try:
+            first = await client.voice.list_personas()
+            second = await client.voice.list_personas()
+            down[0] = True
+            third = await client.voice.list_personas()
+        finally:
+            await client.close()
+        return first, second, third
+
+    first, second, third = asyncio.run(main())
+
+    assert second is first and third is first
+    assert requests[1].headers["if-none-match"] == '"v1"'
@@ -0,0 +1,181 @@
+"""Per-family circuit breaker."""
+
+import time
+from typing import List, Tuple
+
+import httpx
+import pytest
+
+from vocalia import APIError, CircuitOpenError, NotFoundError, RateLimitError
+from vocalia.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, is_failure
+
+from .conftest import call_payload
+
+PATH = "/v1/voice/generate"
+SERVER_ERROR = APIError("boom", status_code=503)
+
+
+def _breaker(**options) -> CircuitBreaker:
+    options.setdefault("window", 4)
+    options.setdefault("min_calls", 4)
+    options.setdefault("open_duration", 0.05)
+    options.setdefault("half_open_calls", 2)
+    return CircuitBreaker(**options)
+
+
+def _fail(breaker, times=1, error=SERVER_ERROR):
+    for _ in range(times):
+        breaker.on_result(PATH, 0.0, error, breaker.check(PATH))
+
+
+def test_failure_classification():
+    assert is_failure(httpx.ConnectTimeout("slow"))
+    assert is_failure(SERVER_ERROR)
+    assert is_failure(APIError("no status"))
+    assert not is_failure(APIError("bad request", status_code=400))
+    assert not is_failure(RateLimitError())
+    assert not is_failure(NotFoundError("call_1"))
+
+
+def test_closed_to_open_to_half_open_to_closed():
+    events: List[Tuple[str, str]] = []
+    breaker = _breaker()
+    breaker.subscribe(lambda family, state: events.append((family, state)))
+
+    _fail(breaker, 3)
+    assert breaker.state("voice") == CLOSED
+    _fail(breaker)
+    assert breaker.state("voice") == OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.check(PATH)
+    assert error.value.family == "voice"
+    assert 0 < error.value.retry_after <= 0.05
+    # Other families are unaffected
+    breaker.on_result(
+        "/v1/telephony/calls", 0.0, None, breaker.check("/v1/telephony/calls")
+    )
+
+    time.sleep(0.06)
+    first = breaker.check(PATH)
+    assert breaker.state("voice") == HALF_OPEN
+    second = breaker.check(PATH)
+    with pytest.raises(CircuitOpenError, match="probes in flight"):
+        breaker.check(PATH)
+    breaker.on_result(PATH, 0.0, None, first)
+    breaker.on_result(PATH, 0.0, None, second)
+
+    assert breaker.state("voice") == CLOSED
+    assert events == [("voice", OPEN), ("voice", HALF_OPEN), ("voice", CLOSED)]
+    assert breaker.states() == {"voice": CLOSED, "telephony": CLOSED}
+
+
+def test_failed_probe_reopens():
+    breaker = _breaker()
+    _fail(breaker, 4)
+    time.sleep(0.06)
+
+    _fail(breaker)
+
+    assert breaker.state("voice") == OPEN
+
+
+def test_below_failure_rate_stays_closed():
+    breaker = _breaker(failure_rate=0.75)
+    for error in (SERVER_ERROR, None, SERVER_ERROR, None, SERVER_ERROR, None):
+        breaker.on_result(PATH, 0.0, error, breaker.check(PATH))
+
+    assert breaker.state("voice") == CLOSED
+
+
+def test_slow_calls_open():
+    breaker = _breaker(slow_call_duration=1.0, slow_call_rate=0.5)
+    for elapsed in (2.0, 0.1, 2.0, 0.1):
+        breaker.on_result(PATH, elapsed, None, breaker.check(PATH))
+
+    assert breaker.state("voice") == OPEN
+
+
+def test_stale_generation_results_are_ignored():
+    breaker = _breaker()
+    # Admitted while closed, finishes after the circuit went half-open
+    slow_token = breaker.check(PATH)
+    _fail(breaker, 4)
+    time.sleep(0.06)
+    probe = breaker.check(PATH)
+    assert probe != slow_token
+
+    breaker.on_result(PATH, 0.0, SERVER_ERROR, slow_token)
+    assert breaker.state("voice") == HALF_OPEN
+    breaker.release(PATH, slow_token)
+    # The stale release did not free a probe slot
+    breaker.check(PATH)
+    with pytest.raises(CircuitOpenError):
+        breaker.check(PATH)
+
+
+def test_release_frees_probe_slot():
+    breaker = _breaker(half_open_calls=1)
+    _fail(breaker, 4)
+    time.sleep(0.06)
+
+    token = breaker.check(PATH)
+    breaker.release(PATH, token)
+
+    breaker.on_result(PATH, 0.0, None, breaker.check(PATH))
+    assert breaker.state("voice") == CLOSED
+
+
+def test_reset_closes_and_notifies():
+    events: List[Tuple[str, str]] = []
+    breaker = _breaker()
+    breaker.subscribe(lambda family, state: events.append((family, state)))
+    _fail(breaker, 4)
+
+    breaker.reset()
+
+    assert breaker.state("voice") == CLOSED
+    assert events[-1] == ("voice", CLOSED)
+    breaker.check(PATH)
+
+
+def test_client_fails_fast_once_open(make_client):
+    requests: List[httpx.Request] = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503, json={"error": "unavailable"})
+
+    breaker = CircuitBreaker(window=3, min_calls=3, open_duration=60)
+    client = make_client(handler, circuit_breaker=breaker)
+
+    # FAST_RETRY makes three attempts, which open the circuit
+    with pytest.raises(APIError):
+        client.telephony.get_call("call_1")
+    assert breaker.state("telephony") == OPEN
+    sent = len(requests)
+
+    with pytest.raises(CircuitOpenError):
+        client.telephony.get_call("call_1")
+    assert len(requests) == sent
+
+
+def test_client_probe_closes_circuit(make_client):
+    healthy = [False]
+
+    def handler(request):
+        if healthy[0]:
+            return httpx.Response(200, json=call_payload())
+        return httpx.Response(503, json={"error": "unavailable"})
+
+    breaker = _breaker(window=3, min_calls=3, half_open_calls=1)
+    client = make_client(handler, circuit_breaker=breaker)
+    with pytest.raises(APIError):
+        client.telephony.get_call("call_1")
+    assert breaker.state("telephony") == OPEN
+
+    healthy[0] = True
+    time.sleep(0.06)
+    client.telephony.get_call("call_1")
+
+    assert breaker.state("telephony") == CLOSED
@@ -0,0 +1,196 @@
+"""Singleflight coalescing of identical reads."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from vocalia import APIError
+from vocalia.coalesce import AsyncSingleflight, Singleflight, request_key
+from vocalia.transport import RequestSpec
+
+from .conftest import call_payload
+
+
+def test_request_key_only_covers_plain_gets():
+    get = RequestSpec("GET", "/v1/x", params={"b": 2, "a": 1})
+
+    assert request_key(get) == request_key(
+        RequestSpec("GET", "/v1/x", params={"a": "1", "b": "2"})
+    )
+    assert request_key(get) != request_key(RequestSpec("GET", "/v1/y"))
+    assert request_key(RequestSpec("POST", "/v1/x")) is None
+    assert request_key(RequestSpec("GET", "/v1/x", raw=True)) is None
+
+
+def test_concurrent_threads_share_one_call():
+    flight = Singleflight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(flight.do, "k", fetch) for _ in range(8)]
+        time.sleep(0.05)
+        release.set()
+        results = {id(f.result()) for f in futures}
+
+    assert len(calls) == 1
+    assert len(results) == 1
+    # Without a TTL the next call runs again
+    flight.do("k", fetch)
+    assert len(calls) == 2
+
+
+def test_errors_are_shared_but_not_cached():
+    flight = Singleflight(ttl=60)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise APIError("boom")
+
+    for _ in range(2):
+        with pytest.raises(APIError):
+            flight.do("k", fail)
+    assert len(calls) == 2
+
+
+def test_ttl_keeps_result_until_expiry():
+    flight = Singleflight(ttl=0.05)
+    counter = iter(range(10))
+
+    first = flight.do("k", lambda: next(counter))
+    assert flight.do("k", lambda: next(counter)) == first
+    time.sleep(0.06)
+    assert flight.do("k", lambda: next(counter)) == first + 1
+
+
+def test_max_entries_drops_oldest_results():
+    flight = Singleflight(ttl=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        flight.do(key, lambda: key)
+
+    assert len(flight._flights) <= 2
+    assert "c" in flight._flights
+
+
+def test_client_coalesces_concurrent_gets(make_client):
+    calls = []
+    release = threading.Event()
+
+    def handler(request):
+        calls.append(request)
+        release.wait(5)
+        return httpx.Response(200, json=call_payload())
+
+    client = make_client(handler, coalesce=True)
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(client.telephony.get_call, "call_1") for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_client_coalesce_ttl(make_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=call_payload())
+
+    client = make_client(handler, coalesce=True, coalesce_ttl=60)
+
+    client.telephony.get_call("call_1")
+    client.telephony.get_call("call_1")
+    client.telephony.get_call("call_2")
+
+    assert [r.url.path for r in calls] == [
+        "/v1/telephony/calls/call_1",
+        "/v1/telephony/calls/call_2",
+    ]
+
+
+def test_async_callers_share_one_task():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def main():
+        flight = AsyncSingleflight()
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+        await flight.do("k", fetch)
+        return results
+
+    results = asyncio.run(main())
+
+    assert len({id(r) for r in results}) == 1
+    assert len(calls) == 2
+
+
+def test_async_cancelled_caller_does_not_cancel_others():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        flight = AsyncSingleflight()
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_async_ttl():
+    counter = iter(range(10))
+
+    async def fetch():
+        return next(counter)
+
+    async def main():
+        flight = AsyncSingleflight(ttl=0.05)
+        first = await flight.do("k", fetch)
+        cached = await flight.do("k", fetch)
+        await asyncio.sleep(0.06)
+        return first, cached, await flight.do("k", fetch)
+
+    assert asyncio.run(main()) == (0, 0, 1)
+
+
+def test_async_client_coalesces(make_async_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=call_payload())
+
+    async def main():
+        client = make_async_client(handler, coalesce=True)
+        try:
+            return await asyncio.gather(
+                *(client.telephony.get_call("call_1") for _ in range(5))
+            )
+        finally:
+            await client.close()
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
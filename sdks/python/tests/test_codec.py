@@ -0,0 +1,102 @@
+"""JSON codecs and RawJSON splicing."""
+
+import json
+
+import httpx
+import pytest
+
+from vocalia import ConversationMessage
+from vocalia.codec import JSONCodec, RawJSON, encode_payload, get_codec
+
+CODECS = ["json"]
+try:
+    import orjson  # noqa: F401
+
+    CODECS.append("orjson")
+except ImportError:
+    pass
+try:
+    import msgspec  # noqa: F401
+
+    CODECS.append("msgspec")
+except ImportError:
+    pass
+
+
+@pytest.fixture(params=CODECS)
+def codec(request) -> JSONCodec:
+    return get_codec(request.param)
+
+
+def test_plain_payload_is_encoded_as_is(codec):
+    payload = {"text": "Ça va ?", "n": [1, 2]}
+
+    assert json.loads(encode_payload(codec, payload)) == payload
+
+
+def test_raw_values_are_spliced(codec):
+    raw = RawJSON(b'[{"role":"user","content":"hi"}]')
+
+    body = encode_payload(codec, {"text": "a", "context": raw, "stream": False})
+
+    assert raw in body
+    assert json.loads(body) == {
+        "text": "a",
+        "stream": False,
+        "context": [{"role": "user", "content": "hi"}],
+    }
+
+
+def test_payload_of_only_raw_values(codec):
+    body = encode_payload(codec, {"a": RawJSON(b"1"), "b": RawJSON(b'"x"')})
+
+    assert body == b'{"a":1,"b":"x"}'
+
+
+def test_raw_keys_are_escaped(codec):
+    body = encode_payload(codec, {'we"ird': RawJSON(b"null")})
+
+    assert json.loads(body) == {'we"ird': None}
+
+
+def test_nested_raw_is_not_spliced():
+    # Only top-level values are spliced; nested ones are plain bytes
+    with pytest.raises(TypeError):
+        encode_payload(JSONCodec(), {"outer": {"inner": RawJSON(b"1")}})
+
+
+def test_get_codec():
+    assert get_codec("json").name == "json"
+    # Preference order: orjson, msgspec, stdlib
+    assert get_codec("auto").name == (CODECS[1] if len(CODECS) > 1 else "json")
+    custom = JSONCodec()
+    assert get_codec(custom) is custom
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_loads_accepts_memoryview(codec):
+    assert codec.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+
+def test_generate_response_sends_context_as_raw_json(make_client):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(
+            200, json={"text": "Bonjour", "persona": "AGENCY", "language": "fr"}
+        )
+
+    client = make_client(handler)
+    context = [
+        ConversationMessage(role="user", content="Salut"),
+        ConversationMessage(role="assistant", content="Bonjour"),
+    ]
+
+    client.voice.generate_response("Ça va ?", context=context)
+
+    body = json.loads(seen[0].content)
+    assert body["text"] == "Ça va ?"
+    assert [m["content"] for m in body["context"]] == ["Salut", "Bonjour"]
+    assert seen[0].headers["content-type"] == "application/json"
@@ -0,0 +1,137 @@
+"""Resumable recording downloads over HTTP Range."""
+
+import asyncio
+import hashlib
+import io
+import os
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from vocalia import APIConnectionError
+from vocalia.exceptions import DownloadError
+
+DATA = bytes(range(256)) * 4000
+SHA256 = hashlib.sha256(DATA).hexdigest()
+CUT = 300_000
+
+
+class _Dropped(httpx.SyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def __iter__(self):
+        yield self.body[:CUT]
+        raise httpx.ReadError("connection reset")
+
+
+class _AsyncDropped(httpx.AsyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def __aiter__(self):
+        yield self.body[:CUT]
+        raise httpx.ReadError("connection reset")
+
+
+class RecordingServer:
+    """Serves DATA with Range support, dropping the first ``drops`` bodies."""
+
+    def __init__(self, drops: int = 0, asynchronous: bool = False) -> None:
+        self.drops = drops
+        self.asynchronous = asynchronous
+        self.ranges: List[Optional[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        header = request.headers.get("range")
+        self.ranges.append(header)
+        start = int(header[len("bytes=") : -1]) if header else 0
+        if start >= len(DATA):
+            return httpx.Response(416)
+        body = DATA[start:]
+        headers = {"content-length": str(len(body)), "x-checksum-sha256": SHA256}
+        status = 200
+        if header:
+            status = 206
+            headers["content-range"] = f"bytes {start}-{len(DATA) - 1}/{len(DATA)}"
+        if self.drops:
+            self.drops -= 1
+            stream = _AsyncDropped(body) if self.asynchronous else _Dropped(body)
+            return httpx.Response(status, headers=headers, stream=stream)
+        return httpx.Response(status, headers=headers, content=body)
+
+
+def test_dropped_connection_resumes_with_range(make_client):
+    server = RecordingServer(drops=1)
+    out = io.BytesIO()
+
+    size = make_client(server).telephony.download_recording("call_1", out)
+
+    assert size == len(DATA)
+    assert out.getvalue() == DATA
+    assert server.ranges[0] is None
+    assert server.ranges[1].startswith("bytes=")
+
+
+def test_part_file_resumed_across_runs(make_client, tmp_path):
+    target = tmp_path / "call.mp3"
+    (tmp_path / "call.mp3.part").write_bytes(DATA[:123_456])
+    server = RecordingServer()
+
+    make_client(server).telephony.download_recording("call_1", target)
+
+    assert server.ranges == ["bytes=123456-"]
+    assert target.read_bytes() == DATA
+    assert not (tmp_path / "call.mp3.part").exists()
+
+
+def test_complete_part_file_is_not_downloaded_again(make_client, tmp_path):
+    target = tmp_path / "call.mp3"
+    (tmp_path / "call.mp3.part").write_bytes(DATA)
+    server = RecordingServer()
+
+    size = make_client(server).telephony.download_recording("call_1", target)
+
+    assert size == len(DATA)
+    assert server.ranges == [f"bytes={len(DATA)}-"]
+    assert target.read_bytes() == DATA
+
+
+def test_failed_verification_discards_part_file(make_client, tmp_path):
+    target = tmp_path / "call.mp3"
+
+    with pytest.raises(DownloadError):
+        make_client(RecordingServer()).telephony.download_recording(
+            "call_1", target, expected_sha256="0" * 64
+        )
+
+    assert not target.exists()
+    assert not (tmp_path / "call.mp3.part").exists()
+
+
+def test_interrupted_download_keeps_part_file(make_client, tmp_path):
+    target = tmp_path / "call.mp3"
+    server = RecordingServer(drops=10)
+
+    with pytest.raises(APIConnectionError):
+        make_client(server).telephony.download_recording("call_1", target)
+
+    part = tmp_path / "call.mp3.part"
+    assert os.path.getsize(part) > 0
+    assert DATA.startswith(part.read_bytes())
+
+
+def test_async_download_resumes(make_async_client, tmp_path):
+    target = tmp_path / "call.mp3"
+    server = RecordingServer(drops=1, asynchronous=True)
+
+    async def main():
+        client = make_async_client(server)
+        size = await client.telephony.download_recording("call_1", target)
+        await client.close()
+        return size
+
+    assert asyncio.run(main()) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert len(server.ranges) == 2
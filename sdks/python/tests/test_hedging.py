@@ -0,0 +1,143 @@
+"""Hedged reads on AsyncVocalIA."""
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from vocalia import NotFoundError
+from vocalia.hedging import HedgingPolicy
+
+from .conftest import call_payload
+
+
+def _slow_first(delays: List[float], cancelled: List[int]):
+    """Handler whose n-th request takes ``delays[n]`` seconds."""
+    count = [0]
+
+    async def handler(request):
+        delay = delays[min(count[0], len(delays) - 1)]
+        count[0] += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return httpx.Response(200, json=call_payload(f"call_{count[0]}"))
+
+    return handler, count
+
+
+def _run(make_async_client, handler, policy, body):
+    async def main():
+        client = make_async_client(handler, hedging=policy)
+        try:
+            return await body(client)
+        finally:
+            await client.close()
+
+    return asyncio.run(main())
+
+
+def test_slow_read_is_hedged_and_loser_cancelled(make_async_client):
+    cancelled: List[int] = []
+    handler, count = _slow_first([1.0, 0.0], cancelled)
+    policy = HedgingPolicy(percentile=None, delay=0.02, budget=1.0, burst=1)
+
+    call = _run(
+        make_async_client, handler, policy, lambda c: c.telephony.get_call("call_1")
+    )
+
+    assert call.id == "call_2"
+    assert count[0] == 2
+    assert cancelled == [1]
+    assert policy.stats() == {"reads": 1, "hedged": 1, "hedge_won": 1, "over_budget": 0}
+
+
+def test_fast_read_is_not_hedged(make_async_client):
+    handler, count = _slow_first([0.0], [])
+    policy = HedgingPolicy(percentile=None, delay=0.5, budget=1.0, burst=1)
+
+    _run(make_async_client, handler, policy, lambda c: c.telephony.get_call("call_1"))
+
+    assert count[0] == 1
+    assert policy.stats()["hedged"] == 0
+
+
+def test_budget_limits_hedges(make_async_client):
+    handler, count = _slow_first([0.05], [])
+    # Each read earns half a hedge
+    policy = HedgingPolicy(percentile=None, delay=0.01, budget=0.5, burst=1)
+
+    async def body(client):
+        for _ in range(4):
+            await client.telephony.get_call("call_1")
+
+    _run(make_async_client, handler, policy, body)
+
+    stats = policy.stats()
+    assert stats["reads"] == 4
+    assert stats["hedged"] == 2 and stats["over_budget"] == 2
+    assert count[0] == 6
+
+
+def test_writes_and_other_operations_are_not_hedged(make_async_client):
+    requests: List[httpx.Request] = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        if request.method == "POST":
+            return httpx.Response(200, json=call_payload())
+        return httpx.Response(200, json={"calls": []})
+
+    policy = HedgingPolicy(percentile=None, delay=0.01, budget=1.0, burst=10)
+
+    async def body(client):
+        await client.telephony.initiate_call("+212600000000")
+        await client.telephony.list_calls()
+
+    _run(make_async_client, handler, policy, body)
+
+    assert len(requests) == 2
+    assert policy.stats()["reads"] == 0
+
+
+def test_failed_primary_is_not_hedged(make_async_client):
+    def handler(request):
+        return httpx.Response(404, json={"error": "no such call"})
+
+    policy = HedgingPolicy(percentile=None, delay=0.5, budget=1.0, burst=1)
+
+    with pytest.raises(NotFoundError):
+        _run(make_async_client, handler, policy, lambda c: c.telephony.get_call("x"))
+    assert policy.stats()["hedged"] == 0
+
+
+def test_delay_follows_percentile_once_sampled():
+    policy = HedgingPolicy(percentile=0.9, delay=1.0, min_samples=10, min_delay=0.001)
+
+    assert policy.hedge_delay("telephony.get_call") == 1.0
+    for i in range(10):
+        policy.observe("telephony.get_call", (i + 1) / 100)
+
+    assert policy.hedge_delay("telephony.get_call") == pytest.approx(0.10)
+    # Other operations keep the fixed delay
+    assert policy.hedge_delay("voice.list_personas") == 1.0
+
+
+def test_delay_floor_and_no_delay():
+    floored = HedgingPolicy(percentile=None, delay=0.0, min_delay=0.05)
+    unset = HedgingPolicy(percentile=None)
+
+    assert floored.hedge_delay("telephony.get_call") == 0.05
+    assert unset.hedge_delay("telephony.get_call") is None
+
+
+def test_budget_tokens_cap_at_burst():
+    policy = HedgingPolicy(percentile=None, delay=0.1, budget=1.0, burst=2)
+    for _ in range(10):
+        policy.hedge_delay("telephony.get_call")
+
+    assert [policy.acquire() for _ in range(3)] == [True, True, False]
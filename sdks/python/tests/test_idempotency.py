@@ -0,0 +1,111 @@
+"""Idempotency keys on mutating telephony calls."""
+
+import asyncio
+from typing import List
+
+import httpx
+
+from vocalia.idempotency import IDEMPOTENCY_HEADER, new_key
+
+from .conftest import call_payload
+
+
+def _recorder(keys: List[str], fail_first: bool = False):
+    def handler(request):
+        keys.append(request.headers.get(IDEMPOTENCY_HEADER))
+        if fail_first and len(keys) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json=call_payload())
+
+    return handler
+
+
+def test_new_keys_are_unique():
+    keys = {new_key() for _ in range(100)}
+
+    assert len(keys) == 100
+
+
+def test_mutating_calls_send_a_key(make_client):
+    keys: List[str] = []
+    telephony = make_client(_recorder(keys)).telephony
+
+    telephony.initiate_call("+212600000000")
+    telephony.end_call("call_1")
+    telephony.transfer_call("call_1", "+212600000001")
+
+    assert len(keys) == 3
+    assert all(keys)
+    assert len(set(keys)) == 3
+
+
+def test_reads_send_no_key(make_client):
+    keys: List[str] = []
+
+    make_client(_recorder(keys)).telephony.get_call("call_1")
+
+    assert keys == [None]
+
+
+def test_retry_reuses_the_key(make_client):
+    keys: List[str] = []
+
+    make_client(_recorder(keys, fail_first=True)).telephony.end_call("call_1")
+
+    assert len(keys) == 2
+    assert keys[0] == keys[1]
+
+
+def test_caller_key_wins(make_client):
+    keys: List[str] = []
+    telephony = make_client(_recorder(keys)).telephony
+
+    telephony.initiate_call("+212600000000", idempotency_key="job-1")
+    telephony.transfer_call("call_1", "+212600000001", idempotency_key="xfer-1")
+
+    assert keys == ["job-1", "xfer-1"]
+
+
+def test_repeated_caller_key_served_locally(make_client):
+    keys: List[str] = []
+    telephony = make_client(_recorder(keys)).telephony
+
+    first = telephony.end_call("call_1", idempotency_key="end-1")
+    again = telephony.end_call("call_1", idempotency_key="end-1")
+
+    assert again is first
+    assert keys == ["end-1"]
+
+
+def test_same_key_other_parameters_is_sent(make_client):
+    keys: List[str] = []
+    telephony = make_client(_recorder(keys)).telephony
+
+    telephony.initiate_call("+212600000000", idempotency_key="job-1")
+    telephony.initiate_call("+212600000001", idempotency_key="job-1")
+
+    assert keys == ["job-1", "job-1"]
+
+
+def test_local_table_can_be_disabled(make_client):
+    keys: List[str] = []
+    telephony = make_client(_recorder(keys), idempotency_ttl=0).telephony
+
+    telephony.end_call("call_1", idempotency_key="end-1")
+    telephony.end_call("call_1", idempotency_key="end-1")
+
+    assert keys == ["end-1", "end-1"]
+
+
+def test_async_retry_reuses_the_key(make_async_client):
+    keys: List[str] = []
+
+    async def main():
+        client = make_async_client(_recorder(keys, fail_first=True))
+        await client.telephony.initiate_call("+212600000000")
+        await client.close()
+
+    asyncio.run(main())
+
+    assert len(keys) == 2
+    assert keys[0] and keys[0] == keys[1]
@@ -0,0 +1,211 @@
+"""Load test schedules, runner and command line."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from vocalia.cli import main
+from vocalia.loadtest import (
+    LoadTest,
+    load_events,
+    poisson_schedule,
+    replay_schedule,
+)
+
+from .conftest import call_payload
+
+
+def test_poisson_schedule_is_seeded_and_bounded():
+    schedule = poisson_schedule(100, 10, seed=7)
+
+    assert schedule == poisson_schedule(100, 10, seed=7)
+    assert 850 < len(schedule) < 1150
+    times = [t for t, _, _ in schedule]
+    assert times == sorted(times)
+    assert 0 < times[0] and times[-1] < 10
+    assert {op for _, op, _ in schedule} == {"get_call"}
+
+
+def test_poisson_schedule_follows_mix():
+    schedule = poisson_schedule(200, 10, mix={"get_call": 3, "list_calls": 1}, seed=1)
+
+    share = sum(op == "list_calls" for _, op, _ in schedule) / len(schedule)
+    assert 0.2 < share < 0.3
+
+
+@pytest.mark.parametrize(
+    "rate, mix, match",
+    [
+        (0, None, "rate must be positive"),
+        (-5, None, "rate must be positive"),
+        (10, {"delete_everything": 1}, "Unknown operation"),
+        (10, {"get_call": 0}, "not all zero"),
+        (10, {"get_call": -1, "list_calls": 2}, ">= 0"),
+    ],
+)
+def test_poisson_schedule_rejects_bad_input(rate, mix, match):
+    with pytest.raises(ValueError, match=match):
+        poisson_schedule(rate, 10, mix)
+
+
+def _write_events(tmp_path):
+    bus = tmp_path / "bus" / "events.jsonl"
+    bus.parent.mkdir()
+    bus.write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {
+                        "type": "voice.generated",
+                        "metadata": {"timestamp": "2026-01-01T10:00:02Z"},
+                        "payload": {"text": "Salut"},
+                    }
+                ),
+                "not json",
+                json.dumps({"type": "no.timestamp"}),
+            ]
+        )
+    )
+    hooks = tmp_path / "webhooks.jsonl"
+    hooks.write_text(
+        json.dumps(
+            {
+                "eventType": "call.completed",
+                "timestamp": "2026-01-01T10:00:00+00:00",
+                "data": {"call_id": "call_9"},
+            }
+        )
+        + "\n"
+        + json.dumps(
+            {
+                "eventType": "lead.created",
+                "timestamp": "2026-01-01T10:00:04Z",
+                "data": {},
+            }
+        )
+    )
+    return [str(tmp_path / "bus"), str(hooks)]
+
+
+def test_load_events_reads_both_formats(tmp_path):
+    events = load_events(_write_events(tmp_path))
+
+    assert [(e[1], e[2]) for e in events] == [
+        ("call.completed", {"call_id": "call_9"}),
+        ("voice.generated", {"text": "Salut"}),
+        ("lead.created", {}),
+    ]
+    assert events[1][0] - events[0][0] == 2
+
+
+def test_replay_schedule_speed_routes_and_filters(tmp_path):
+    events = load_events(_write_events(tmp_path))
+
+    schedule = replay_schedule(events, speed=2)
+    assert [(t, op) for t, op, _ in schedule] == [
+        (0, "get_call"),
+        (1, "generate_response"),
+        (2, "get_call"),
+    ]
+    assert schedule[0][2] == {"call_id": "call_9"}
+
+    routed = replay_schedule(events, routes=[("lead.*", "list_calls")])
+    assert [op for _, op, _ in routed][-1] == "list_calls"
+
+    filtered = replay_schedule(events, include=["call.*", "lead.*"], exclude=["lead.*"])
+    assert [(t, op) for t, op, _ in filtered] == [(0, "get_call")]
+
+    with pytest.raises(ValueError, match="speed"):
+        replay_schedule(events, speed=0)
+    with pytest.raises(ValueError, match="Unknown operation"):
+        replay_schedule(events, routes=[("*", "nope")])
+
+
+def test_run_records_latency_and_errors(make_async_client):
+    def handler(request):
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"error": "not found"})
+        return httpx.Response(200, json=call_payload())
+
+    schedule = [
+        (0.0, "get_call", {}),
+        (0.01, "get_call", {"call_id": "missing"}),
+        (0.02, "get_call", {"call_id": "call_2"}),
+    ]
+
+    async def main():
+        client = make_async_client(handler)
+        try:
+            return await LoadTest(client, schedule).run()
+        finally:
+            await client.close()
+
+    summary = asyncio.run(main()).summary()
+
+    stats = summary["endpoints"]["get_call"]
+    assert summary["scheduled"] == 3
+    assert stats["requests"] == 3 and stats["ok"] == 2
+    assert stats["errors"] == {"NotFoundError 404": 1}
+    assert stats["response"]["max"] >= stats["service"]["max"] > 0
+    assert sum(count for _, count in stats["histogram"]) == 2
+
+
+def test_run_drops_arrivals_over_in_flight_limit(make_async_client):
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=call_payload())
+
+    schedule = [(0.0, "get_call", {})] * 3
+
+    async def main():
+        client = make_async_client(handler)
+        try:
+            return await LoadTest(client, schedule, max_in_flight=1).run()
+        finally:
+            await client.close()
+
+    stats = asyncio.run(main()).summary()["endpoints"]["get_call"]
+
+    assert stats["ok"] == 1 and stats["dropped"] == 2
+
+
+def test_cli_dry_run(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(
+            ["loadtest", "--base-url", "http://test", "--poisson", "10"]
+            + ["--duration", "5", "--seed", "3", "--dry-run"]
+        )
+
+    assert exit_info.value.code == 0
+    assert "arrivals over" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        (["--poisson", "10", "--mix", "get_call"], "--mix expects KEY=VALUE"),
+        (["--poisson", "10", "--mix", "nope=1"], "Unknown operation"),
+        (["--poisson", "-1"], "rate must be positive"),
+        (["--replay", "/nonexistent/events.jsonl"], "No such file"),
+    ],
+)
+def test_cli_errors_go_to_stderr(capsys, options, message):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["loadtest", "--base-url", "http://test", "--dry-run"] + options)
+
+    assert exit_info.value.code != 0
+    assert message in str(exit_info.value.code)
+    assert capsys.readouterr().out == ""
+
+
+def test_cli_empty_replay_fails(capsys, tmp_path):
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["loadtest", "--base-url", "http://test", "--replay", str(empty)])
+
+    assert exit_info.value.code == "vocalia loadtest: nothing to send"
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,143 @@
+"""Request timings, histograms and Prometheus rendering."""
+
+from typing import List
+
+import httpx
+import pytest
+
+from vocalia import NotFoundError
+from vocalia.metrics import HistogramSink, MetricsSink, PrometheusSink, RequestTiming
+
+from .conftest import call_payload
+
+
+def _timing(operation="telephony.get_call", total=0.3, status=200, **phases):
+    timing = RequestTiming(operation, "GET")
+    for phase, seconds in phases.items():
+        timing.add(phase, timing.start, timing.start + seconds)
+    timing.status = status
+    timing.end = timing.start + total
+    return timing
+
+
+class Collector(MetricsSink):
+    def __init__(self) -> None:
+        self.timings: List[RequestTiming] = []
+
+    def record(self, timing: RequestTiming) -> None:
+        self.timings.append(timing)
+
+
+def test_phases_sum_repeated_intervals():
+    timing = _timing(total=1.0, backoff=0.25)
+    timing.add("backoff", timing.start, timing.start + 0.25)
+
+    assert timing.phases == {"backoff": 0.5, "total": 1.0}
+    assert timing.outcome == "200"
+
+
+def test_outcome_falls_back_to_error_name():
+    timing = _timing(status=None).finish(ConnectionError("refused"))
+
+    assert timing.outcome == "ConnectionError"
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    sink = HistogramSink(buckets=(0.1, 0.2, 0.4))
+    for total in (0.05, 0.15, 0.15, 0.3):
+        sink.record(_timing(total=total))
+
+    # Ranks: 1 in (0, 0.1], 2 in (0.1, 0.2], 1 in (0.2, 0.4]
+    assert sink.quantile("telephony.get_call", "total", 0.25) == pytest.approx(0.1)
+    assert sink.quantile("telephony.get_call", "total", 0.5) == pytest.approx(0.15)
+    assert sink.quantile("telephony.get_call", "total", 1.0) == pytest.approx(0.4)
+    assert sink.quantile("telephony.get_call", "ttfb", 0.5) is None
+
+
+def test_histogram_overflow_bucket_reports_last_bound():
+    sink = HistogramSink(buckets=(0.1,))
+    sink.record(_timing(total=5.0))
+
+    assert sink.quantile("telephony.get_call", "total", 0.99) == 0.1
+
+
+def test_summary_outcomes_and_reset():
+    sink = HistogramSink()
+    sink.record(_timing(total=0.2, ttfb=0.1))
+    sink.record(_timing(total=0.4, status=404))
+
+    summary = sink.summary()["telephony.get_call"]
+    assert summary["total"]["count"] == 2
+    assert summary["total"]["mean"] == pytest.approx(0.3)
+    assert summary["ttfb"]["count"] == 1
+    assert sink.outcomes() == {
+        ("telephony.get_call", "200"): 1,
+        ("telephony.get_call", "404"): 1,
+    }
+
+    sink.record_circuit("voice", "open")
+    sink.reset()
+    assert sink.summary() == {} and sink.outcomes() == {} and sink.circuits() == {}
+
+
+def test_prometheus_render():
+    sink = PrometheusSink(buckets=(0.1, 0.5), namespace="test")
+    sink.record(_timing(total=0.05))
+    sink.record(_timing(total=0.3))
+    sink.record(_timing(operation='odd"op', total=2.0, status=None))
+
+    lines = sink.render().splitlines()
+
+    assert lines[:2] == [
+        "# HELP test_request_phase_seconds "
+        "Time spent in each phase of a VocalIA SDK request.",
+        "# TYPE test_request_phase_seconds histogram",
+    ]
+    labels = 'operation="telephony.get_call",phase="total"'
+    assert f'test_request_phase_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f'test_request_phase_seconds_bucket{{{labels},le="0.5"}} 2' in lines
+    assert f'test_request_phase_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"test_request_phase_seconds_count{{{labels}}} 2" in lines
+    prefix = f"test_request_phase_seconds_sum{{{labels}}} "
+    (total,) = [x[len(prefix) :] for x in lines if x.startswith(prefix)]
+    assert float(total) == pytest.approx(0.35)
+    assert "# TYPE test_requests_total counter" in lines
+    ok = 'test_requests_total{operation="telephony.get_call",outcome="200"} 2'
+    assert ok in lines
+    assert 'test_requests_total{operation="odd\\"op",outcome="unknown"} 1' in lines
+    assert not any("circuit" in line for line in lines)
+
+
+def test_prometheus_render_circuits():
+    sink = PrometheusSink()
+    sink.record_circuit("voice", "open")
+    sink.record_circuit("voice", "half_open")
+
+    lines = sink.render().splitlines()
+
+    assert 'vocalia_circuit_state{family="voice",state="half_open"} 1' in lines
+    assert 'vocalia_circuit_state{family="voice",state="open"} 0' in lines
+    assert 'vocalia_circuit_transitions_total{family="voice",state="open"} 1' in lines
+
+
+def test_client_records_each_request(make_client):
+    responses = [500, 200]
+    sink = Collector()
+
+    def handler(request):
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"error": "not found"})
+        status = responses.pop(0)
+        return httpx.Response(status, json=call_payload() if status == 200 else {})
+
+    client = make_client(handler, metrics=sink)
+    client.telephony.get_call("call_1")
+    with pytest.raises(NotFoundError):
+        client.telephony.get_call("missing")
+
+    ok, missing = sink.timings
+    assert ok.operation == "telephony.get_call"
+    assert ok.attempts == 2 and ok.outcome == "200"
+    assert "backoff" in ok.phases
+    assert ok.phases["total"] >= max(v for k, v in ok.phases.items() if k != "total")
+    assert missing.outcome == "404" and missing.error == "NotFoundError"
@@ -0,0 +1,90 @@
+"""Paged iteration: resumable cursors and prefetch cleanup."""
+
+import asyncio
+from typing import Dict, List
+
+import httpx
+
+from vocalia.pagination import decode_cursor
+
+from .conftest import call_payload
+
+TOTAL = 35
+
+
+def _page(request: httpx.Request, cursors: bool) -> httpx.Response:
+    params = request.url.params
+    limit = int(params["limit"])
+    if "cursor" in params:
+        start = int(params["cursor"].lstrip("p"))
+    else:
+        start = int(params.get("offset", 0))
+    end = min(start + limit, TOTAL)
+    body: Dict[str, object] = {
+        "calls": [call_payload(f"call_{i}") for i in range(start, end)]
+    }
+    if cursors:
+        body["next_cursor"] = f"p{end}" if end < TOTAL else None
+        body["has_more"] = end < TOTAL
+    return httpx.Response(200, json=body)
+
+
+def test_offset_iteration_reads_every_call(make_client):
+    client = make_client(lambda request: _page(request, cursors=False))
+
+    ids = [call.id for call in client.telephony.iter_calls(page_size=10)]
+
+    assert ids == [f"call_{i}" for i in range(TOTAL)]
+
+
+def test_resume_from_cursor_mid_page(make_client):
+    client = make_client(lambda request: _page(request, cursors=False))
+    calls = client.telephony.iter_calls(page_size=10)
+    first = [next(calls).id for _ in range(13)]
+
+    resumed = client.telephony.iter_calls(page_size=10, cursor=calls.cursor)
+    rest = [call.id for call in resumed]
+
+    assert first + rest == [f"call_{i}" for i in range(TOTAL)]
+
+
+def test_server_cursor_replaces_offset(make_client):
+    sent: List[Dict[str, str]] = []
+
+    def handler(request):
+        sent.append(dict(request.url.params))
+        return _page(request, cursors=True)
+
+    client = make_client(handler)
+    calls = client.telephony.iter_calls(page_size=10)
+    first = [next(calls).id for _ in range(15)]
+    cursor = calls.cursor
+    rest = [c.id for c in client.telephony.iter_calls(page_size=10, cursor=cursor)]
+
+    assert first + rest == [f"call_{i}" for i in range(TOTAL)]
+    assert decode_cursor(cursor)[1] == "p10"
+    for params in sent:
+        assert not ("cursor" in params and "offset" in params)
+
+
+def test_async_early_exit_cancels_prefetch(make_async_client):
+    async def main():
+        release = asyncio.Event()
+
+        async def handler(request):
+            if request.url.params.get("offset", "0") != "0":
+                await release.wait()
+            return _page(request, cursors=False)
+
+        client = make_async_client(handler)
+        calls = client.telephony.iter_calls(page_size=10)
+        async for _ in calls:
+            break
+        prefetch = calls._pending
+        await calls.aclose()
+
+        assert prefetch is not None and prefetch.cancelled()
+        assert [call async for call in calls] == []
+        await client.close()
+
+    asyncio.run(main())
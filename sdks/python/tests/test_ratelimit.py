@@ -0,0 +1,111 @@
+"""Adaptive (AIMD) client-side rate limiting."""
+
+import httpx
+import pytest
+
+from vocalia import RateLimitError
+from vocalia.ratelimit import AdaptiveRateLimiter, TokenBucket, endpoint_family
+
+from .conftest import call_payload
+
+
+def test_endpoint_family():
+    assert endpoint_family("/v1/voice/generate") == "voice"
+    assert endpoint_family("/v1/telephony/calls/abc?x=1") == "telephony"
+    assert endpoint_family("/health") == "health"
+    assert endpoint_family("/") == "default"
+
+
+def test_bucket_reserves_in_order():
+    bucket = TokenBucket(rate=10, burst=2)
+    now = bucket.updated
+
+    assert bucket.reserve(now) == 0
+    assert bucket.reserve(now) == 0
+    assert bucket.reserve(now) == pytest.approx(0.1)
+    assert bucket.reserve(now) == pytest.approx(0.2)
+    # Refilled after a second, capped at the burst
+    assert bucket.reserve(now + 10) == 0
+
+
+def test_rate_limited_halves_rate_once_per_cooldown():
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=1, decrease_cooldown=60)
+
+    limiter.on_rate_limited("/v1/voice/generate")
+    limiter.on_rate_limited("/v1/voice/generate")
+
+    assert limiter.rates() == {"voice": 4}
+
+
+def test_rate_is_floored_at_min_rate():
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=3, decrease_cooldown=0)
+
+    for _ in range(5):
+        limiter.on_rate_limited("/v1/voice/generate")
+
+    assert limiter.rates()["voice"] == 3
+
+
+def test_successes_recover_rate_up_to_ceiling():
+    limiter = AdaptiveRateLimiter(
+        rate=8, increase_step=1, increase_after=3, decrease_cooldown=0
+    )
+    limiter.on_rate_limited("/v1/voice/generate")
+
+    for _ in range(3):
+        limiter.on_success("/v1/voice/generate")
+    assert limiter.rates()["voice"] == 5
+
+    for _ in range(30):
+        limiter.on_success("/v1/voice/generate")
+    assert limiter.rates()["voice"] == 8
+
+
+def test_families_are_independent():
+    limiter = AdaptiveRateLimiter(rate=8, family_rates={"telephony": 2})
+    limiter.reserve("/v1/voice/generate")
+    limiter.on_rate_limited("/v1/telephony/calls")
+
+    assert limiter.rates() == {"voice": 8, "telephony": 1}
+
+
+def test_retry_after_pauses_bucket():
+    limiter = AdaptiveRateLimiter(rate=10)
+
+    limiter.on_rate_limited("/v1/voice/generate", retry_after=2)
+
+    assert limiter.reserve("/v1/voice/generate") > 1.5
+
+
+def test_429_through_client_backs_off_then_recovers(make_client):
+    responses = [429, 200, 200]
+    limiter = AdaptiveRateLimiter(
+        rate=1000, increase_step=500, increase_after=2, decrease_cooldown=0
+    )
+
+    def handler(request):
+        if responses.pop(0) == 429:
+            return httpx.Response(429, json={"error": "slow down"})
+        return httpx.Response(200, json=call_payload())
+
+    client = make_client(handler, rate_limiter=limiter)
+
+    # The first attempt is rate limited, the retry succeeds
+    client.telephony.get_call("call_1")
+    assert limiter.rates()["telephony"] == 500
+
+    client.telephony.get_call("call_1")
+    assert limiter.rates()["telephony"] == 1000
+
+
+def test_429_exhausting_retries_raises_and_lowers_rate(make_client):
+    limiter = AdaptiveRateLimiter(rate=1000, decrease_cooldown=0)
+
+    def handler(request):
+        return httpx.Response(429, json={"error": "slow down"})
+
+    client = make_client(handler, rate_limiter=limiter)
+
+    with pytest.raises(RateLimitError):
+        client.telephony.get_call("call_1")
+    assert limiter.rates()["telephony"] < 1000
@@ -0,0 +1,85 @@
+"""Retries, Retry-After handling and error mapping."""
+
+from typing import List
+
+import httpx
+import pytest
+
+from vocalia import APIError, ValidationError
+from vocalia.exceptions import RateLimitError, handle_api_error
+
+from .conftest import call_payload
+
+
+def test_get_retried_until_success(make_client):
+    statuses = [503, 503, 200]
+    seen: List[str] = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        status = statuses[len(seen) - 1]
+        return httpx.Response(status, json=call_payload() if status == 200 else {})
+
+    call = make_client(handler).telephony.get_call("call_1")
+
+    assert call.id == "call_1"
+    assert len(seen) == 3
+
+
+def test_get_gives_up_after_max_retries(make_client):
+    seen: List[httpx.Request] = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    with pytest.raises(APIError) as info:
+        make_client(handler).telephony.get_call("call_1")
+
+    assert info.value.status_code == 503
+    assert len(seen) == 3
+
+
+def test_client_error_not_retried(make_client):
+    seen: List[httpx.Request] = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(400, json={"message": "bad", "errors": ["to"]})
+
+    with pytest.raises(ValidationError):
+        make_client(handler).telephony.get_call("call_1")
+
+    assert len(seen) == 1
+
+
+def test_retry_after_header_is_honoured(make_client):
+    seen: List[httpx.Request] = []
+
+    def handler(request):
+        seen.append(request)
+        if len(seen) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={})
+        return httpx.Response(200, json=call_payload())
+
+    assert make_client(handler).telephony.get_call("call_1").id == "call_1"
+    assert len(seen) == 2
+
+
+def test_malformed_retry_after_in_body_is_ignored():
+    error = handle_api_error(429, {"message": "slow down", "retry_after": "soon"})
+
+    assert isinstance(error, RateLimitError)
+    assert error.retry_after is None
+
+
+def test_numeric_retry_after_in_body():
+    error = handle_api_error(503, {"message": "busy", "retry_after": "2"})
+
+    assert error.retry_after == 2.0
+
+
+def test_nested_error_message():
+    error = handle_api_error(500, {"error": {"message": "boom", "code": "E1"}})
+
+    assert error.message == "boom"
@@ -0,0 +1,121 @@
+"""Streamed voice responses: SSE and NDJSON decoding."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from vocalia import APIError
+from vocalia.streaming import EventDecoder
+
+SSE = "text/event-stream"
+NDJSON = "application/x-ndjson"
+
+
+def _stream(content_type, *chunks):
+    """Handler answering with ``chunks`` as separate body reads."""
+
+    def handler(request):
+        return httpx.Response(
+            200, headers={"content-type": content_type}, content=iter(chunks)
+        )
+
+    return handler
+
+
+def test_sse_events_split_across_reads(make_client):
+    handler = _stream(
+        SSE,
+        b'event: text\ndata: {"delta": "Bon',
+        b'jour"}\n\n: keep-alive\n\ndata: {"delta": " et"}\n',
+        b'\ndata: {"type": "done", "confidence": 0.9}\n\ndata: [DONE]\n\n',
+    )
+    client = make_client(handler)
+
+    with client.voice.stream_response("Salut") as stream:
+        chunks = list(stream)
+
+    assert [(c.type, c.text) for c in chunks] == [("text", "Bonjour"), ("text", " et")]
+    assert stream.response.text == "Bonjour et"
+    assert stream.response.confidence == 0.9
+    assert stream.response.persona == "AGENCY"
+
+
+def test_sse_multiline_data_is_joined():
+    decoder = EventDecoder(SSE)
+
+    assert decoder.feed("event: text") is None
+    assert decoder.feed('data: {"delta":') is None
+    assert decoder.feed('data: "hi"}') is None
+    assert decoder.feed("") == {"type": "text", "delta": "hi"}
+
+
+def test_ndjson_lines_split_across_reads(make_client):
+    handler = _stream(
+        NDJSON,
+        b'{"delta": "Sa',
+        b'lut"}\n\n{"audio_base64": "AAEC", "format": "mp3"}\n{"type": "do',
+        b'ne"}',
+    )
+    client = make_client(handler)
+
+    with client.voice.stream_response("Salut") as stream:
+        chunks = list(stream)
+
+    assert [c.type for c in chunks] == ["text", "audio"]
+    assert chunks[1].audio == b"\x00\x01\x02"
+    assert chunks[1].audio_format == "mp3"
+    assert stream.response.text == "Salut"
+
+
+def test_format_is_sniffed_without_content_type():
+    sse = EventDecoder()
+    assert sse.feed('data: {"delta": "a"}') is None
+    assert sse.feed("") == {"delta": "a"}
+
+    ndjson = EventDecoder()
+    assert ndjson.feed('{"delta": "a"}') == {"delta": "a"}
+
+
+@pytest.mark.parametrize("content_type", [SSE, NDJSON])
+def test_non_object_payloads_are_skipped(content_type):
+    decoder = EventDecoder(content_type)
+    lines = ['"ping"', "[]", "1", json.dumps({"delta": "a"})]
+    if content_type == SSE:
+        lines = [part for line in lines for part in ("data: " + line, "")]
+
+    events = [e for e in map(decoder.feed, lines) if e is not None]
+
+    assert events == [{"delta": "a"}]
+
+
+def test_error_event_raises(make_client):
+    handler = _stream(NDJSON, b'{"type": "error", "message": "overloaded"}\n')
+    client = make_client(handler)
+
+    with pytest.raises(APIError, match="overloaded"):
+        list(client.voice.stream_response("Salut"))
+
+
+def test_async_stream(make_async_client):
+    async def body():
+        yield b'data: {"delta": "Bon"}\n\ndata: {"de'
+        yield b'lta": "jour"}\n\n'
+
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": SSE}, content=body())
+
+    async def main():
+        client = make_async_client(handler)
+        try:
+            async with client.voice.stream_response("Salut") as stream:
+                text = [t async for t in stream.iter_text()]
+            return text, stream.response
+        finally:
+            await client.close()
+
+    text, response = asyncio.run(main())
+
+    assert text == ["Bon", "jour"]
+    assert response.text == "Bonjour"
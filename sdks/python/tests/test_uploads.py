@@ -0,0 +1,154 @@
+"""Streamed multipart audio uploads."""
+
+import asyncio
+import io
+import re
+
+import httpx
+import pytest
+
+from vocalia.uploads import MultipartAudio
+
+AUDIO = bytes(range(256)) * 40
+
+
+def _capture(seen):
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"text": "bonjour"})
+
+    return handler
+
+
+def _parts(request):
+    """(boundary, field headers, payload) of a single-file form body."""
+    match = re.match(
+        r"multipart/form-data; boundary=(\S+)$", request.headers["content-type"]
+    )
+    assert match
+    boundary = match.group(1).encode()
+    body = request.content
+    assert body.startswith(b"--" + boundary + b"\r\n")
+    assert body.endswith(b"\r\n--" + boundary + b"--\r\n")
+    inner = body[len(boundary) + 4 : -(len(boundary) + 8)]
+    head, _, payload = inner.partition(b"\r\n\r\n")
+    return boundary, head.decode(), payload
+
+
+@pytest.mark.parametrize(
+    "source",
+    [AUDIO, bytearray(AUDIO), memoryview(AUDIO)],
+    ids=["bytes", "bytearray", "memoryview"],
+)
+def test_sized_sources_send_content_length(make_client, source):
+    seen = []
+    client = make_client(_capture(seen))
+
+    assert client.voice.transcribe(source, format="wav") == "bonjour"
+
+    request = seen[0]
+    _, head, payload = _parts(request)
+    assert payload == AUDIO
+    assert 'name="audio"; filename="audio.wav"' in head
+    assert "Content-Type: audio/wav" in head
+    assert request.headers["content-length"] == str(len(request.content))
+    assert "transfer-encoding" not in request.headers
+    assert request.url.params["language"] == "fr"
+
+
+def test_path_source(make_client, tmp_path):
+    path = tmp_path / "call.wav"
+    path.write_bytes(AUDIO)
+    seen = []
+    client = make_client(_capture(seen))
+
+    client.voice.transcribe(str(path), format="wav")
+
+    assert _parts(seen[0])[2] == AUDIO
+    assert seen[0].headers["content-length"] == str(len(seen[0].content))
+
+
+def test_file_source_sends_remaining_length(make_client, tmp_path):
+    path = tmp_path / "call.wav"
+    path.write_bytes(b"skipped" + AUDIO)
+    seen = []
+    client = make_client(_capture(seen))
+
+    with open(path, "rb") as f:
+        f.read(7)
+        client.voice.transcribe(f)
+
+    assert _parts(seen[0])[2] == AUDIO
+    assert seen[0].headers["content-length"] == str(len(seen[0].content))
+
+
+def test_file_without_descriptor_is_chunk_encoded(make_client):
+    seen = []
+    client = make_client(_capture(seen))
+
+    client.voice.transcribe(io.BytesIO(AUDIO))
+
+    assert _parts(seen[0])[2] == AUDIO
+    assert seen[0].headers["transfer-encoding"] == "chunked"
+
+
+def test_iterator_source_is_chunk_encoded(make_client):
+    seen = []
+    client = make_client(_capture(seen))
+
+    client.voice.transcribe(iter([AUDIO[:100], b"", AUDIO[100:]]))
+
+    assert _parts(seen[0])[2] == AUDIO
+    assert "content-length" not in seen[0].headers
+    assert seen[0].headers["transfer-encoding"] == "chunked"
+
+
+def test_buffer_is_sliced_in_chunks():
+    body = MultipartAudio(AUDIO, "a.wav", "audio/wav", chunk_size=1000)
+    chunks = list(body.iter_chunks())
+
+    assert len(chunks) == 2 + -(-len(AUDIO) // 1000)
+    assert all(isinstance(c, memoryview) for c in chunks[1:-1])
+    assert body.size() == sum(len(c) for c in chunks)
+
+
+def test_boundaries_are_unique():
+    first = MultipartAudio(b"", "a.wav", "audio/wav")
+    second = MultipartAudio(b"", "a.wav", "audio/wav")
+
+    assert first.boundary != second.boundary
+
+
+def test_async_iterator_needs_async_client(make_client):
+    async def source():
+        yield AUDIO
+
+    client = make_client(_capture([]))
+
+    with pytest.raises(TypeError):
+        client.voice.transcribe(source())
+
+
+def test_async_sources(make_async_client, tmp_path):
+    path = tmp_path / "call.wav"
+    path.write_bytes(AUDIO)
+
+    async def chunks():
+        yield AUDIO[:10]
+        yield AUDIO[10:]
+
+    seen = []
+
+    async def main():
+        client = make_async_client(_capture(seen))
+        try:
+            await client.voice.transcribe(path)
+            await client.voice.transcribe(chunks())
+        finally:
+            await client.close()
+
+    asyncio.run(main())
+
+    assert [_parts(r)[2] for r in seen] == [AUDIO, AUDIO]
+    assert seen[0].headers["content-length"] == str(len(seen[0].content))
+    assert seen[1].headers["transfer-encoding"] == "chunked"
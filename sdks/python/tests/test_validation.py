@@ -0,0 +1,100 @@
+"""Strict, trusted and lazy construction of list responses."""
+
+from datetime import datetime
+
+import httpx
+import pydantic
+import pytest
+
+from vocalia import CallSession, CallStatus
+from vocalia.validation import LazyModel, build_models, check_mode
+
+from .conftest import call_payload
+
+MODES = ["strict", "trusted", "lazy"]
+
+
+def _call(**fields):
+    return {**call_payload(), "from": "+212500000000", **fields}
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_modes_agree_on_valid_items(mode):
+    items = [_call(duration_seconds="42", started_at="2026-01-01T10:00:00Z")]
+
+    (call,) = build_models(CallSession, items, mode)
+
+    assert call.status == CallStatus.QUEUED
+    assert call.duration_seconds == 42
+    assert call.started_at == datetime.fromisoformat("2026-01-01T10:00:00+00:00")
+    assert call.from_number == "+212500000000"
+    assert call.direction == "outbound"
+    assert call.cost is None
+
+
+@pytest.mark.parametrize("mode", ["strict", "trusted"])
+def test_eager_modes_reject_invalid_items(mode):
+    items = [_call(), _call(status="exploded")]
+
+    with pytest.raises(pydantic.ValidationError):
+        build_models(CallSession, items, mode)
+
+
+def test_trusted_returns_models():
+    calls = build_models(CallSession, [_call(), _call(id="call_2")], "trusted")
+
+    assert [type(c) for c in calls] == [CallSession, CallSession]
+    assert [c.id for c in calls] == ["call_1", "call_2"]
+
+
+def test_lazy_validates_only_fields_read():
+    (call,) = build_models(CallSession, [_call(status="exploded")], "lazy")
+
+    assert isinstance(call, LazyModel)
+    assert call.id == "call_1"
+    with pytest.raises(pydantic.ValidationError):
+        call.status
+    with pytest.raises(pydantic.ValidationError):
+        call.resolve()
+
+
+def test_lazy_missing_required_field_raises_on_read():
+    data = _call()
+    del data["to"]
+    (call,) = build_models(CallSession, [data], "lazy")
+
+    assert call.id == "call_1"
+    with pytest.raises(pydantic.ValidationError):
+        call.to
+
+
+def test_lazy_is_read_only_and_resolves():
+    (call,) = build_models(CallSession, [_call()], "lazy")
+
+    with pytest.raises(AttributeError):
+        call.id = "other"
+    with pytest.raises(AttributeError):
+        call.not_a_field
+    assert call.resolve() == CallSession(**_call())
+    assert call.model_dump()["id"] == "call_1"
+
+
+def test_check_mode():
+    assert check_mode("lazy") == "lazy"
+    with pytest.raises(ValueError, match="strict, trusted, lazy"):
+        check_mode("fast")
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_client_list_calls(make_client, mode):
+    def handler(request):
+        calls = [_call(id=f"call_{i}") for i in range(3)]
+        return httpx.Response(200, json={"calls": calls})
+
+    client = make_client(handler, validation=mode)
+
+    calls = client.telephony.list_calls()
+
+    assert [c.id for c in calls] == ["call_0", "call_1", "call_2"]
+    assert all(c.status == CallStatus.QUEUED for c in calls)
+    assert all(isinstance(c, LazyModel) == (mode == "lazy") for c in calls)
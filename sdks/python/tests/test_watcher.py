@@ -0,0 +1,113 @@
+"""CallWatcher polling, error handling and list sweeps."""
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from vocalia import CallStatus, NotFoundError
+
+from .conftest import call_payload
+
+FAST = {None: 0.01, CallStatus.QUEUED: 0.01, CallStatus.IN_PROGRESS: 0.01}
+
+
+def _run(make_async_client, handler, body):
+    async def main():
+        client = make_async_client(handler)
+        try:
+            async with client.telephony.watcher(intervals=FAST) as watcher:
+                return await asyncio.wait_for(body(watcher), 5)
+        finally:
+            await client.close()
+
+    return asyncio.run(main())
+
+
+def test_wait_returns_terminal_call(make_async_client):
+    statuses = ["queued", "in_progress", "completed"]
+    polls: List[str] = []
+
+    def handler(request):
+        polls.append(request.url.path)
+        status = statuses[min(len(polls), len(statuses)) - 1]
+        return httpx.Response(200, json=call_payload("call_1", status))
+
+    call = _run(make_async_client, handler, lambda w: w.wait("call_1"))
+
+    assert call.status == CallStatus.COMPLETED
+    assert len(polls) == 3
+
+
+def test_unexpected_payloads_do_not_stop_polling(make_async_client):
+    polls: List[int] = []
+
+    def handler(request):
+        polls.append(1)
+        if len(polls) == 1:
+            return httpx.Response(200, json=call_payload("call_1", "weird"))
+        if len(polls) == 2:
+            return httpx.Response(200, content=b"<html>bad gateway</html>")
+        return httpx.Response(200, json=call_payload("call_1", "completed"))
+
+    call = _run(make_async_client, handler, lambda w: w.wait("call_1"))
+
+    assert call.status == CallStatus.COMPLETED
+    assert len(polls) == 3
+
+
+def test_missing_call_fails_waiter(make_async_client):
+    def handler(request):
+        return httpx.Response(404, json={"message": "no such call"})
+
+    with pytest.raises(NotFoundError):
+        _run(make_async_client, handler, lambda w: w.wait("call_404"))
+
+
+def test_waiters_receive_error_when_loop_dies(make_async_client):
+    def handler(request):
+        return httpx.Response(200, json=call_payload())
+
+    async def body(watcher):
+        async def broken_refresh(call_ids):
+            raise RuntimeError("refresh failed")
+
+        def broken_retry(call_ids):
+            raise RuntimeError("loop died")
+
+        watcher._refresh = broken_refresh
+        watcher._retry_later = broken_retry
+        return await watcher.wait("call_1")
+
+    with pytest.raises(RuntimeError, match="loop died"):
+        _run(make_async_client, handler, body)
+
+
+def test_sweep_cancels_page_prefetch(make_async_client):
+    ids = [f"call_{i}" for i in range(3)]
+
+    async def handler(request):
+        if request.url.path == "/v1/telephony/calls":
+            if request.url.params.get("offset", "0") != "0":
+                await asyncio.sleep(60)  # a prefetch nobody needs
+            calls = [call_payload(i, "completed") for i in ids]
+            calls += [call_payload(f"other_{n}") for n in range(97)]
+            return httpx.Response(200, json={"calls": calls})
+        return httpx.Response(200, json=call_payload("call_x", "queued"))
+
+    async def main():
+        client = make_async_client(handler)
+        watcher = client.telephony.watcher(intervals=FAST, batch_threshold=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(watcher.wait(i) for i in ids)), 5
+        )
+        await watcher.aclose()
+        leftover = asyncio.all_tasks() - {asyncio.current_task()}
+        await client.close()
+        return results, leftover
+
+    results, leftover = asyncio.run(main())
+
+    assert [call.status for call in results] == [CallStatus.COMPLETED] * 3
+    assert not leftover
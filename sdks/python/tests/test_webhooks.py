@@ -0,0 +1,203 @@
+"""Webhook signatures, freshness, dedupe and the ASGI app."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from vocalia import WebhookVerificationError
+from vocalia.webhooks import (
+    DedupeWindow,
+    WebhookApp,
+    WebhookVerifier,
+    compute_signature,
+    verify_signature,
+)
+
+SECRET = "whsec_test"
+
+
+def _body(event_id: Optional[str] = "evt_1", age: float = 0.0) -> bytes:
+    timestamp = datetime.now(timezone.utc) - timedelta(seconds=age)
+    event: Dict[str, Any] = {
+        "event": "call.completed",
+        "data": {"call_id": "call_1"},
+        "timestamp": timestamp.isoformat(),
+    }
+    if event_id is not None:
+        event["id"] = event_id
+    return json.dumps(event).encode()
+
+
+def _post(app: WebhookApp, body: bytes, signature: Optional[str] = None):
+    """Send one POST through ``app``; returns (status, headers, body)."""
+    if signature is None:
+        signature = compute_signature(SECRET, body)
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"x-vocalia-signature", signature.encode())],
+    }
+    sent: List[Dict[str, Any]] = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, response = sent
+    return start["status"], dict(start["headers"]), response["body"]
+
+
+def test_signature_match_and_mismatch():
+    body = _body()
+    signature = compute_signature(SECRET, body)
+
+    verify_signature(body, signature, SECRET)
+    verify_signature(body, f"sha256={signature.upper()}", SECRET)
+    with pytest.raises(WebhookVerificationError):
+        verify_signature(body + b" ", signature, SECRET)
+    with pytest.raises(WebhookVerificationError):
+        verify_signature(body, compute_signature("other", body), SECRET)
+    with pytest.raises(WebhookVerificationError, match="Missing"):
+        verify_signature(body, None, SECRET)
+
+
+def test_rotated_secrets_accept_either():
+    body = _body()
+    secrets = ["whsec_new", SECRET]
+
+    verify_signature(body, compute_signature(SECRET, body), secrets)
+    verify_signature(body, compute_signature(b"whsec_new", body), secrets)
+    with pytest.raises(WebhookVerificationError):
+        verify_signature(body, compute_signature("whsec_old", body), secrets)
+
+
+def test_timestamp_tolerance():
+    verifier = WebhookVerifier(SECRET, tolerance=60)
+
+    def headers(body):
+        return {"X-VocalIA-Signature": compute_signature(SECRET, body)}
+
+    fresh = _body(age=30)
+    assert verifier.verify(fresh, headers(fresh)).call_id == "call_1"
+    for age in (120, -120):
+        stale = _body(age=age)
+        with pytest.raises(WebhookVerificationError, match="tolerance"):
+            verifier.verify(stale, headers(stale))
+
+    stale = _body(age=3600)
+    assert WebhookVerifier(SECRET, tolerance=None).verify(stale, headers(stale))
+
+
+def test_event_id_falls_back_to_header():
+    body = _body(event_id=None)
+    headers = {
+        "x-vocalia-signature": compute_signature(SECRET, body),
+        "x-vocalia-idempotency-key": "evt_header",
+    }
+
+    assert WebhookVerifier(SECRET).verify(body, headers).id == "evt_header"
+
+
+def test_dedupe_window_claims_once_and_expires():
+    window = DedupeWindow(ttl=60)
+    assert window.claim("evt_1")
+    assert not window.claim("evt_1")
+    window.release("evt_1")
+    assert window.claim("evt_1")
+
+    expired = DedupeWindow(ttl=0)
+    assert expired.claim("evt_1")
+    assert expired.claim("evt_1")
+
+    bounded = DedupeWindow(max_size=2)
+    for event_id in ("a", "b", "c"):
+        bounded.claim(event_id)
+    assert len(bounded) == 2
+    assert bounded.claim("a")
+
+
+def test_app_processes_once_and_drops_duplicates():
+    seen: List[str] = []
+    app = WebhookApp(SECRET)
+
+    @app.on("call.completed")
+    async def completed(event):
+        seen.append(event.call_id)
+
+    body = _body()
+    assert _post(app, body)[::2] == (200, b"ok")
+    assert _post(app, body)[::2] == (200, b"duplicate")
+    assert seen == ["call_1"]
+
+
+def test_app_status_codes():
+    app = WebhookApp(SECRET)
+
+    assert _post(app, _body(), signature="bad")[0] == 401
+    assert _post(app, _body(age=3600))[0] == 401
+    assert _post(app, b'{"event": "call.completed"}')[0] == 400
+    assert _post(app, b"not json")[0] == 400
+
+
+def test_app_handler_error_releases_claim():
+    attempts: List[int] = []
+    app = WebhookApp(SECRET)
+
+    @app.on("*")
+    def flaky(event):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+
+    body = _body()
+    assert _post(app, body)[0] == 500
+    assert _post(app, body)[0] == 200
+    assert len(attempts) == 2
+
+
+def test_app_busy_answers_503_and_releases_claim():
+    app = WebhookApp(SECRET, concurrency=1, queue_timeout=0.01)
+    app._slots = asyncio.Semaphore(0)
+
+    status, headers, _ = _post(app, _body())
+
+    assert status == 503
+    assert headers[b"retry-after"] == b"1"
+    assert app.dedupe.claim("evt_1")
+
+
+def test_cancelled_handler_releases_claim():
+    app = WebhookApp(SECRET)
+
+    @app.on("*")
+    async def hang(event):
+        await asyncio.sleep(10)
+
+    body = _body()
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"x-vocalia-signature", compute_signature(SECRET, body).encode())],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def main():
+        task = asyncio.ensure_future(app(scope, receive, send))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert app.dedupe.claim("evt_1")
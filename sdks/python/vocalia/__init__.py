@@ -25,34 +25,161 @@ __version__ = "0.1.0"
 __author__ = "VocalIA"
 __email__ = "dev@vocalia.ma"
 
-from .client import VocalIA
-from .voice import VoiceClient
-from .telephony import TelephonyClient
-from .models import (
-    VoiceResponse,
-    CallSession,
-    Persona,
-    Language,
-    ConversationMessage,
-)
-from .exceptions import (
-    VocalIAError,
-    AuthenticationError,
-    RateLimitError,
-    APIError,
-)
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Public name -> submodule defining it. Submodules (and with them httpx and
+# pydantic) are only imported when one of their names is first accessed, so
+# ``from vocalia import WebhookVerificationError`` stays cheap.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "VocalIA": "client",
+    "AsyncVocalIA": "client",
+    "VoiceClient": "voice",
+    "AsyncVoiceClient": "voice",
+    "TelephonyClient": "telephony",
+    "AsyncTelephonyClient": "telephony",
+    "VoiceResponseStream": "streaming",
+    "AsyncVoiceResponseStream": "streaming",
+    "AudioStream": "streaming",
+    "AsyncAudioStream": "streaming",
+    "RealtimeSession": "realtime",
+    "AsyncRealtimeSession": "realtime",
+    "VoiceResponse": "models",
+    "VoiceChunk": "models",
+    "RealtimeEvent": "models",
+    "CallSession": "models",
+    "Persona": "models",
+    "Language": "models",
+    "ConversationMessage": "models",
+    "CallStatus": "models",
+    "CallEvent": "models",
+    "CallResult": "campaign",
+    "RetryPolicy": "retry",
+    "AdaptiveRateLimiter": "ratelimit",
+    "CircuitBreaker": "circuit",
+    "HedgingPolicy": "hedging",
+    "SynthesisCache": "audiocache",
+    "LazyModel": "validation",
+    "CallWatcher": "watcher",
+    "HistogramSink": "metrics",
+    "PrometheusSink": "metrics",
+    "WebhookApp": "webhooks",
+    "WebhookVerifier": "webhooks",
+    "VocalIAError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "RateLimitError": "exceptions",
+    "APIError": "exceptions",
+    "APIConnectionError": "exceptions",
+    "NotFoundError": "exceptions",
+    "ValidationError": "exceptions",
+    "CallError": "exceptions",
+    "CircuitOpenError": "exceptions",
+    "WebhookVerificationError": "exceptions",
+}
+
+if TYPE_CHECKING:
+    from .audiocache import SynthesisCache
+    from .campaign import CallResult
+    from .circuit import CircuitBreaker
+    from .client import AsyncVocalIA, VocalIA
+    from .exceptions import (
+        APIConnectionError,
+        APIError,
+        AuthenticationError,
+        CallError,
+        CircuitOpenError,
+        NotFoundError,
+        RateLimitError,
+        ValidationError,
+        VocalIAError,
+        WebhookVerificationError,
+    )
+    from .hedging import HedgingPolicy
+    from .metrics import HistogramSink, PrometheusSink
+    from .models import (
+        CallEvent,
+        CallSession,
+        CallStatus,
+        ConversationMessage,
+        Language,
+        Persona,
+        RealtimeEvent,
+        VoiceChunk,
+        VoiceResponse,
+    )
+    from .ratelimit import AdaptiveRateLimiter
+    from .realtime import AsyncRealtimeSession, RealtimeSession
+    from .retry import RetryPolicy
+    from .streaming import (
+        AsyncAudioStream,
+        AsyncVoiceResponseStream,
+        AudioStream,
+        VoiceResponseStream,
+    )
+    from .telephony import AsyncTelephonyClient, TelephonyClient
+    from .validation import LazyModel
+    from .voice import AsyncVoiceClient, VoiceClient
+    from .watcher import CallWatcher
+    from .webhooks import WebhookApp, WebhookVerifier
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib.import_module so the load is
+    # reported by ``python -X importtime``
+    submodule = __import__(f"{__name__}.{module}", None, None, [name])
+    value = getattr(submodule, name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "VocalIA",
+    "AsyncVocalIA",
     "VoiceClient",
+    "AsyncVoiceClient",
     "TelephonyClient",
+    "AsyncTelephonyClient",
+    "VoiceResponseStream",
+    "AsyncVoiceResponseStream",
+    "AudioStream",
+    "AsyncAudioStream",
+    "RealtimeSession",
+    "AsyncRealtimeSession",
     "VoiceResponse",
+    "VoiceChunk",
+    "RealtimeEvent",
     "CallSession",
     "Persona",
     "Language",
     "ConversationMessage",
+    "CallStatus",
+    "CallEvent",
+    "CallResult",
+    "RetryPolicy",
+    "AdaptiveRateLimiter",
+    "CircuitBreaker",
+    "HedgingPolicy",
+    "SynthesisCache",
+    "LazyModel",
+    "CallWatcher",
+    "HistogramSink",
+    "PrometheusSink",
+    "WebhookApp",
+    "WebhookVerifier",
     "VocalIAError",
     "AuthenticationError",
     "RateLimitError",
     "APIError",
+    "APIConnectionError",
+    "NotFoundError",
+    "ValidationError",
+    "CallError",
+    "CircuitOpenError",
+    "WebhookVerificationError",
 ]
@@ -0,0 +1,226 @@
+"""
+VocalIA Audio Cache - Content-addressed cache for synthesized speech
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+# Synthesized audio: bytes, or a read-only map of a large cached file
+AudioData = Union[bytes, mmap.mmap]
+
+_SUFFIX = ".mp3"
+_KEY_VERSION = "v1"
+# Temp files older than this are leftovers of a crashed writer
+_STALE_TMP_SECONDS = 3600.0
+
+
+def synthesis_key(
+    text: str,
+    voice_id: Optional[str],
+    language: str,
+    speed: float,
+) -> str:
+    """Content address of a synthesis request."""
+    payload = json.dumps(
+        [_KEY_VERSION, text, voice_id, language, float(speed)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_file(path: str, map_above: int) -> AudioData:
+    """Read a cached file, or map it when it is larger than ``map_above``."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= map_above or size == 0:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SynthesisCache:
+    """
+    Opt-in cache for ``VoiceClient.synthesize`` keyed on a hash of
+    ``(text, voice_id, language, speed)``.
+
+    Audio is kept in an in-memory LRU tier of ``bytes`` and, when
+    ``directory`` is set, in a disk tier capped at ``max_bytes``. Disk hits
+    of at most ``map_above`` bytes are read and promoted into the memory
+    tier. Larger files are returned as a fresh read-only ``mmap`` served
+    from the page cache without copying; it belongs to the caller, who
+    should ``close()`` it when done. It supports ``len()``, slicing and
+    the buffer protocol, so it can be written to a file or socket as is.
+
+    Files are written to a temporary name and renamed into place, so
+    several processes can share one directory: readers only ever see
+    complete files, and concurrent writers of the same key produce the
+    same content. Each hit refreshes the file's mtime, and eviction
+    removes the least recently used files until the directory is back
+    under 90% of ``max_bytes``.
+
+    Args:
+        directory: Directory for the disk tier; memory only when None
+        max_bytes: Size cap of the disk tier
+        memory_bytes: Size cap of the in-memory tier
+        map_above: Disk hits larger than this are mapped instead of read
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        memory_bytes: int = 32 * 1024 * 1024,
+        map_above: int = 1024 * 1024,
+    ) -> None:
+        self.directory = os.fspath(directory) if directory is not None else None
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self.map_above = map_above
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._disk_size: Optional[int] = None
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, key[:2], key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[AudioData]:
+        """Return cached audio for ``key``, or None on a miss."""
+        with self._lock:
+            remembered = self._memory.get(key)
+            if remembered is not None:
+                self._memory.move_to_end(key)
+                return remembered
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        try:
+            audio = _load_file(path, self.map_above)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        if isinstance(audio, bytes):
+            with self._lock:
+                self._remember(key, audio)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store ``audio`` under ``key`` in both tiers."""
+        with self._lock:
+            self._remember(key, audio)
+        if self.directory is None:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            replaced = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=key[:8], suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            if self._disk_size is not None:
+                self._disk_size += len(audio) - replaced
+                if self._disk_size <= self.max_bytes:
+                    return
+        # Scanning stats every file, so it runs without the lock; two
+        # writers evicting at once only remove a little more than needed.
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            total = self._evict(entries)
+        with self._lock:
+            self._disk_size = total
+
+    def clear(self) -> None:
+        """Empty the memory tier and delete every cached file."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        for path, _, _ in self._scan():
+            _unlink(path)
+        with self._lock:
+            self._disk_size = 0
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        size = len(audio)
+        if size > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = audio
+        self._memory_size += size
+        while self._memory_size > self.memory_bytes:
+            _, old = self._memory.popitem(last=False)
+            self._memory_size -= len(old)
+
+    def _scan(self) -> List[Tuple[str, int, float]]:
+        """(path, size, mtime) of cached files; removes stale temp files."""
+        entries: List[Tuple[str, int, float]] = []
+        if self.directory is None:
+            return entries
+        now = time.time()
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    if now - stat.st_mtime > _STALE_TMP_SECONDS:
+                        _unlink(entry.path)
+                elif entry.name.endswith(_SUFFIX):
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self, entries: List[Tuple[str, int, float]]) -> int:
+        # ``entries`` is a fresh scan rather than the running total: other
+        # processes sharing the directory add and evict files too.
+        entries = sorted(entries, key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            # Mapped copies stay readable after unlink on POSIX
+            _unlink(path)
+            total -= size
+        return total
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
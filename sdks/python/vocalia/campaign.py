@@ -0,0 +1,261 @@
+"""
+VocalIA Campaigns - Bulk outbound call dispatch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .models import CallSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallResult:
+    """
+    Outcome of one item of an ``initiate_calls`` batch.
+
+    Attributes:
+        index: Position of the item in the input batch
+        idempotency_key: Key the call was (or would have been) sent with
+        call: Created call session, if the call was placed
+        error: Exception raised for this item, if any
+        resumed: True when the call was taken from the journal of an
+                 earlier run instead of being dialled again
+    """
+
+    index: int
+    idempotency_key: str
+    call: Optional[CallSession] = None
+    error: Optional[BaseException] = None
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.call is not None
+
+
+ProgressCallback = Callable[[int, int, CallResult], None]
+
+
+def item_key(campaign_id: str, index: int, item: Dict[str, Any]) -> str:
+    """
+    Deterministic idempotency key for a batch item.
+
+    The same campaign, position and call parameters always give the same
+    key, so re-running a crashed campaign is de-duplicated server side.
+    """
+    payload = json.dumps(item, sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{campaign_id}:{index}:{payload}".encode()).hexdigest()
+    return f"vc_{digest[:40]}"
+
+
+def batch_id(batch: Sequence[Dict[str, Any]]) -> str:
+    """Content hash of a batch, used when no campaign_id is given."""
+    digest = hashlib.sha256()
+    for item in batch:
+        digest.update(json.dumps(item, sort_keys=True, default=str).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+class CallJournal:
+    """
+    Append-only JSONL record of placed calls.
+
+    Each successful call is written (and fsynced) before it is reported,
+    so a restarted run can skip items that were already dialled even if
+    the server does not support idempotency keys.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line from a crash
+                    self.entries[entry["key"]] = entry["call"]
+
+    def get(self, key: str) -> Optional[CallSession]:
+        data = self.entries.get(key)
+        return CallSession(**data) if data is not None else None
+
+    def record(self, key: str, call: CallSession) -> None:
+        data = call.model_dump(mode="json", by_alias=True)
+        line = json.dumps({"key": key, "call": data}) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[key] = data
+
+
+class _CampaignRun:
+    """Ordering, journaling and progress shared by sync and async runs."""
+
+    def __init__(
+        self,
+        batch: Sequence[Dict[str, Any]],
+        campaign_id: Optional[str],
+        journal: Optional[Union[str, "os.PathLike[str]"]],
+        on_progress: Optional[ProgressCallback],
+    ) -> None:
+        self.items = [dict(item) for item in batch]
+        campaign = campaign_id or batch_id(self.items)
+        self.keys = [
+            item.pop("idempotency_key", None) or item_key(campaign, i, item)
+            for i, item in enumerate(self.items)
+        ]
+        self.results: List[Optional[CallResult]] = [None] * len(self.items)
+        self.journal = CallJournal(journal) if journal is not None else None
+        self.on_progress = on_progress
+        self.completed = 0
+        self._lock = threading.Lock()
+
+    def pending(self) -> List[int]:
+        """Indices still to dial; journaled items are resolved immediately."""
+        todo = []
+        for i, key in enumerate(self.keys):
+            call = self.journal.get(key) if self.journal else None
+            if call is not None:
+                self.report(CallResult(i, key, call=call, resumed=True))
+            else:
+                todo.append(i)
+        return todo
+
+    def record(self, result: CallResult) -> None:
+        """
+        Journal a newly placed call.
+
+        A failure here is not reported per item: without the journal a
+        restart would dial again, so it aborts the whole run.
+        """
+        if result.call is not None and not result.resumed and self.journal:
+            self.journal.record(result.idempotency_key, result.call)
+
+    def report(self, result: CallResult) -> None:
+        with self._lock:
+            self.results[result.index] = result
+            self.completed += 1
+            completed = self.completed
+        if self.on_progress is not None:
+            try:
+                self.on_progress(completed, len(self.items), result)
+            except Exception:
+                # A broken callback must not stop the calls still in flight
+                logger.exception("on_progress callback failed")
+
+    def ordered(self) -> List[CallResult]:
+        return [r for r in self.results if r is not None]
+
+
+def run_campaign(
+    dial: Callable[[Dict[str, Any], str], CallSession],
+    batch: Sequence[Dict[str, Any]],
+    concurrency: int = 10,
+    campaign_id: Optional[str] = None,
+    journal: Optional[Union[str, "os.PathLike[str]"]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[CallResult]:
+    """Dial ``batch`` on a thread pool; see TelephonyClient.initiate_calls."""
+    run = _CampaignRun(batch, campaign_id, journal, on_progress)
+    aborted = threading.Event()
+
+    def place(index: int) -> None:
+        if aborted.is_set():
+            return
+        key = run.keys[index]
+        try:
+            call = dial(run.items[index], key)
+        except Exception as e:
+            result = CallResult(index, key, error=e)
+        else:
+            result = CallResult(index, key, call=call)
+        try:
+            run.record(result)
+        except BaseException:
+            aborted.set()
+            raise
+        run.report(result)
+
+    todo = run.pending()
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            # Raises the first journal failure once the workers have stopped
+            list(pool.map(place, todo))
+    return run.ordered()
+
+
+async def run_campaign_async(
+    dial: Callable[[Dict[str, Any], str], Awaitable[CallSession]],
+    batch: Sequence[Dict[str, Any]],
+    concurrency: int = 10,
+    campaign_id: Optional[str] = None,
+    journal: Optional[Union[str, "os.PathLike[str]"]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[CallResult]:
+    """Dial ``batch`` with bounded concurrency; see initiate_calls.
+
+    ``on_progress`` is called on the event loop and must not block.
+    """
+    loop = asyncio.get_running_loop()
+    # Loading the journal reads the whole file; keep it off the event loop
+    run = await loop.run_in_executor(
+        None, _CampaignRun, batch, campaign_id, journal, on_progress
+    )
+    todo = run.pending()
+    next_item = iter(todo)
+
+    async def worker() -> None:
+        for index in next_item:
+            key = run.keys[index]
+            try:
+                call = await dial(run.items[index], key)
+            except Exception as e:
+                result = CallResult(index, key, error=e)
+            else:
+                result = CallResult(index, key, call=call)
+            # The journal write fsyncs; keep it off the event loop
+            await loop.run_in_executor(None, run.record, result)
+            run.report(result)
+
+    # A fixed set of workers pulling from one iterator keeps at most
+    # ``concurrency`` calls in flight without a task per item.
+    workers = min(max(1, concurrency), len(todo))
+    tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # A journal failure aborts the run: stop the other workers too
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return run.ordered()
@@ -0,0 +1,169 @@
+"""
+VocalIA Catalog - TTL cache with ETag revalidation for metadata endpoints
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from .codec import JSONCodec
+from .exceptions import APIConnectionError
+from .transport import AsyncTransport, RequestSpec, SyncTransport
+
+DEFAULT_CATALOG_TTL = 300.0
+
+# Extracts the lookup key (persona key, language code) from a catalog item
+KeyFunc = Callable[[Any], str]
+
+
+class CatalogEntry:
+    """A cached catalog: the parsed list, a lookup index and its validator."""
+
+    __slots__ = ("items", "index", "etag", "expires_at")
+
+    def __init__(
+        self,
+        items: List[Any],
+        key: KeyFunc,
+        etag: Optional[str],
+        expires_at: float,
+    ) -> None:
+        self.items = items
+        self.index: Dict[str, Any] = {key(item): item for item in items}
+        self.etag = etag
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class CatalogCache:
+    """
+    Per-client cache for slowly changing list endpoints (personas,
+    languages).
+
+    Entries are served from memory for ``ttl`` seconds. After that the
+    next caller revalidates with ``If-None-Match``; a ``304`` only extends
+    the entry, so the list is not downloaded or parsed again. One thread
+    (or task) refreshes a given endpoint at a time while the others wait
+    for its result. If revalidation fails with a connection error, the
+    stale entry is served instead of failing the lookup.
+
+    Cached lists are shared between callers and must not be mutated.
+
+    Args:
+        ttl: Seconds an entry is used without revalidation
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CATALOG_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._async_locks: Dict[str, asyncio.Lock] = {}
+
+    def _fresh(self, path: str) -> Optional[CatalogEntry]:
+        entry = self._entries.get(path)
+        return entry if entry is not None and entry.fresh else None
+
+    def _conditional(
+        self, spec: RequestSpec[Any], entry: Optional[CatalogEntry]
+    ) -> RequestSpec[Any]:
+        if entry is None or entry.etag is None:
+            return spec
+        headers = {**(spec.headers or {}), "If-None-Match": entry.etag}
+        return replace(spec, headers=headers)
+
+    def _store(
+        self,
+        spec: RequestSpec[Any],
+        response: httpx.Response,
+        entry: Optional[CatalogEntry],
+        key: KeyFunc,
+        codec: JSONCodec,
+    ) -> CatalogEntry:
+        expires_at = time.monotonic() + self.ttl
+        if response.status_code == 304 and entry is not None:
+            entry.expires_at = expires_at
+            return entry
+        entry = CatalogEntry(
+            spec.handle(response, codec),
+            key,
+            response.headers.get("etag"),
+            expires_at,
+        )
+        self._entries[spec.path] = entry
+        return entry
+
+    def get(
+        self, transport: SyncTransport, spec: RequestSpec[Any], key: KeyFunc
+    ) -> CatalogEntry:
+        """Return the cached entry for ``spec``, fetching it when stale."""
+        entry = self._fresh(spec.path)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(spec.path, threading.Lock())
+        with fetch_lock:
+            entry = self._fresh(spec.path)
+            if entry is not None:
+                return entry
+            stale = self._entries.get(spec.path)
+            try:
+                response = transport.open_stream(self._conditional(spec, stale))
+            except APIConnectionError:
+                if stale is None:
+                    raise
+                return stale
+            try:
+                response.read()
+            finally:
+                response.close()
+            return self._store(spec, response, stale, key, transport.codec)
+
+    async def aget(
+        self, transport: AsyncTransport, spec: RequestSpec[Any], key: KeyFunc
+    ) -> CatalogEntry:
+        """Async counterpart of :meth:`get`."""
+        entry = self._fresh(spec.path)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            fetch_lock = self._async_locks.get(spec.path)
+            if fetch_lock is None:
+                fetch_lock = self._async_locks[spec.path] = asyncio.Lock()
+        async with fetch_lock:
+            entry = self._fresh(spec.path)
+            if entry is not None:
+                return entry
+            stale = self._entries.get(spec.path)
+            try:
+                response = await transport.open_stream(
+                    self._conditional(spec, stale)
+                )
+            except APIConnectionError:
+                if stale is None:
+                    raise
+                return stale
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            return self._store(spec, response, stale, key, transport.codec)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop one endpoint's entry, or every entry."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
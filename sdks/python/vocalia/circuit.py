@@ -0,0 +1,288 @@
+"""
+VocalIA Circuit Breaker - Fail fast while an endpoint family is unhealthy
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from .exceptions import (
+    APIConnectionError,
+    APIError,
+    CircuitOpenError,
+    RateLimitError,
+    VocalIAError,
+)
+from .ratelimit import endpoint_family
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateListener = Callable[[str, str], None]
+
+_FAILED = 1
+_SLOW = 2
+
+
+def is_failure(error: Union[VocalIAError, httpx.TransportError]) -> bool:
+    """
+    Whether an attempt's error means the backend is unhealthy.
+
+    Network errors, timeouts and 5xx responses count; 4xx responses
+    (including 429, which the rate limiter handles) show the backend
+    answering and do not.
+    """
+    if isinstance(error, (httpx.TransportError, APIConnectionError)):
+        return True
+    if isinstance(error, RateLimitError):
+        return False
+    if isinstance(error, APIError):
+        return error.status_code is None or error.status_code >= 500
+    return False
+
+
+class _Circuit:
+    __slots__ = (
+        "state",
+        "generation",
+        "window",
+        "failed",
+        "slow",
+        "opened_at",
+        "probes",
+        "passed",
+    )
+
+    def __init__(self, size: int) -> None:
+        self.state = CLOSED
+        # Bumped on every state change; tags the attempts admitted under it
+        self.generation = 0
+        self.window: Deque[int] = deque(maxlen=size)
+        self.failed = 0
+        self.slow = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.passed = 0
+
+    def add(self, flags: int) -> None:
+        window = self.window
+        if len(window) == window.maxlen:
+            evicted = window[0]
+            self.failed -= evicted & _FAILED
+            self.slow -= (evicted & _SLOW) >> 1
+        window.append(flags)
+        self.failed += flags & _FAILED
+        self.slow += (flags & _SLOW) >> 1
+
+    def clear(self) -> None:
+        self.window.clear()
+        self.failed = self.slow = self.probes = self.passed = 0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint-family circuit breaker.
+
+    Each family (``voice``, ``telephony``, ...) keeps the outcome of its
+    last ``window`` attempts. Once at least ``min_calls`` are recorded and
+    the share of failures reaches ``failure_rate`` (or the share of
+    attempts slower than ``slow_call_duration`` reaches ``slow_call_rate``),
+    the circuit opens: calls to that family raise CircuitOpenError at once
+    instead of waiting on a failing backend. After ``open_duration``
+    seconds the circuit goes half-open and lets ``half_open_calls``
+    probes through; if they all succeed it closes, otherwise it opens
+    again.
+
+    Failures are network errors, timeouts and 5xx responses (see
+    :func:`is_failure`). Every attempt counts, including retries.
+
+    One instance may be shared by several clients, threads and asyncio
+    tasks. State changes are reported to subscribed listeners, such as a
+    client's metrics sink.
+
+    Args:
+        failure_rate: Share of failed attempts (0-1) that opens the circuit
+        slow_call_duration: Seconds after which an attempt counts as slow;
+                            None disables the latency threshold
+        slow_call_rate: Share of slow attempts (0-1) that opens the circuit
+        window: Number of recent attempts considered per family
+        min_calls: Attempts needed in the window before it can open
+        open_duration: Seconds the circuit stays open before probing
+        half_open_calls: Probe attempts let through while half-open
+
+    Example:
+        breaker = CircuitBreaker(failure_rate=0.5, slow_call_duration=5.0)
+        client = VocalIA(circuit_breaker=breaker)
+        try:
+            reply = client.voice.generate_response("Bonjour")
+        except CircuitOpenError:
+            reply = canned_reply
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[StateListener] = []
+        self._lock = threading.Lock()
+
+    def _circuit(self, family: str) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(self.window)
+        return circuit
+
+    def _move(self, circuit: _Circuit, state: str, now: float) -> str:
+        circuit.state = state
+        circuit.generation += 1
+        circuit.clear()
+        if state == OPEN:
+            circuit.opened_at = now
+        return state
+
+    def _notify(self, family: str, state: Optional[str]) -> None:
+        if state is None:
+            return
+        for listener in list(self._listeners):
+            listener(family, state)
+
+    def subscribe(self, listener: StateListener) -> None:
+        """Call ``listener(family, state)`` on every state change."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def check(self, path: str) -> int:
+        """
+        Admit an attempt to ``path`` or raise CircuitOpenError.
+
+        Every admitted attempt must be followed by :meth:`on_result` or
+        :meth:`release`, passing the token returned here. An attempt that
+        ends after the circuit changed state is then ignored: a slow call
+        admitted while closed is not mistaken for a half-open probe.
+        """
+        family = endpoint_family(path)
+        changed = None
+        with self._lock:
+            circuit = self._circuit(family)
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.open_duration - now
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Circuit open for {family!r} endpoints",
+                        family=family,
+                        retry_after=remaining,
+                    )
+                changed = self._move(circuit, HALF_OPEN, now)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes + circuit.passed >= self.half_open_calls:
+                    raise CircuitOpenError(
+                        f"Circuit half-open for {family!r} endpoints; "
+                        "probes in flight",
+                        family=family,
+                    )
+                circuit.probes += 1
+            token = circuit.generation
+        self._notify(family, changed)
+        return token
+
+    def on_result(
+        self,
+        path: str,
+        elapsed: float,
+        error: Optional[Union[VocalIAError, httpx.TransportError]] = None,
+        token: Optional[int] = None,
+    ) -> None:
+        """
+        Record the outcome of an admitted attempt that took ``elapsed``.
+
+        ``token`` is the value :meth:`check` returned for the attempt.
+        """
+        family = endpoint_family(path)
+        flags = 0
+        if error is not None and is_failure(error):
+            flags |= _FAILED
+        limit = self.slow_call_duration
+        if limit is not None and elapsed >= limit:
+            flags |= _SLOW
+
+        changed = None
+        with self._lock:
+            circuit = self._circuit(family)
+            now = time.monotonic()
+            if token is not None and token != circuit.generation:
+                pass  # admitted before the last state change
+            elif circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if flags:
+                    changed = self._move(circuit, OPEN, now)
+                else:
+                    circuit.passed += 1
+                    if circuit.passed >= self.half_open_calls:
+                        changed = self._move(circuit, CLOSED, now)
+            elif circuit.state == CLOSED:
+                circuit.add(flags)
+                count = len(circuit.window)
+                if count >= self.min_calls and (
+                    circuit.failed >= self.failure_rate * count
+                    or circuit.slow >= self.slow_call_rate * count
+                ):
+                    changed = self._move(circuit, OPEN, now)
+        self._notify(family, changed)
+
+    def release(self, path: str, token: Optional[int] = None) -> None:
+        """Give back an admitted attempt that ended without a result."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint_family(path))
+            if (
+                circuit is not None
+                and circuit.state == HALF_OPEN
+                and (token is None or token == circuit.generation)
+            ):
+                circuit.probes = max(0, circuit.probes - 1)
+
+    def state(self, family: str) -> str:
+        """Current state of a family: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            circuit = self._circuits.get(family)
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[str, str]:
+        """Current state of each family seen so far."""
+        with self._lock:
+            return {family: c.state for family, c in self._circuits.items()}
+
+    def reset(self, family: Optional[str] = None) -> None:
+        """Close one family's circuit, or all of them, and forget history."""
+        changed: List[Tuple[str, str]] = []
+        with self._lock:
+            families = [family] if family is not None else list(self._circuits)
+            for name in families:
+                circuit = self._circuits.get(name)
+                if circuit is not None:
+                    if circuit.state != CLOSED:
+                        changed.append((name, CLOSED))
+                    self._move(circuit, CLOSED, time.monotonic())
+        for name, state in changed:
+            self._notify(name, state)
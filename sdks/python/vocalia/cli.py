@@ -0,0 +1,35 @@
+"""
+VocalIA command line
+
+Usage:
+    vocalia loadtest --base-url URL (--poisson RATE | --replay PATH...) [options]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="vocalia", description="VocalIA tools")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    from . import loadtest
+
+    loadtest_parser = commands.add_parser(
+        "loadtest",
+        help="open-loop load test against a VocalIA API",
+        description=loadtest.__doc__.split("\n\n")[0].strip(),
+    )
+    loadtest.add_arguments(loadtest_parser)
+    loadtest_parser.set_defaults(handler=loadtest.run)
+
+    args = parser.parse_args(argv)
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,58 @@ VocalIA Main Client
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 
-from .voice import VoiceClient
-from .telephony import TelephonyClient
+from .audiocache import SynthesisCache
+from .catalog import DEFAULT_CATALOG_TTL, CatalogCache
+from .circuit import CircuitBreaker
+from .coalesce import AsyncSingleflight, Singleflight
+from .codec import JSONCodec, get_codec
 from .exceptions import AuthenticationError
+from .hedging import HedgingPolicy
+from .idempotency import DEFAULT_IDEMPOTENCY_ENTRIES, DEFAULT_IDEMPOTENCY_TTL
+from .metrics import MetricsSink
+from .ratelimit import AdaptiveRateLimiter
+from .retry import RetryPolicy
+from .telephony import AsyncTelephonyClient, TelephonyClient
+from .transport import AsyncTransport, SyncTransport
+from .validation import ValidationMode, check_mode
+from .voice import AsyncVoiceClient, VoiceClient
+
+
+def _connection_options(
+    timeout: float,
+    connect_timeout: Optional[float],
+    read_timeout: Optional[float],
+    write_timeout: Optional[float],
+    pool_timeout: Optional[float],
+    max_connections: Optional[int],
+    max_keepalive: Optional[int],
+    keepalive_expiry: Optional[float],
+    http2: bool,
+) -> Dict[str, Any]:
+    """httpx client options shared by the sync and async clients."""
+
+    def phase(value: Optional[float]) -> float:
+        return timeout if value is None else value
+
+    return {
+        "timeout": httpx.Timeout(
+            timeout,
+            connect=phase(connect_timeout),
+            read=phase(read_timeout),
+            write=phase(write_timeout),
+            pool=phase(pool_timeout),
+        ),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "http2": http2,
+    }
 
 
 class VocalIA:
@@ -31,17 +76,94 @@ class VocalIA:
         api_key: Your VocalIA API key. If not provided, reads from
                  VOCALIA_API_KEY environment variable.
         base_url: API base URL. Defaults to https://api.vocalia.ma
-        timeout: Request timeout in seconds. Defaults to 30.
+        timeout: Request timeout in seconds. Defaults to 30. Applies to
+                 each phase not set by the ``*_timeout`` options below.
+        max_retries: Retries for transient failures of idempotent calls.
+                     Defaults to 2. Ignored when ``retry`` is given.
+        retry: Full retry policy (backoff, jitter, total time budget).
+        rate_limiter: Optional client-side AdaptiveRateLimiter. Pass the
+                      same instance to several clients to share its budget.
+        catalog_ttl: Seconds persona and language lists are cached before
+                     being revalidated. None disables the cache.
+        warm_catalog: Load both catalogs when the client is created, so
+                      ``get_persona``/``get_language`` never wait on I/O.
+                      The async client loads them on ``async with``.
+        synthesis_cache: Optional SynthesisCache for ``voice.synthesize``.
+        max_connections: Connection pool size; None for no limit.
+                         Defaults to 100. Requests beyond it wait up to
+                         ``pool_timeout`` for a free connection.
+        max_keepalive: Idle connections kept open for reuse. Defaults to 20.
+        keepalive_expiry: Seconds an idle connection is kept. Defaults to 5.
+        http2: Use HTTP/2, multiplexing concurrent requests over few
+               connections. Requires ``pip install vocalia[http2]``.
+        connect_timeout: Timeout for establishing a connection.
+        read_timeout: Timeout between received chunks of a response.
+        write_timeout: Timeout between sent chunks of a request body.
+        pool_timeout: Timeout waiting for a connection from the pool.
+        json_codec: "auto" (orjson, then msgspec, then stdlib), a backend
+                    name ("orjson", "msgspec", "json") or a JSONCodec.
+        validation: How list responses (calls, personas, languages) become
+                    models. "strict" validates each item (default);
+                    "trusted" validates the whole list in one pydantic-core
+                    pass; "lazy" returns read-only proxies that parse a field
+                    only when it is accessed (call ``.resolve()`` for the
+                    full model).
+        coalesce: Share one request among identical GETs made at the same
+                  time (``get_call``, ``get_transcript``, uncached list
+                  calls); every caller receives the same result object.
+        coalesce_ttl: Seconds a coalesced result keeps being returned to
+                      new identical GETs after it arrives. Defaults to 0
+                      (shared only while in flight).
+        metrics: Optional MetricsSink (see :mod:`vocalia.metrics`) that
+                 receives the timing of every request: pool wait, connect,
+                 TLS, time to first byte, download, JSON decode and model
+                 validation. Nothing is timed when it is not set.
+        circuit_breaker: Optional CircuitBreaker (see :mod:`vocalia.circuit`).
+                         When an endpoint family keeps failing or answering
+                         slowly, its calls raise CircuitOpenError at once
+                         instead of waiting for a timeout. Pass the same
+                         instance to several clients to share state.
+        idempotency_ttl: Seconds the result of ``initiate_call``,
+                         ``transfer_call`` or ``end_call`` is returned to
+                         repeats with the same idempotency key without a
+                         new request (0 disables the local table). These
+                         calls always send a key, so they are retried.
+        idempotency_cache_size: Most keyed results kept for ``idempotency_ttl``
     """
 
     DEFAULT_BASE_URL = "https://api.vocalia.ma"
     DEFAULT_TIMEOUT = 30.0
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE = 20
+    DEFAULT_KEEPALIVE_EXPIRY = 5.0
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = 2,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        catalog_ttl: Optional[float] = DEFAULT_CATALOG_TTL,
+        warm_catalog: bool = False,
+        synthesis_cache: Optional[SynthesisCache] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: Optional[int] = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
+        validation: ValidationMode = "strict",
+        coalesce: bool = False,
+        coalesce_ttl: float = 0.0,
+        metrics: Optional[MetricsSink] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        idempotency_ttl: float = DEFAULT_IDEMPOTENCY_TTL,
+        idempotency_cache_size: int = DEFAULT_IDEMPOTENCY_ENTRIES,
     ) -> None:
         self.api_key = api_key or os.environ.get("VOCALIA_API_KEY")
         if not self.api_key:
@@ -61,25 +183,65 @@ class VocalIA:
                 "Content-Type": "application/json",
                 "User-Agent": f"vocalia-python/0.1.0",
             },
-            timeout=timeout,
+            **_connection_options(
+                timeout,
+                connect_timeout,
+                read_timeout,
+                write_timeout,
+                pool_timeout,
+                max_connections,
+                max_keepalive,
+                keepalive_expiry,
+                http2,
+            ),
+        )
+        self.retry = retry or RetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter
+        self.codec = get_codec(json_codec)
+        self.validation = check_mode(validation)
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self._transport = SyncTransport(
+            self._http_client,
+            retry=self.retry,
+            rate_limiter=rate_limiter,
+            codec=self.codec,
+            coalescer=Singleflight(coalesce_ttl) if coalesce else None,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            idempotency=(
+                Singleflight(idempotency_ttl, idempotency_cache_size)
+                if idempotency_ttl > 0
+                else None
+            ),
         )
+        self.catalog = CatalogCache(catalog_ttl) if catalog_ttl is not None else None
+        self.synthesis_cache = synthesis_cache
 
         # Initialize sub-clients
         self._voice: Optional[VoiceClient] = None
         self._telephony: Optional[TelephonyClient] = None
 
+        if warm_catalog:
+            self.voice.warm_catalog()
+
     @property
     def voice(self) -> VoiceClient:
         """Access voice/widget functionality."""
         if self._voice is None:
-            self._voice = VoiceClient(self._http_client)
+            self._voice = VoiceClient(
+                self._transport,
+                self.catalog,
+                self.synthesis_cache,
+                self.validation,
+            )
         return self._voice
 
     @property
     def telephony(self) -> TelephonyClient:
         """Access telephony/PSTN functionality."""
         if self._telephony is None:
-            self._telephony = TelephonyClient(self._http_client)
+            self._telephony = TelephonyClient(self._transport, self.validation)
         return self._telephony
 
     def close(self) -> None:
@@ -100,16 +262,51 @@ class AsyncVocalIA:
     Usage:
         async with AsyncVocalIA(api_key="your-api-key") as client:
             response = await client.voice.generate_response("Hello")
+            call = await client.telephony.initiate_call("+212600000000")
+
+    Takes the same arguments as :class:`VocalIA`, plus:
+
+    Args:
+        hedging: Optional HedgingPolicy (see :mod:`vocalia.hedging`). Reads
+                 such as ``get_call`` that have not answered within their
+                 usual latency are sent a second time; the first response
+                 wins and the other request is cancelled.
     """
 
     DEFAULT_BASE_URL = "https://api.vocalia.ma"
     DEFAULT_TIMEOUT = 30.0
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_KEEPALIVE = 20
+    DEFAULT_KEEPALIVE_EXPIRY = 5.0
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = 2,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        catalog_ttl: Optional[float] = DEFAULT_CATALOG_TTL,
+        warm_catalog: bool = False,
+        synthesis_cache: Optional[SynthesisCache] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: Optional[int] = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
+        validation: ValidationMode = "strict",
+        coalesce: bool = False,
+        coalesce_ttl: float = 0.0,
+        metrics: Optional[MetricsSink] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        idempotency_ttl: float = DEFAULT_IDEMPOTENCY_TTL,
+        idempotency_cache_size: int = DEFAULT_IDEMPOTENCY_ENTRIES,
+        hedging: Optional[HedgingPolicy] = None,
     ) -> None:
         self.api_key = api_key or os.environ.get("VOCALIA_API_KEY")
         if not self.api_key:
@@ -129,14 +326,74 @@ class AsyncVocalIA:
                 "Content-Type": "application/json",
                 "User-Agent": f"vocalia-python/0.1.0",
             },
-            timeout=timeout,
+            **_connection_options(
+                timeout,
+                connect_timeout,
+                read_timeout,
+                write_timeout,
+                pool_timeout,
+                max_connections,
+                max_keepalive,
+                keepalive_expiry,
+                http2,
+            ),
+        )
+        self.retry = retry or RetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter
+        self.codec = get_codec(json_codec)
+        self.validation = check_mode(validation)
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self._transport = AsyncTransport(
+            self._http_client,
+            retry=self.retry,
+            rate_limiter=rate_limiter,
+            codec=self.codec,
+            coalescer=AsyncSingleflight(coalesce_ttl) if coalesce else None,
+            metrics=metrics,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            idempotency=(
+                AsyncSingleflight(idempotency_ttl, idempotency_cache_size)
+                if idempotency_ttl > 0
+                else None
+            ),
         )
+        self.catalog = CatalogCache(catalog_ttl) if catalog_ttl is not None else None
+        self.synthesis_cache = synthesis_cache
+        self._warm_catalog = warm_catalog
+
+        # Initialize sub-clients
+        self._voice: Optional[AsyncVoiceClient] = None
+        self._telephony: Optional[AsyncTelephonyClient] = None
+
+    @property
+    def voice(self) -> AsyncVoiceClient:
+        """Access voice/widget functionality."""
+        if self._voice is None:
+            self._voice = AsyncVoiceClient(
+                self._transport,
+                self.catalog,
+                self.synthesis_cache,
+                self.validation,
+            )
+        return self._voice
+
+    @property
+    def telephony(self) -> AsyncTelephonyClient:
+        """Access telephony/PSTN functionality."""
+        if self._telephony is None:
+            self._telephony = AsyncTelephonyClient(self._transport, self.validation)
+        return self._telephony
 
     async def close(self) -> None:
         """Close the HTTP client."""
         await self._http_client.aclose()
 
     async def __aenter__(self) -> "AsyncVocalIA":
+        if self._warm_catalog:
+            await self.voice.warm_catalog()
         return self
 
     async def __aexit__(self, *args) -> None:
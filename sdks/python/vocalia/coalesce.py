@@ -0,0 +1,163 @@
+"""
+VocalIA Coalescing - Share one in-flight request among identical reads
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from .transport import RequestSpec
+
+T = TypeVar("T")
+
+# Completed entries are swept once the table grows past this size
+_SWEEP_THRESHOLD = 1024
+
+
+def request_key(spec: "RequestSpec[Any]") -> Optional[Hashable]:
+    """
+    Coalescing key for ``spec``, or None when it must not be shared.
+
+    Only GETs whose result is parsed are shared; raw downloads and
+    requests with a body are always sent on their own.
+    """
+    if spec.method.upper() != "GET" or spec.raw or spec.content is not None:
+        return None
+    params = tuple(sorted((k, str(v)) for k, v in (spec.params or {}).items()))
+    headers = tuple(sorted((spec.headers or {}).items()))
+    return (spec.path, params, headers)
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "expires_at")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.expires_at = 0.0
+
+
+class Singleflight:
+    """
+    Runs at most one call per key at a time across threads.
+
+    Callers arriving while a call for the same key is in flight wait for
+    it and receive the same result (or exception) instead of sending a
+    duplicate request. With ``ttl`` > 0 a successful result is also
+    returned to callers for that many seconds after it completes; with
+    ``max_entries``, only that many completed results are kept (oldest
+    dropped first).
+
+    Results are shared objects and must not be mutated.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: Optional[int] = None) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._sweep_at = min(_SWEEP_THRESHOLD, max_entries or _SWEEP_THRESHOLD)
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.done.is_set():
+                if flight.expires_at <= time.monotonic():
+                    flight = None
+            leader = flight is None
+            if flight is None:
+                if len(self._flights) >= self._sweep_at:
+                    self._sweep()
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                # Drop the leader's frames so waiters do not pile theirs on
+                raise flight.error.with_traceback(None)
+            return flight.result  # type: ignore[no-any-return]
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            flight.expires_at = time.monotonic() + self.ttl
+            if flight.error is not None or self.ttl <= 0:
+                with self._lock:
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+            flight.done.set()
+        return flight.result  # type: ignore[no-any-return]
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        limit = self.max_entries
+        excess = len(self._flights) - limit + 1 if limit is not None else 0
+        for key, flight in list(self._flights.items()):
+            if flight.done.is_set() and (flight.expires_at <= now or excess > 0):
+                del self._flights[key]
+                excess -= 1
+
+
+class AsyncSingleflight:
+    """
+    Async counterpart of :class:`Singleflight`.
+
+    The shared request runs in its own task, so a caller that is
+    cancelled does not cancel it for the others.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: Optional[int] = None) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._sweep_at = min(_SWEEP_THRESHOLD, max_entries or _SWEEP_THRESHOLD)
+        self._flights: Dict[Hashable, Tuple["asyncio.Future[Any]", float]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        entry = self._flights.get(key)
+        if entry is not None:
+            task, expires_at = entry
+            if not task.done() or expires_at > time.monotonic():
+                return await asyncio.shield(task)
+
+        if len(self._flights) >= self._sweep_at:
+            self._sweep()
+        task = asyncio.ensure_future(fn())
+        self._flights[key] = (task, float("inf"))
+        task.add_done_callback(lambda t: self._finished(key, t))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        entry = self._flights.get(key)
+        if entry is None or entry[0] is not task:
+            return
+        if task.cancelled() or task.exception() is not None or self.ttl <= 0:
+            del self._flights[key]
+        else:
+            self._flights[key] = (task, time.monotonic() + self.ttl)
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        limit = self.max_entries
+        excess = len(self._flights) - limit + 1 if limit is not None else 0
+        for key, (task, expires_at) in list(self._flights.items()):
+            if task.done() and (expires_at <= now or excess > 0):
+                del self._flights[key]
+                excess -= 1
@@ -0,0 +1,132 @@
+"""
+VocalIA Codec - Pluggable JSON encoding for request and response bodies
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Union
+
+Data = Union[bytes, bytearray, memoryview, str]
+
+
+class RawJSON(bytes):
+    """
+    Already-encoded JSON value placed in a request payload.
+
+    Spliced into the body as is, so large values serialized elsewhere
+    (e.g. by a pydantic ``TypeAdapter``) are not decoded to dicts and
+    encoded a second time.
+    """
+
+
+class JSONCodec:
+    """
+    JSON encoder/decoder used by the transports.
+
+    This base implementation uses the standard library; subclasses plug
+    in faster backends. ``dumps`` must return UTF-8 bytes.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: Data) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Data) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: Data) -> Any:
+        return self._decoder.decode(data)
+
+
+_BACKENDS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec] = "auto") -> JSONCodec:
+    """
+    Resolve a codec name to an instance.
+
+    ``"auto"`` picks the fastest installed backend: orjson, then msgspec,
+    then the standard library. Naming a backend that is not installed
+    raises ImportError.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec != "auto":
+        if codec not in _BACKENDS:
+            raise ValueError(f"Unknown JSON codec: {codec!r}")
+        return _BACKENDS[codec]()
+    for backend in (OrjsonCodec, MsgspecCodec):
+        try:
+            return backend()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+def encode_payload(codec: JSONCodec, payload: Any) -> bytes:
+    """Encode a request payload, splicing in any top-level RawJSON values."""
+    if not isinstance(payload, dict) or not any(
+        isinstance(value, RawJSON) for value in payload.values()
+    ):
+        return codec.dumps(payload)
+
+    plain: Dict[str, Any] = {}
+    raw: Dict[str, RawJSON] = {}
+    for key, value in payload.items():
+        if isinstance(value, RawJSON):
+            raw[key] = value
+        else:
+            plain[key] = value
+
+    # Drop the closing brace of the encoded plain part and append members
+    parts = [codec.dumps(plain)[:-1]]
+    first = not plain
+    for key, value in raw.items():
+        parts.append(b"" if first else b",")
+        parts.append(codec.dumps(key))
+        parts.append(b":")
+        parts.append(value)
+        first = False
+    parts.append(b"}")
+    return b"".join(parts)
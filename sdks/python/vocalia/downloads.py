@@ -0,0 +1,297 @@
+"""
+VocalIA Downloads - Streaming, resumable binary transfers
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+from .exceptions import APIConnectionError, DownloadError, VocalIAError
+from .transport import AsyncTransport, RequestSpec, SyncTransport
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# Builds the request for a transfer given the extra headers (Range) to send
+RangeSpecFactory = Callable[[Dict[str, str]], RequestSpec[Any]]
+
+
+class RangeDownload:
+    """
+    Byte accounting for a transfer that may be resumed with HTTP Range.
+
+    Tracks the offset reached so far, the expected total size and a
+    running SHA-256, and turns each (re)opened response into the bytes
+    that continue the transfer. If the server ignores the Range header and
+    answers 200, the already-received prefix is skipped.
+    """
+
+    def __init__(
+        self,
+        offset: int = 0,
+        expected_sha256: Optional[str] = None,
+        hasher: Optional[Any] = None,
+    ) -> None:
+        self.offset = offset
+        self.total: Optional[int] = None
+        self.expected_sha256 = expected_sha256
+        self.hasher = hasher or hashlib.sha256()
+        self._discard = 0
+
+    def headers(self) -> Dict[str, str]:
+        """Headers for the next request: identity encoding, Range if resuming."""
+        headers = {"Accept-Encoding": "identity"}
+        if self.offset:
+            headers["Range"] = f"bytes={self.offset}-"
+        return headers
+
+    def start(self, response: httpx.Response) -> None:
+        """Inspect a freshly opened response before consuming its body."""
+        self._discard = 0
+        if response.status_code == 206:
+            start, total = _parse_content_range(response.headers.get("content-range"))
+            if start is not None and start != self.offset:
+                raise DownloadError(
+                    f"Server resumed at byte {start}, expected {self.offset}"
+                )
+            if total is not None:
+                self.total = total
+        else:
+            self._discard = self.offset
+            length = response.headers.get("content-length")
+            if length is not None:
+                self.total = int(length)
+        if self.expected_sha256 is None:
+            self.expected_sha256 = response.headers.get("x-checksum-sha256")
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Account for a received chunk; return the part that is new."""
+        if self._discard:
+            skip = min(self._discard, len(chunk))
+            self._discard -= skip
+            chunk = chunk[skip:]
+        if chunk:
+            self.offset += len(chunk)
+            self.hasher.update(chunk)
+        return chunk
+
+    def verify(self) -> None:
+        """Check the received size and checksum against what was announced."""
+        if self.total is not None and self.offset != self.total:
+            raise DownloadError(
+                f"Incomplete download: {self.offset} of {self.total} bytes"
+            )
+        if self.expected_sha256:
+            digest = self.hasher.hexdigest()
+            if digest.lower() != self.expected_sha256.lower():
+                raise DownloadError(
+                    f"Checksum mismatch: got {digest}, "
+                    f"expected {self.expected_sha256}"
+                )
+
+
+def _parse_content_range(value: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    # "bytes 100-999/1000" or "bytes 100-999/*"
+    if not value or not value.startswith("bytes "):
+        return None, None
+    span, _, total = value[6:].partition("/")
+    start = span.partition("-")[0]
+    return (
+        int(start) if start.isdigit() else None,
+        int(total) if total.isdigit() else None,
+    )
+
+
+def _already_complete(error: VocalIAError, download: RangeDownload) -> bool:
+    # 416 on a resumed request: the partial file already holds every byte
+    if error.status_code == 416 and download.offset > 0:
+        download.total = download.offset
+        return True
+    return False
+
+
+def iter_download(
+    transport: SyncTransport,
+    make_spec: RangeSpecFactory,
+    download: RangeDownload,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_resumes: int = 3,
+) -> Iterator[bytes]:
+    """
+    Stream a transfer chunk by chunk, resuming with Range after a dropped
+    connection, then verify it.
+    """
+    resumes = 0
+    while True:
+        try:
+            response = transport.open_stream(make_spec(download.headers()))
+        except VocalIAError as e:
+            if _already_complete(e, download):
+                break
+            raise
+        try:
+            download.start(response)
+            for chunk in response.iter_bytes(chunk_size):
+                data = download.feed(chunk)
+                if data:
+                    yield data
+            break
+        except httpx.TransportError as e:
+            if resumes >= max_resumes:
+                raise APIConnectionError(f"Download interrupted: {e}") from e
+            resumes += 1
+        finally:
+            response.close()
+    download.verify()
+
+
+async def aiter_download(
+    transport: AsyncTransport,
+    make_spec: RangeSpecFactory,
+    download: RangeDownload,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_resumes: int = 3,
+) -> AsyncIterator[bytes]:
+    """Async counterpart of :func:`iter_download`."""
+    resumes = 0
+    while True:
+        try:
+            response = await transport.open_stream(make_spec(download.headers()))
+        except VocalIAError as e:
+            if _already_complete(e, download):
+                break
+            raise
+        try:
+            download.start(response)
+            async for chunk in response.aiter_bytes(chunk_size):
+                data = download.feed(chunk)
+                if data:
+                    yield data
+            break
+        except httpx.TransportError as e:
+            if resumes >= max_resumes:
+                raise APIConnectionError(f"Download interrupted: {e}") from e
+            resumes += 1
+        finally:
+            await response.aclose()
+    download.verify()
+
+
+class _FileTarget:
+    """
+    Destination of a download: a path (written to ``<path>.part`` and
+    renamed when verified, resumable across runs) or an open binary file.
+    """
+
+    def __init__(
+        self,
+        target: PathOrFile,
+        resume: bool,
+        expected_sha256: Optional[str],
+    ) -> None:
+        self.path: Optional[str] = None
+        self.part: Optional[str] = None
+        self.file: IO[bytes]
+        hasher = hashlib.sha256()
+        offset = 0
+
+        if isinstance(target, (str, os.PathLike)):
+            self.path = os.fspath(target)
+            self.part = self.path + ".part"
+            if resume and os.path.exists(self.part):
+                with open(self.part, "rb") as f:
+                    for block in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b""):
+                        hasher.update(block)
+                        offset += len(block)
+                self.file = open(self.part, "ab")
+            else:
+                self.file = open(self.part, "wb")
+        else:
+            self.file = target
+
+        self.download = RangeDownload(offset, expected_sha256, hasher)
+
+    def write(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+
+    def commit(self) -> None:
+        if self.path is not None and self.part is not None:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+            os.replace(self.part, self.path)
+
+    def abort(self, error: BaseException) -> None:
+        if self.path is None or self.part is None:
+            return
+        self.file.close()
+        # After a dropped connection the .part file is kept so the next call
+        # can resume from it; bytes that failed verification are discarded
+        if isinstance(error, DownloadError):
+            try:
+                os.unlink(self.part)
+            except FileNotFoundError:
+                pass
+
+
+def download_to(
+    transport: SyncTransport,
+    make_spec: RangeSpecFactory,
+    target: PathOrFile,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    expected_sha256: Optional[str] = None,
+) -> int:
+    """Stream a transfer into a path or file object; return its size."""
+    out = _FileTarget(target, resume, expected_sha256)
+    try:
+        for chunk in iter_download(transport, make_spec, out.download, chunk_size):
+            out.write(chunk)
+    except BaseException as e:
+        out.abort(e)
+        raise
+    out.commit()
+    return out.download.offset
+
+
+async def adownload_to(
+    transport: AsyncTransport,
+    make_spec: RangeSpecFactory,
+    target: PathOrFile,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    expected_sha256: Optional[str] = None,
+) -> int:
+    """Async counterpart of :func:`download_to`."""
+    # Hashing a resumed .part file, writes and the final fsync all touch
+    # the disk; keep them off the event loop
+    loop = asyncio.get_running_loop()
+    out = await loop.run_in_executor(
+        None, _FileTarget, target, resume, expected_sha256
+    )
+    try:
+        async for chunk in aiter_download(
+            transport, make_spec, out.download, chunk_size
+        ):
+            await loop.run_in_executor(None, out.write, chunk)
+    except BaseException as e:
+        await loop.run_in_executor(None, out.abort, e)
+        raise
+    await loop.run_in_executor(None, out.commit)
+    return out.download.offset
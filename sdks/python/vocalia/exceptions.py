@@ -42,7 +42,7 @@ class RateLimitError(VocalIAError):
     def __init__(
         self,
         message: str = "Rate limit exceeded. Please slow down.",
-        retry_after: Optional[int] = None,
+        retry_after: Optional[float] = None,
         **kwargs,
     ) -> None:
         super().__init__(message, status_code=429, **kwargs)
@@ -52,9 +52,38 @@ class RateLimitError(VocalIAError):
 class APIError(VocalIAError):
     """Raised for general API errors (4xx, 5xx)."""
 
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message, status_code=status_code, response=response)
+        self.retry_after = retry_after
+
+
+class APIConnectionError(VocalIAError):
+    """Raised when the API could not be reached (network error or timeout)."""
+
     pass
 
 
+class CircuitOpenError(VocalIAError):
+    """Raised without sending a request while an endpoint's circuit is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit open; endpoint is failing.",
+        family: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message, **kwargs)
+        self.family = family
+        self.retry_after = retry_after
+
+
 class ValidationError(VocalIAError):
     """Raised when request validation fails (400)."""
 
@@ -92,6 +121,12 @@ class CallError(VocalIAError):
         self.call_id = call_id
 
 
+class DownloadError(VocalIAError):
+    """Raised when a download is incomplete or fails verification."""
+
+    pass
+
+
 class WebhookVerificationError(VocalIAError):
     """Raised when webhook signature verification fails."""
 
@@ -101,3 +136,45 @@ class WebhookVerificationError(VocalIAError):
         **kwargs,
     ) -> None:
         super().__init__(message, **kwargs)
+
+
+def handle_api_error(
+    status_code: int,
+    response: Dict[str, Any],
+    retry_after: Optional[float] = None,
+) -> VocalIAError:
+    """
+    Map an API error response to the matching exception.
+
+    Args:
+        status_code: HTTP status code
+        response: Decoded error body
+        retry_after: Retry-After header value in seconds, if any
+
+    Returns:
+        The exception to raise
+    """
+    # Imported here: retry imports this module
+    from .retry import parse_retry_after
+
+    message = response.get("message") or response.get("error") or "Unknown error"
+    if isinstance(message, dict):
+        # {"error": {"message": ..., "code": ...}}
+        message = message.get("message") or message
+    message = str(message)
+    if retry_after is None and response.get("retry_after") is not None:
+        retry_after = parse_retry_after(str(response["retry_after"]))
+
+    if status_code == 401:
+        return AuthenticationError(message, response=response)
+    if status_code == 429:
+        return RateLimitError(message, retry_after=retry_after, response=response)
+    if status_code == 400:
+        return ValidationError(
+            message, errors=response.get("errors") or [], response=response
+        )
+    if status_code == 404:
+        return NotFoundError(message, response=response)
+    return APIError(
+        message, status_code=status_code, response=response, retry_after=retry_after
+    )
@@ -0,0 +1,160 @@
+"""
+VocalIA Hedging - Duplicate slow idempotent reads to cut tail latency
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .transport import RequestSpec
+
+#: Reads hedged by default: idempotent GETs with small JSON bodies
+HEDGED_OPERATIONS = frozenset(
+    {
+        "telephony.get_call",
+        "telephony.get_transcript",
+        "telephony.get_analytics",
+        "voice.list_personas",
+    }
+)
+
+
+class _LatencyWindow:
+    """Ring buffer of recent latencies with a cached quantile."""
+
+    __slots__ = ("samples", "next", "count", "cached", "stale")
+
+    def __init__(self, size: int) -> None:
+        self.samples = array("d", bytes(8 * size))
+        self.next = 0
+        self.count = 0
+        self.cached: Optional[float] = None
+        self.stale = 0
+
+    def add(self, seconds: float) -> None:
+        self.samples[self.next] = seconds
+        self.next = (self.next + 1) % len(self.samples)
+        self.count = min(self.count + 1, len(self.samples))
+        self.stale += 1
+
+    def quantile(self, q: float, refresh: int) -> float:
+        if self.cached is None or self.stale >= refresh:
+            ordered = sorted(self.samples[: self.count])
+            self.cached = ordered[min(self.count - 1, int(q * self.count))]
+            self.stale = 0
+        return self.cached
+
+
+class HedgingPolicy:
+    """
+    When and how often :class:`~vocalia.AsyncVocalIA` hedges a read.
+
+    A hedged read sends one request and, if no response has arrived after
+    the operation's ``percentile`` latency (measured over its last
+    ``window`` calls), sends a second copy. The first successful response
+    wins and the other request is cancelled. Until ``min_samples`` calls
+    have been measured, ``delay`` is used, or nothing is hedged when it
+    is None.
+
+    Hedges draw from a budget: every read earns ``budget`` tokens (up to
+    ``burst``) and every hedge spends one, so hedges stay under roughly
+    ``budget`` of all reads even when the backend slows down as a whole.
+
+    One instance may be shared by several clients.
+
+    Args:
+        percentile: Latency quantile (0-1) after which a hedge is sent
+        delay: Fixed hedge delay in seconds; used until enough samples
+               exist, or always when ``percentile`` is None
+        min_delay: Lower bound on the hedge delay in seconds
+        min_samples: Calls measured before the percentile is trusted
+        window: Recent calls per operation the percentile is taken over
+        budget: Hedges allowed per read, e.g. 0.05 for 5%
+        burst: Most hedges that may be saved up during quiet periods
+        operations: SDK operations that may be hedged; only GETs are
+
+    Example:
+        client = AsyncVocalIA(hedging=HedgingPolicy(percentile=0.95, budget=0.05))
+    """
+
+    def __init__(
+        self,
+        percentile: Optional[float] = 0.95,
+        delay: Optional[float] = None,
+        min_delay: float = 0.01,
+        min_samples: int = 50,
+        window: int = 256,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        operations: Iterable[str] = HEDGED_OPERATIONS,
+    ) -> None:
+        self.percentile = percentile
+        self.delay = delay
+        self.min_delay = min_delay
+        self.min_samples = min(min_samples, window)
+        self.window = window
+        self.budget = budget
+        self.burst = burst
+        self.operations = frozenset(operations)
+        self._windows: Dict[str, _LatencyWindow] = {}
+        self._tokens = 0.0
+        self._stats = {"reads": 0, "hedged": 0, "hedge_won": 0, "over_budget": 0}
+        self._lock = threading.Lock()
+
+    def applies(self, spec: "RequestSpec[Any]") -> bool:
+        """Whether a request may be hedged."""
+        return (
+            spec.method.upper() == "GET"
+            and spec.content is None
+            and spec.operation in self.operations
+        )
+
+    def hedge_delay(self, operation: str) -> Optional[float]:
+        """
+        Seconds to wait before hedging a new read; None to not hedge it.
+
+        Also credits the read to the hedge budget.
+        """
+        with self._lock:
+            self._stats["reads"] += 1
+            self._tokens = min(self.burst, self._tokens + self.budget)
+            window = self._windows.get(operation)
+            if (
+                self.percentile is not None
+                and window is not None
+                and window.count >= self.min_samples
+            ):
+                delay: Optional[float] = window.quantile(self.percentile, 16)
+            else:
+                delay = self.delay
+        if delay is None:
+            return None
+        return max(delay, self.min_delay)
+
+    def acquire(self) -> bool:
+        """Spend a hedge from the budget; False when it is exhausted."""
+        with self._lock:
+            if self._tokens < 1.0:
+                self._stats["over_budget"] += 1
+                return False
+            self._tokens -= 1.0
+            self._stats["hedged"] += 1
+            return True
+
+    def observe(self, operation: str, seconds: float, hedge_won: bool = False) -> None:
+        """Record the latency of a successful read."""
+        with self._lock:
+            window = self._windows.get(operation)
+            if window is None:
+                window = self._windows[operation] = _LatencyWindow(self.window)
+            window.add(seconds)
+            if hedge_won:
+                self._stats["hedge_won"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of ``reads``, ``hedged``, ``hedge_won`` and ``over_budget``."""
+        with self._lock:
+            return dict(self._stats)
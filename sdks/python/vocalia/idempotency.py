@@ -0,0 +1,43 @@
+"""
+VocalIA Idempotency - Keys that make mutating calls safe to repeat
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from typing import TYPE_CHECKING, Any, Hashable, Optional
+
+if TYPE_CHECKING:
+    from .transport import RequestSpec
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+#: Seconds a completed keyed call is remembered locally
+DEFAULT_IDEMPOTENCY_TTL = 3600.0
+
+#: Completed keyed calls remembered locally before the oldest are dropped
+DEFAULT_IDEMPOTENCY_ENTRIES = 1024
+
+_GENERATED_PREFIX = "vk_"
+
+
+def new_key() -> str:
+    """Random idempotency key for a call the caller did not key."""
+    return f"{_GENERATED_PREFIX}{uuid.uuid4().hex}"
+
+
+def idempotency_key(spec: "RequestSpec[Any]") -> Optional[Hashable]:
+    """
+    Local de-duplication key for ``spec``, or None when it carries no
+    idempotency key or one from :func:`new_key`, which never repeats.
+
+    The request body is part of the key, so reusing a key with different
+    parameters is left for the server to reject instead of being answered
+    with an unrelated earlier result.
+    """
+    key = (spec.headers or {}).get(IDEMPOTENCY_HEADER)
+    if not key or key.startswith(_GENERATED_PREFIX):
+        return None
+    body = json.dumps(spec.json, sort_keys=True, default=str)
+    return (spec.method.upper(), spec.path, key, body)
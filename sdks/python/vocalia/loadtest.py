@@ -0,0 +1,526 @@
+"""
+VocalIA Load Test - Open-loop load generation with AsyncVocalIA
+
+Usage:
+    vocalia loadtest --base-url https://staging.vocalia.ma --poisson 50 --duration 60
+    vocalia loadtest --base-url ... --replay data/events/agency_internal --speed 20
+
+Requests are started on a fixed schedule (Poisson arrivals or recorded
+timestamps) whether or not earlier ones have finished, so a slow server
+shows up as growing latency instead of silently lowering the offered load.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import fnmatch
+import glob
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .client import AsyncVocalIA
+from .metrics import DEFAULT_BUCKETS
+
+# (seconds from start, operation, event fields)
+Arrival = Tuple[float, str, Dict[str, Any]]
+
+Operation = Callable[[AsyncVocalIA, Dict[str, Any]], Awaitable[Any]]
+
+#: SDK calls a scheduled arrival can make, fed with the event's fields
+OPERATIONS: Dict[str, Operation] = {
+    "get_call": lambda c, e: c.telephony.get_call(
+        e.get("call_id") or e.get("callId") or "call_loadtest"
+    ),
+    "list_calls": lambda c, e: c.telephony.list_calls(limit=50),
+    "get_transcript": lambda c, e: c.telephony.get_transcript(
+        e.get("call_id") or e.get("callId") or "call_loadtest"
+    ),
+    "get_analytics": lambda c, e: c.telephony.get_analytics(),
+    "initiate_call": lambda c, e: c.telephony.initiate_call(
+        e.get("to") or "+212600000000"
+    ),
+    "list_personas": lambda c, e: c.voice.list_personas(),
+    "generate_response": lambda c, e: c.voice.generate_response(
+        str(e.get("text") or "Bonjour"), language=e.get("language") or "fr"
+    ),
+    "synthesize": lambda c, e: c.voice.synthesize(str(e.get("text") or "Bonjour")),
+}
+
+#: Event type pattern -> operation, first match wins
+DEFAULT_ROUTES: List[Tuple[str, str]] = [
+    ("voice.*", "generate_response"),
+    ("call.*", "get_call"),
+    ("*", "get_call"),
+]
+
+PERCENTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+# Schedules
+
+
+def poisson_schedule(
+    rate: float,
+    duration: float,
+    mix: Optional[Mapping[str, float]] = None,
+    seed: Optional[int] = None,
+) -> List[Arrival]:
+    """
+    Arrivals of a Poisson process of ``rate`` per second over ``duration``.
+
+    Each arrival picks an operation from ``mix`` (operation -> weight).
+    """
+    if rate <= 0:
+        raise ValueError(f"Poisson rate must be positive, got {rate}")
+    mix = mix or {"get_call": 1.0}
+    _check_operations(mix)
+    if any(weight < 0 for weight in mix.values()) or not sum(mix.values()) > 0:
+        raise ValueError("Operation mix weights must be >= 0 and not all zero")
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    arrivals: List[Arrival] = []
+    t = rng.expovariate(rate)
+    while t < duration:
+        arrivals.append((t, rng.choices(names, weights)[0], {}))
+        t += rng.expovariate(rate)
+    return arrivals
+
+
+def load_events(paths: Iterable[str]) -> List[Tuple[float, str, Dict[str, Any]]]:
+    """
+    Read recorded events from JSONL files, directories or glob patterns.
+
+    Understands both event bus records (``type``, ``metadata.timestamp``,
+    ``payload``) and webhook records (``eventType``, ``timestamp``,
+    ``data``). Returns ``(epoch seconds, event type, fields)`` sorted by
+    time; lines without a timestamp are skipped.
+    """
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            pattern = os.path.join(path, "**", "*.jsonl")
+            files.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            files.extend(sorted(glob.glob(path)) or [path])
+
+    events = []
+    for name in files:
+        with open(name, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                metadata = record.get("metadata") or {}
+                stamp = record.get("timestamp") or metadata.get("timestamp")
+                if not isinstance(stamp, str):
+                    continue
+                try:
+                    at = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+                except ValueError:
+                    continue
+                event_type = (
+                    record.get("type")
+                    or record.get("eventType")
+                    or record.get("event")
+                    or "unknown"
+                )
+                fields = {}
+                for key in ("payload", "data"):
+                    if isinstance(record.get(key), dict):
+                        fields.update(record[key])
+                events.append((at.timestamp(), str(event_type), fields))
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def replay_schedule(
+    events: Sequence[Tuple[float, str, Dict[str, Any]]],
+    speed: float = 1.0,
+    routes: Optional[Sequence[Tuple[str, str]]] = None,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+) -> List[Arrival]:
+    """
+    Turn recorded events into arrivals, ``speed`` times faster than recorded.
+
+    ``routes`` maps event type patterns to operations (first match wins,
+    then :data:`DEFAULT_ROUTES`); ``include``/``exclude`` filter event
+    types by pattern.
+    """
+    if speed <= 0:
+        raise ValueError(f"Replay speed must be positive, got {speed}")
+    routes = list(routes or []) + DEFAULT_ROUTES
+    _check_operations(op for _, op in routes)
+    arrivals: List[Arrival] = []
+    first: Optional[float] = None
+    for at, event_type, fields in events:
+        if include and not any(fnmatch.fnmatch(event_type, p) for p in include):
+            continue
+        if exclude and any(fnmatch.fnmatch(event_type, p) for p in exclude):
+            continue
+        if first is None:
+            first = at
+        operation = next(op for p, op in routes if fnmatch.fnmatch(event_type, p))
+        arrivals.append(((at - first) / speed, operation, fields))
+    return arrivals
+
+
+def _check_operations(names: Iterable[str]) -> None:
+    unknown = sorted(set(names) - set(OPERATIONS))
+    if unknown:
+        raise ValueError(
+            f"Unknown operation(s) {', '.join(unknown)}; "
+            f"choose from {', '.join(sorted(OPERATIONS))}"
+        )
+
+
+# Results
+
+
+def _percentile(ordered: Sequence[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class EndpointStats:
+    """
+    Latencies and errors of one operation.
+
+    ``response`` times run from the *scheduled* start, so time a request
+    spent waiting behind a stalled generator or event loop is counted
+    (the coordinated-omission correction). ``service`` times run from the
+    moment the request was actually started.
+    """
+
+    def __init__(self) -> None:
+        self.response = array("d")
+        self.service = array("d")
+        self.errors: Counter[str] = Counter()
+        self.dropped = 0
+
+    def record(
+        self, scheduled: float, started: float, done: float, error: Optional[str]
+    ) -> None:
+        if error is not None:
+            self.errors[error] += 1
+            return
+        self.response.append(done - scheduled)
+        self.service.append(done - started)
+
+    @property
+    def ok(self) -> int:
+        return len(self.response)
+
+    @property
+    def total(self) -> int:
+        return self.ok + sum(self.errors.values()) + self.dropped
+
+    def summary(self, duration: float) -> Dict[str, Any]:
+        response = sorted(self.response)
+        service = sorted(self.service)
+        failed = sum(self.errors.values()) + self.dropped
+
+        def latencies(ordered: List[float]) -> Dict[str, Optional[float]]:
+            result = {f"p{q * 100:g}": _percentile(ordered, q) for q in PERCENTILES}
+            result["max"] = ordered[-1] if ordered else None
+            return result
+
+        histogram: List[Tuple[Union[float, str], int]] = []
+        cumulative = 0
+        for bound in DEFAULT_BUCKETS:
+            count = 0
+            while cumulative + count < len(response) and (
+                response[cumulative + count] <= bound
+            ):
+                count += 1
+            histogram.append((bound, count))
+            cumulative += count
+        histogram.append(("+Inf", len(response) - cumulative))
+
+        return {
+            "requests": self.total,
+            "ok": self.ok,
+            "errors": dict(self.errors),
+            "dropped": self.dropped,
+            "error_rate": failed / self.total if self.total else 0.0,
+            "throughput": self.ok / duration if duration else 0.0,
+            "response": latencies(response),
+            "service": latencies(service),
+            "histogram": histogram,
+        }
+
+
+class LoadReport:
+    """Results of a load test run, per operation."""
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.scheduled = 0
+        self.duration = 0.0
+        self.max_lag = 0.0
+
+    def stats(self, operation: str) -> EndpointStats:
+        stats = self.endpoints.get(operation)
+        if stats is None:
+            stats = self.endpoints[operation] = EndpointStats()
+        return stats
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "scheduled": self.scheduled,
+            "duration": self.duration,
+            "max_schedule_lag": self.max_lag,
+            "endpoints": {
+                name: stats.summary(self.duration)
+                for name, stats in sorted(self.endpoints.items())
+            },
+        }
+
+    def format(self) -> str:
+        """Human-readable report with a latency histogram per operation."""
+        summary = self.summary()
+        lines = [
+            f"{summary['scheduled']} requests scheduled over "
+            f"{summary['duration']:.1f}s "
+            f"(max schedule lag {summary['max_schedule_lag'] * 1e3:.1f} ms)",
+            "",
+        ]
+        for name, s in summary["endpoints"].items():
+            errors = ", ".join(f"{k} x{v}" for k, v in s["errors"].items()) or "-"
+            lines.append(
+                f"{name}: {s['requests']} requests, {s['ok']} ok, "
+                f"{s['error_rate']:.2%} failed ({errors}; dropped {s['dropped']}), "
+                f"{s['throughput']:.1f} ok/s"
+            )
+            for kind in ("response", "service"):
+                values = "  ".join(
+                    f"{k} {'-' if v is None else format(v * 1e3, '.1f')}"
+                    for k, v in s[kind].items()
+                )
+                lines.append(f"  {kind + ' ms':<12} {values}")
+            peak = max((count for _, count in s["histogram"]), default=0)
+            for bound, count in s["histogram"]:
+                if count:
+                    label = bound if isinstance(bound, str) else f"{bound * 1e3:g}"
+                    bar = "#" * max(1, round(40 * count / peak))
+                    lines.append(f"  <= {label:>7} ms {count:>8} {bar}")
+            lines.append("")
+        return "\n".join(lines)
+
+
+# Runner
+
+
+class LoadTest:
+    """
+    Runs a schedule of arrivals against ``client`` in open loop.
+
+    Each arrival is started at its scheduled time in its own task; the
+    generator never waits for responses. When ``max_in_flight`` requests
+    are outstanding, further arrivals are counted as dropped rather than
+    queued, so the offered load stays honest.
+
+    Args:
+        client: AsyncVocalIA to send requests with
+        schedule: Arrivals from :func:`poisson_schedule` or
+                  :func:`replay_schedule`
+        max_in_flight: Outstanding requests before arrivals are dropped
+    """
+
+    def __init__(
+        self,
+        client: AsyncVocalIA,
+        schedule: Sequence[Arrival],
+        max_in_flight: int = 10_000,
+    ) -> None:
+        self.client = client
+        self.schedule = sorted(schedule, key=lambda a: a[0])
+        self.max_in_flight = max_in_flight
+        self.report = LoadReport()
+
+    async def run(self) -> LoadReport:
+        report = self.report
+        report.scheduled = len(self.schedule)
+        in_flight: "set[asyncio.Task[None]]" = set()
+        start = time.perf_counter()
+        for offset, operation, fields in self.schedule:
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            report.max_lag = max(report.max_lag, time.perf_counter() - scheduled)
+            if len(in_flight) >= self.max_in_flight:
+                report.stats(operation).dropped += 1
+                continue
+            task = asyncio.ensure_future(self._send(operation, fields, scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        report.duration = time.perf_counter() - start
+        return report
+
+    async def _send(
+        self, operation: str, fields: Dict[str, Any], scheduled: float
+    ) -> None:
+        started = time.perf_counter()
+        error = None
+        try:
+            await OPERATIONS[operation](self.client, fields)
+        except Exception as e:
+            status = getattr(e, "status_code", None)
+            error = f"{type(e).__name__} {status}" if status else type(e).__name__
+        self.report.stats(operation).record(
+            scheduled, started, time.perf_counter(), error
+        )
+
+
+# Command line
+
+
+def _pairs(values: Sequence[str], option: str) -> List[Tuple[str, str]]:
+    pairs = []
+    for value in values:
+        key, sep, item = value.partition("=")
+        if not sep or not key or not item:
+            raise ValueError(f"{option} expects KEY=VALUE, got {value!r}")
+        pairs.append((key, item))
+    return pairs
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the ``vocalia loadtest`` options on ``parser``."""
+    parser.add_argument("--base-url", required=True, help="API to load")
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("VOCALIA_API_KEY", "loadtest"),
+        help="API key (default: $VOCALIA_API_KEY)",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--poisson", type=float, metavar="RATE", help="Poisson arrivals per second"
+    )
+    source.add_argument(
+        "--replay",
+        nargs="+",
+        metavar="PATH",
+        help="recorded event JSONL files, directories or globs",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0, help="Poisson run length (s)"
+    )
+    parser.add_argument(
+        "--mix",
+        action="append",
+        default=[],
+        metavar="OP=WEIGHT",
+        help="Poisson operation mix (repeatable, default get_call=1)",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="replay speed-up factor"
+    )
+    parser.add_argument(
+        "--route",
+        action="append",
+        default=[],
+        metavar="TYPE=OP",
+        help="map event types (glob) to an operation (repeatable)",
+    )
+    parser.add_argument(
+        "--include", action="append", metavar="TYPE", help="replay only these types"
+    )
+    parser.add_argument(
+        "--exclude", action="append", metavar="TYPE", help="skip these event types"
+    )
+    parser.add_argument("--max-in-flight", type=int, default=10_000)
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--max-retries", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--http2", action="store_true")
+    parser.add_argument("--seed", type=int, help="Poisson random seed")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="print the schedule and exit"
+    )
+
+
+def build_schedule(args: argparse.Namespace) -> List[Arrival]:
+    """Build the arrival schedule described by parsed command line options."""
+    if args.poisson is not None:
+        mix = {op: float(w) for op, w in _pairs(args.mix, "--mix")}
+        return poisson_schedule(args.poisson, args.duration, mix, args.seed)
+    return replay_schedule(
+        load_events(args.replay),
+        speed=args.speed,
+        routes=_pairs(args.route, "--route"),
+        include=args.include,
+        exclude=args.exclude,
+    )
+
+
+async def _run(args: argparse.Namespace, schedule: List[Arrival]) -> LoadReport:
+    async with AsyncVocalIA(
+        api_key=args.api_key,
+        base_url=args.base_url,
+        timeout=args.timeout,
+        max_retries=args.max_retries,
+        catalog_ttl=None,
+        max_connections=args.max_connections,
+        max_keepalive=args.max_connections,
+        http2=args.http2,
+    ) as client:
+        return await LoadTest(client, schedule, args.max_in_flight).run()
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run ``vocalia loadtest``; returns the process exit code.
+
+    Invalid options or unreadable event files exit with the error on
+    stderr and a non-zero status.
+    """
+    try:
+        schedule = build_schedule(args)
+    except (OSError, ValueError) as e:
+        sys.exit(f"vocalia loadtest: {e}")
+    if not schedule:
+        sys.exit("vocalia loadtest: nothing to send")
+
+    if args.dry_run:
+        counts = Counter(op for _, op, _ in schedule)
+        span = schedule[-1][0]
+        print(f"{len(schedule)} arrivals over {span:.1f}s")
+        for op, count in counts.most_common():
+            print(f"  {op:<20} {count:>8}  ({count / max(span, 1e-9):.2f}/s)")
+        return 0
+
+    report = asyncio.run(_run(args, schedule))
+    print(report.format())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.summary(), f, indent=2)
+    return 0
@@ -0,0 +1,454 @@
+"""
+VocalIA Metrics - Per-request timing and pluggable sinks
+
+Usage:
+    from vocalia import VocalIA
+    from vocalia.metrics import PrometheusSink
+
+    metrics = PrometheusSink()
+    client = VocalIA(metrics=metrics)
+    ...
+    body = metrics.render()  # serve on /metrics
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+#: Phases a request is split into. ``total`` covers the whole call,
+#: including retries and parsing.
+PHASES = (
+    "rate_limit",
+    "pool_wait",
+    "connect",
+    "tls",
+    "ttfb",
+    "download",
+    "backoff",
+    "decode",
+    "validate",
+    "total",
+)
+
+# httpcore trace steps timed from their start to their end
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "receive_response_body": "download",
+}
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class RequestTiming:
+    """
+    Timing of one SDK request, from its first attempt to its parsed result.
+
+    ``intervals`` holds ``(phase, start, end)`` tuples in
+    ``time.perf_counter`` seconds. Network phases come from httpcore's
+    ``trace`` extension: ``pool_wait`` runs until the connection is
+    acquired, ``ttfb`` from sending the request headers to receiving the
+    response headers. Phases repeated by retries are summed in
+    :attr:`phases`.
+
+    Attributes:
+        operation: SDK method, e.g. ``"telephony.get_call"``
+        method: HTTP method
+        status: Status code of the last response, if any
+        error: Exception class name when the request failed
+        attempts: Number of HTTP attempts made
+    """
+
+    __slots__ = (
+        "operation",
+        "method",
+        "status",
+        "error",
+        "attempts",
+        "start",
+        "start_ns",
+        "end",
+        "intervals",
+        "_attempt_start",
+        "_waiting",
+        "_open",
+        "_headers_sent",
+        "_on_close",
+    )
+
+    def __init__(self, operation: str, method: str) -> None:
+        self.operation = operation
+        self.method = method
+        self.status: Optional[int] = None
+        self.error: Optional[str] = None
+        self.attempts = 0
+        self.start = time.perf_counter()
+        self.start_ns = time.time_ns()
+        self.end: Optional[float] = None
+        self.intervals: List[Tuple[str, float, float]] = []
+        self._attempt_start = self.start
+        self._waiting = False
+        self._open: Dict[str, float] = {}
+        self._headers_sent = 0.0
+        self._on_close: Optional[Callable[[], None]] = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to finish (or to now while running)."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """Seconds spent per phase, including ``total``."""
+        totals: Dict[str, float] = {}
+        for phase, start, end in self.intervals:
+            totals[phase] = totals.get(phase, 0.0) + (end - start)
+        totals["total"] = self.duration
+        return totals
+
+    @property
+    def outcome(self) -> str:
+        """Status code as a string, or the error name without a response."""
+        if self.status is not None:
+            return str(self.status)
+        return self.error or "unknown"
+
+    def wall_ns(self, t: float) -> int:
+        """Convert a ``perf_counter`` value to epoch nanoseconds."""
+        return self.start_ns + int((t - self.start) * 1e9)
+
+    def add(self, phase: str, start: float, end: Optional[float] = None) -> None:
+        """Record ``phase`` as running from ``start`` to ``end`` (or now)."""
+        if end is None:
+            end = time.perf_counter()
+        self.intervals.append((phase, start, end))
+
+    def begin_attempt(self) -> None:
+        """Mark the start of an HTTP attempt."""
+        self.attempts += 1
+        self._attempt_start = time.perf_counter()
+        self._waiting = True
+        self._open.clear()
+
+    def close_with(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once the streamed response is closed."""
+        self._on_close = callback
+
+    def trace(self, event: str, info: Dict[str, Any]) -> None:
+        """httpcore ``trace`` extension callback."""
+        now = time.perf_counter()
+        if self._waiting:
+            # The first event of an attempt means a connection was acquired
+            self._waiting = False
+            self.add("pool_wait", self._attempt_start, now)
+
+        # "http11.receive_response_body.complete" -> step, edge
+        step, _, edge = event.partition(".")[2].rpartition(".")
+        if edge == "started":
+            self._open[step] = now
+            if step == "send_request_headers":
+                self._headers_sent = now
+            return
+
+        began = self._open.pop(step, None)
+        if step == "receive_response_headers" and edge == "complete":
+            self.add("ttfb", self._headers_sent, now)
+        elif step in _TRACE_PHASES and began is not None:
+            self.add(_TRACE_PHASES[step], began, now)
+        elif step == "response_closed" and self._on_close is not None:
+            callback, self._on_close = self._on_close, None
+            callback()
+
+    async def atrace(self, event: str, info: Dict[str, Any]) -> None:
+        """Async form of :meth:`trace` for ``httpx.AsyncClient``."""
+        self.trace(event, info)
+
+    def finish(self, error: Optional[BaseException] = None) -> "RequestTiming":
+        """Stop the clock; ``error`` is the exception the request raised."""
+        self.end = time.perf_counter()
+        if error is not None:
+            self.error = type(error).__name__
+        return self
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v * 1000:.2f}ms" for k, v in self.phases.items())
+        return f"RequestTiming({self.operation}, {self.outcome}, {phases})"
+
+
+class MetricsSink(ABC):
+    """
+    Receives a :class:`RequestTiming` for every finished request.
+
+    ``record`` runs on the thread or event loop that made the request, so
+    it should be quick and must not block.
+    """
+
+    @abstractmethod
+    def record(self, timing: RequestTiming) -> None:
+        """Store or export one finished request."""
+
+    def record_circuit(self, family: str, state: str) -> None:
+        """
+        Called when a :class:`~vocalia.circuit.CircuitBreaker` used with
+        this sink changes an endpoint family's state. Ignored by default.
+        """
+
+
+class _Series:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class HistogramSink(MetricsSink):
+    """
+    In-memory latency histograms per operation and phase.
+
+    Observations are counted in fixed ``buckets`` (upper bounds in
+    seconds), so memory does not grow with traffic and quantiles are
+    estimated by interpolating within a bucket. Thread-safe.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._outcomes: Dict[Tuple[str, str], int] = {}
+        self._circuits: Dict[str, str] = {}
+        self._transitions: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming) -> None:
+        phases = timing.phases
+        size = len(self.buckets) + 1
+        with self._lock:
+            for phase, seconds in phases.items():
+                key = (timing.operation, phase)
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = _Series(size)
+                series.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+                series.sum += seconds
+                series.count += 1
+            key = (timing.operation, timing.outcome)
+            self._outcomes[key] = self._outcomes.get(key, 0) + 1
+
+    def record_circuit(self, family: str, state: str) -> None:
+        with self._lock:
+            self._circuits[family] = state
+            key = (family, state)
+            self._transitions[key] = self._transitions.get(key, 0) + 1
+
+    def quantile(self, operation: str, phase: str, q: float) -> Optional[float]:
+        """Estimated ``q`` quantile (0-1) in seconds, or None without data."""
+        with self._lock:
+            series = self._series.get((operation, phase))
+            if series is None or series.count == 0:
+                return None
+            counts = list(series.counts)
+            count = series.count
+        rank = q * count
+        cumulative = 0
+        for i, n in enumerate(counts):
+            if n and cumulative + n >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - cumulative) / n
+            cumulative += n
+        return self.buckets[-1]
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """``{operation: {phase: {count, mean, p50, p90, p99}}}``."""
+        with self._lock:
+            keys = [(key, s.count, s.sum) for key, s in self._series.items()]
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (operation, phase), count, total in sorted(keys):
+            result.setdefault(operation, {})[phase] = {
+                "count": count,
+                "mean": total / count,
+                "p50": self.quantile(operation, phase, 0.5) or 0.0,
+                "p90": self.quantile(operation, phase, 0.9) or 0.0,
+                "p99": self.quantile(operation, phase, 0.99) or 0.0,
+            }
+        return result
+
+    def outcomes(self) -> Dict[Tuple[str, str], int]:
+        """Request counts per ``(operation, status or error)``."""
+        with self._lock:
+            return dict(self._outcomes)
+
+    def circuits(self) -> Dict[str, str]:
+        """Last reported circuit breaker state per endpoint family."""
+        with self._lock:
+            return dict(self._circuits)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._outcomes.clear()
+            self._circuits.clear()
+            self._transitions.clear()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class PrometheusSink(HistogramSink):
+    """
+    :class:`HistogramSink` rendered in the Prometheus text format.
+
+    Exposes ``<namespace>_request_phase_seconds`` (histogram, labelled by
+    ``operation`` and ``phase``) and ``<namespace>_requests_total``
+    (counter, labelled by ``operation`` and ``outcome``). With a circuit
+    breaker, ``<namespace>_circuit_state`` (1 for the current ``state`` of
+    each ``family``) and ``<namespace>_circuit_transitions_total`` are
+    added. Serve
+    :meth:`render` with :attr:`CONTENT_TYPE` from a ``/metrics`` route.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "vocalia"
+    ) -> None:
+        super().__init__(buckets)
+        self.namespace = namespace
+
+    def render(self) -> str:
+        with self._lock:
+            series = [
+                (key, list(s.counts), s.sum, s.count)
+                for key, s in sorted(self._series.items())
+            ]
+            outcomes = sorted(self._outcomes.items())
+            circuits = sorted(self._circuits.items())
+            transitions = sorted(self._transitions.items())
+
+        name = f"{self.namespace}_request_phase_seconds"
+        lines = [
+            f"# HELP {name} Time spent in each phase of a VocalIA SDK request.",
+            f"# TYPE {name} histogram",
+        ]
+        for (operation, phase), counts, total, count in series:
+            labels = f'operation="{_label(operation)}",phase="{_label(phase)}"'
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                le = _number(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total!r}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+
+        name = f"{self.namespace}_requests_total"
+        lines.append(f"# HELP {name} VocalIA SDK requests by outcome.")
+        lines.append(f"# TYPE {name} counter")
+        for (operation, outcome), n in outcomes:
+            lines.append(
+                f'{name}{{operation="{_label(operation)}",'
+                f'outcome="{_label(outcome)}"}} {n}'
+            )
+
+        if circuits:
+            name = f"{self.namespace}_circuit_state"
+            lines.append(f"# HELP {name} VocalIA SDK circuit breaker state.")
+            lines.append(f"# TYPE {name} gauge")
+            for family, current in circuits:
+                for state in ("closed", "half_open", "open"):
+                    lines.append(
+                        f'{name}{{family="{_label(family)}",state="{state}"}} '
+                        f"{int(state == current)}"
+                    )
+            name = f"{self.namespace}_circuit_transitions_total"
+            lines.append(f"# HELP {name} VocalIA SDK circuit breaker state changes.")
+            lines.append(f"# TYPE {name} counter")
+            for (family, state), n in transitions:
+                lines.append(
+                    f'{name}{{family="{_label(family)}",state="{_label(state)}"}} {n}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySink(MetricsSink):
+    """
+    Emits each request as an OpenTelemetry client span with one child span
+    per phase, using the recorded timestamps.
+
+    The span is parented to the span current where the request was made.
+    Requires ``opentelemetry-api`` (``pip install vocalia[otel]``); spans
+    are exported by whatever SDK the application configured.
+
+    Args:
+        tracer: Tracer to use; defaults to ``trace.get_tracer("vocalia")``
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetrySink requires opentelemetry-api. "
+                "Install it with: pip install vocalia[otel]"
+            ) from e
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer("vocalia")
+
+    def record(self, timing: RequestTiming) -> None:
+        trace = self._trace
+        span = self.tracer.start_span(
+            f"vocalia {timing.operation}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=timing.start_ns,
+            attributes={
+                "vocalia.operation": timing.operation,
+                "http.request.method": timing.method,
+                "vocalia.attempts": timing.attempts,
+            },
+        )
+        if timing.status is not None:
+            span.set_attribute("http.response.status_code", timing.status)
+        context = trace.set_span_in_context(span)
+        for phase, start, end in timing.intervals:
+            child = self.tracer.start_span(
+                phase, context=context, start_time=timing.wall_ns(start)
+            )
+            child.end(end_time=timing.wall_ns(end))
+        if timing.error is not None:
+            span.set_attribute("error.type", timing.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, timing.error))
+        end = timing.end if timing.end is not None else time.perf_counter()
+        span.end(end_time=timing.wall_ns(end))
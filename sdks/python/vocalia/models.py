@@ -4,11 +4,12 @@ VocalIA Data Models
 
 from __future__ import annotations
 
+import base64
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, Field
 
 
 class Language(BaseModel):
@@ -65,6 +66,32 @@ class VoiceResponse(BaseModel):
     )
 
 
+class VoiceChunk(BaseModel):
+    """Incremental piece of a streamed voice response."""
+
+    type: str = Field(..., description="Chunk type (text, audio)")
+    index: int = Field(0, description="Position of the chunk in the stream")
+    text: Optional[str] = Field(None, description="Text delta")
+    audio_base64: Optional[str] = Field(None, description="Base64 audio delta")
+    audio_format: Optional[str] = Field(None, description="Audio encoding")
+
+    @property
+    def audio(self) -> bytes:
+        """Decoded audio bytes (empty for text chunks)."""
+        if not self.audio_base64:
+            return b""
+        return base64.b64decode(self.audio_base64)
+
+
+class RealtimeEvent(BaseModel):
+    """Event received on a realtime voice session."""
+
+    type: str = Field(..., description="Event type (transcript.partial, etc.)")
+    text: Optional[str] = Field(None, description="Transcript or response text")
+    audio: Optional[bytes] = Field(None, description="Response audio frame")
+    data: Dict[str, Any] = Field(default_factory=dict, description="Other fields")
+
+
 class CallStatus(str, Enum):
     """Call session status."""
 
@@ -103,8 +130,21 @@ class CallSession(BaseModel):
 class CallEvent(BaseModel):
     """Webhook call event."""
 
-    event_type: str = Field(..., description="Event type")
-    call_id: str = Field(..., description="Call session ID")
+    # Webhook deliveries send "event" and nest the call ID in "data"
+    id: Optional[str] = Field(None, description="Event ID, unique per event")
+    event_type: str = Field(
+        ...,
+        validation_alias=AliasChoices("event_type", "event"),
+        description="Event type",
+    )
+    call_id: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices(
+            "call_id", AliasPath("data", "call_id"), AliasPath("data", "callId")
+        ),
+        description="Call session ID (None for non-call events)",
+    )
+    tenant_id: Optional[str] = Field(None, description="Tenant ID")
     timestamp: datetime = Field(..., description="Event timestamp")
     data: Dict[str, Any] = Field(default_factory=dict, description="Event data")
 
@@ -0,0 +1,290 @@
+"""
+VocalIA Pagination - Lazy, prefetching iteration over paged endpoints
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .transport import AsyncTransport, RequestSpec, SyncTransport
+
+T = TypeVar("T")
+
+
+class Page(NamedTuple):
+    """One page of results and the server's pointer to the next one."""
+
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+
+
+# Builds the request for a page from (offset, server cursor, page size)
+PageSpecFactory = Callable[[int, Optional[str], int], RequestSpec[Page]]
+
+# Where a page was fetched from: (offset, server cursor)
+Position = Tuple[int, Optional[str]]
+
+
+def encode_cursor(offset: int, page_cursor: Optional[str], skip: int) -> str:
+    """Encode a resumable position as an opaque string."""
+    raw = json.dumps({"o": offset, "c": page_cursor, "s": skip}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, Optional[str], int]:
+    """Inverse of :func:`encode_cursor`."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    data = json.loads(base64.urlsafe_b64decode(padded))
+    return int(data["o"]), data.get("c"), int(data["s"])
+
+
+class _PagerState:
+    """
+    Position bookkeeping shared by the sync and async iterators.
+
+    Works with both offset pagination and server cursors: when a page
+    carries ``next_cursor`` it is followed, otherwise the offset advances
+    by the page length.
+    """
+
+    def __init__(
+        self,
+        make_spec: PageSpecFactory,
+        page_size: int,
+        cursor: Optional[str],
+        max_items: Optional[int],
+    ) -> None:
+        self.make_spec = make_spec
+        self.page_size = page_size
+        self.max_items = max_items
+        self.offset, self.page_cursor, self.skip = (
+            decode_cursor(cursor) if cursor else (0, None, 0)
+        )
+        # Position of the page currently being consumed
+        self.current = (self.offset, self.page_cursor)
+        self.yielded_in_page = self.skip
+        self.count = 0
+        self.fetched = 0
+        self.done = False
+
+    @property
+    def position(self) -> Position:
+        return (self.offset, self.page_cursor)
+
+    def next_spec(self) -> RequestSpec[Page]:
+        return self.make_spec(self.offset, self.page_cursor, self.page_size)
+
+    def advance(self, page: Page) -> None:
+        """Move the fetch position past ``page``."""
+        more = page.has_more
+        if page.next_cursor:
+            self.page_cursor = page.next_cursor
+            more = True if more is None else more
+        elif more is None:
+            more = len(page.items) >= self.page_size
+        self.offset += len(page.items)
+        self.fetched += max(0, len(page.items) - self.skip)
+        enough = self.max_items is not None and self.fetched >= self.max_items
+        self.done = not more or not page.items or enough
+
+    def items(self, page: Page, position: Position) -> List[Any]:
+        """Items of ``page`` still to yield, honouring resume skip."""
+        self.current = position
+        items = page.items[self.skip :]
+        self.yielded_in_page = self.skip
+        self.skip = 0
+        return items
+
+    def mark_yielded(self) -> None:
+        self.yielded_in_page += 1
+        self.count += 1
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_items is not None and self.count >= self.max_items
+
+    @property
+    def cursor(self) -> str:
+        offset, page_cursor = self.current
+        return encode_cursor(offset, page_cursor, self.yielded_in_page)
+
+
+class PageIterator(Generic[T]):
+    """
+    Lazily yields items across pages, fetching the next page in a
+    background thread while the current one is consumed.
+
+    ``cursor`` identifies the position after the last yielded item; save
+    it and pass it back as ``cursor=`` to resume after a restart.
+    """
+
+    def __init__(
+        self,
+        transport: SyncTransport,
+        make_spec: PageSpecFactory,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> None:
+        self._transport = transport
+        self._state = _PagerState(make_spec, page_size, cursor, max_items)
+        self._prefetch = prefetch
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._iterator: Optional[Iterator[T]] = None
+
+    @property
+    def cursor(self) -> str:
+        """Resumable position after the last yielded item."""
+        return self._state.cursor
+
+    def __iter__(self) -> "PageIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._iterator is None:
+            self._iterator = self._iter_items()
+        return next(self._iterator)
+
+    def _fetch(self) -> Tuple["Future[Page]", Position]:
+        spec = self._state.next_spec()
+        position = self._state.position
+        if self._executor is None:
+            future: "Future[Page]" = Future()
+            future.set_result(self._transport.call(spec))
+        else:
+            future = self._executor.submit(self._transport.call, spec)
+        return future, position
+
+    def _iter_items(self) -> Iterator[T]:
+        state = self._state
+        if self._prefetch:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="vocalia-page")
+        try:
+            pending: Optional[Tuple["Future[Page]", Position]] = self._fetch()
+            while pending is not None:
+                future, position = pending
+                page = future.result()
+                state.advance(page)
+                pending = None
+                if self._prefetch and not state.done:
+                    pending = self._fetch()
+                for item in state.items(page, position):
+                    state.mark_yielded()
+                    yield item
+                    if state.exhausted:
+                        return
+                if pending is None and not state.done:
+                    pending = self._fetch()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop prefetching and release the worker thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class AsyncPageIterator(Generic[T]):
+    """
+    Async counterpart of :class:`PageIterator`; the next page is fetched
+    in a background task while the current one is consumed.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        make_spec: PageSpecFactory,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> None:
+        self._transport = transport
+        self._state = _PagerState(make_spec, page_size, cursor, max_items)
+        self._prefetch = prefetch
+        self._pending: Optional["asyncio.Future[Page]"] = None
+        self._iterator: Optional[AsyncGenerator[T, None]] = None
+
+    @property
+    def cursor(self) -> str:
+        """Resumable position after the last yielded item."""
+        return self._state.cursor
+
+    def __aiter__(self) -> "AsyncPageIterator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        if self._iterator is None:
+            self._iterator = self._iter_items()
+        return await self._iterator.__anext__()
+
+    def _fetch(self) -> Tuple["asyncio.Future[Page]", Position]:
+        spec = self._state.next_spec()
+        position = self._state.position
+        self._pending = asyncio.ensure_future(self._transport.call(spec))
+        return self._pending, position
+
+    async def _iter_items(self) -> AsyncGenerator[T, None]:
+        state = self._state
+        try:
+            pending: Optional[Tuple["asyncio.Future[Page]", Position]] = (
+                self._fetch()
+            )
+            while pending is not None:
+                future, position = pending
+                page = await future
+                state.advance(page)
+                pending = None
+                if self._prefetch and not state.done:
+                    pending = self._fetch()
+                for item in state.items(page, position):
+                    state.mark_yielded()
+                    yield item
+                    if state.exhausted:
+                        return
+                if pending is None and not state.done:
+                    pending = self._fetch()
+        finally:
+            await self._cancel_pending()
+
+    async def _cancel_pending(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None and not pending.done():
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """
+        Stop iterating and cancel any in-flight prefetch.
+
+        Call it after leaving an ``async for`` early, or the prefetch keeps
+        running until the iterator is garbage collected.
+        """
+        if self._iterator is None:
+            # Never started: make later iteration end at once
+            self._iterator = self._iter_items()
+        await self._iterator.aclose()
+        await self._cancel_pending()
+
+    def __del__(self) -> None:
+        pending = self._pending
+        if pending is not None and not pending.done():
+            pending.cancel()
@@ -0,0 +1,188 @@
+"""
+VocalIA Rate Limiting - Client-side adaptive throttling
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Group an API path into its endpoint family.
+
+    ``/v1/voice/generate`` -> ``voice``,
+    ``/v1/telephony/calls/abc`` -> ``telephony``.
+    """
+    parts = [p for p in path.split("?", 1)[0].split("/") if p]
+    if len(parts) >= 2 and parts[0].startswith("v") and parts[0][1:].isdigit():
+        return parts[1]
+    return parts[0] if parts else "default"
+
+
+class TokenBucket:
+    """
+    Token bucket whose refill rate can be changed while in use.
+
+    Callers reserve a token and get back how long to wait for it, so
+    waiters are served in arrival order and nobody sleeps while holding
+    the lock. Not thread-safe on its own; AdaptiveRateLimiter serialises
+    access.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token; return seconds to wait until it is available."""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def pause(self, now: float, seconds: float) -> None:
+        """Hold back new tokens for ``seconds``."""
+        self._refill(now)
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-endpoint-family token buckets with AIMD rate adjustment.
+
+    Each family (``voice``, ``telephony``, ...) gets its own bucket. A
+    RateLimitError halves that family's rate (multiplicative decrease) and
+    honours Retry-After; every ``increase_after`` consecutive successes add
+    ``increase_step`` requests/second back, up to ``max_rate``.
+
+    One instance may be shared by several clients, threads and asyncio
+    tasks: the state is guarded by a lock that is never held while
+    waiting.
+
+    Args:
+        rate: Initial requests per second for each family
+        burst: Bucket capacity (defaults to ``rate``)
+        min_rate: Floor for the adapted rate
+        max_rate: Ceiling for the adapted rate (defaults to ``rate``)
+        decrease_factor: Rate multiplier applied on a 429
+        increase_step: Rate added after a run of successes
+                       (defaults to 5% of ``max_rate``)
+        increase_after: Successes needed before each increase
+        decrease_cooldown: Seconds after a decrease during which further
+                           429s (typically from the same burst) only
+                           pause the bucket
+        family_rates: Initial rate overrides per family
+
+    Example:
+        limiter = AdaptiveRateLimiter(rate=20, family_rates={"telephony": 5})
+        sync_client = VocalIA(rate_limiter=limiter)
+        async_client = AsyncVocalIA(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+        increase_after: int = 20,
+        decrease_cooldown: float = 1.0,
+        family_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.increase_after = increase_after
+        self.decrease_cooldown = decrease_cooldown
+        self.family_rates = dict(family_rates or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._ceilings: Dict[str, float] = {}
+        self._bursts: Dict[str, float] = {}
+        self._streaks: Dict[str, int] = {}
+        self._decreased_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, family: str) -> TokenBucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            rate = self.family_rates.get(family, self.rate)
+            bucket = TokenBucket(rate, self.burst or max(1.0, rate))
+            self._buckets[family] = bucket
+            self._ceilings[family] = self.max_rate or rate
+            self._bursts[family] = bucket.burst
+            self._streaks[family] = 0
+        return bucket
+
+    def reserve(self, path: str) -> float:
+        """Reserve a slot for a request to ``path``; return seconds to wait."""
+        with self._lock:
+            return self._bucket(endpoint_family(path)).reserve(time.monotonic())
+
+    def acquire(self, path: str) -> None:
+        """Block the calling thread until a request to ``path`` may be sent."""
+        wait = self.reserve(path)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, path: str) -> None:
+        """Wait, without blocking the event loop, until ``path`` may be sent."""
+        wait = self.reserve(path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self, path: str, retry_after: Optional[float] = None) -> None:
+        """Tighten the family's rate after a 429."""
+        family = endpoint_family(path)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(family)
+            self._streaks[family] = 0
+            last = self._decreased_at.get(family)
+            if last is None or now - last >= self.decrease_cooldown:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+                self._rescale_burst(family, bucket)
+                self._decreased_at[family] = now
+            if retry_after:
+                bucket.pause(now, retry_after)
+
+    def on_success(self, path: str) -> None:
+        """Count a success; loosen the family's rate after a run of them."""
+        family = endpoint_family(path)
+        with self._lock:
+            bucket = self._bucket(family)
+            ceiling = self._ceilings[family]
+            if bucket.rate >= ceiling:
+                return
+            self._streaks[family] += 1
+            if self._streaks[family] >= self.increase_after:
+                step = self.increase_step or ceiling * 0.05
+                bucket.rate = min(ceiling, bucket.rate + step)
+                self._rescale_burst(family, bucket)
+                self._streaks[family] = 0
+
+    def _rescale_burst(self, family: str, bucket: TokenBucket) -> None:
+        # Burst shrinks with the rate so a throttled family cannot dump
+        # its full original burst after an idle period.
+        scale = bucket.rate / self._ceilings[family]
+        bucket.burst = max(1.0, self._bursts[family] * scale)
+
+    def rates(self) -> Dict[str, float]:
+        """Current requests-per-second rate of each family seen so far."""
+        with self._lock:
+            return {family: b.rate for family, b in self._buckets.items()}
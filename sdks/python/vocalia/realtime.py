@@ -0,0 +1,580 @@
+"""
+VocalIA Realtime - Full-duplex voice sessions over WebSocket
+
+A realtime session keeps one WebSocket open for a whole conversation.
+Audio frames go up as binary messages; the server answers with JSON events:
+
+    transcript.partial / transcript.final   caller speech recognition
+    response.text                           incremental response text
+    response.audio                          response audio (or binary frames)
+    response.done                           end of the assistant turn
+    input.speech_started                    caller started talking (barge-in)
+    error                                   session error
+
+Control messages sent by the client use the same ``{"type": ...}`` shape.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+import httpx
+
+from .codec import JSONCodec
+from .exceptions import APIError, VocalIAError
+from .models import RealtimeEvent
+from .transport import AsyncTransport, SyncTransport
+
+REALTIME_PATH = "/v1/voice/realtime"
+
+_RESPONSE_EVENTS = {"response.text", "response.audio"}
+
+
+def _realtime_url(
+    http_client: Union[httpx.Client, httpx.AsyncClient], params: Dict[str, Any]
+) -> str:
+    url = httpx.URL(str(http_client.base_url).rstrip("/") + REALTIME_PATH)
+    scheme = "wss" if url.scheme == "https" else "ws"
+    return str(url.copy_with(scheme=scheme, params=params))
+
+
+def _realtime_headers(
+    http_client: Union[httpx.Client, httpx.AsyncClient]
+) -> Dict[str, str]:
+    headers = {}
+    for name in ("Authorization", "User-Agent"):
+        if name in http_client.headers:
+            headers[name] = http_client.headers[name]
+    return headers
+
+
+def _control(event_type: str, **fields: Any) -> str:
+    return json.dumps({"type": event_type, **fields})
+
+
+def _decode_event(message: Union[str, bytes], codec: JSONCodec) -> RealtimeEvent:
+    if isinstance(message, (bytes, bytearray)):
+        return RealtimeEvent(type="response.audio", text=None, audio=bytes(message))
+
+    data = codec.loads(message)
+    event_type = data.pop("type", "unknown")
+    text = data.pop("text", None)
+    if text is None:
+        text = data.pop("delta", None)
+    audio = data.pop("audio_base64", None)
+    return RealtimeEvent(
+        type=event_type,
+        text=text,
+        audio=base64.b64decode(audio) if audio else None,
+        data=data,
+    )
+
+
+def _raise_for_event(event: RealtimeEvent) -> None:
+    if event.type == "error":
+        raise APIError(
+            event.text or event.data.get("message") or "Realtime session error",
+            status_code=event.data.get("status_code"),
+            response=event.data,
+        )
+
+
+class FramePacer:
+    """
+    Spaces outgoing audio frames at their real-time rate.
+
+    Frames read from a file or a jitter buffer would otherwise be sent in
+    a burst the server has to absorb. When the sender falls behind by more
+    than ``max_lag_frames`` the schedule is reset instead of bursting to
+    catch up.
+    """
+
+    def __init__(self, frame_ms: float, max_lag_frames: int = 5) -> None:
+        self.interval = frame_ms / 1000.0
+        self.max_lag = self.interval * max_lag_frames
+        self._next: Optional[float] = None
+
+    def delay(self, now: float) -> float:
+        """Seconds to wait before sending the next frame."""
+        if self._next is None or now - self._next > self.max_lag:
+            self._next = now
+        wait = max(0.0, self._next - now)
+        self._next += self.interval
+        return wait
+
+    def reset(self) -> None:
+        self._next = None
+
+
+def _load_websockets_async() -> Any:
+    try:
+        from websockets.asyncio.client import connect
+    except ImportError:  # websockets < 13
+        from websockets.client import connect  # type: ignore[no-redef,attr-defined]
+
+        return connect, "extra_headers"
+    return connect, "additional_headers"
+
+
+def _load_websockets_sync() -> Any:
+    from websockets.sync.client import connect
+
+    return connect
+
+
+class AsyncRealtimeSession:
+    """
+    Full-duplex realtime voice session for asyncio.
+
+    Outgoing audio goes through a bounded queue: :meth:`send_audio` waits
+    when it is full, so a stalled network slows the producer instead of
+    growing memory. Incoming events use a bounded queue too; a slow
+    consumer stops the socket reader, which pushes back on the server.
+
+    Usage:
+        async with client.voice.realtime(persona="DENTAL", language="fr") as s:
+            await s.send_audio(frame)
+            async for event in s:
+                if event.type == "response.audio":
+                    play(event.audio)
+
+    Args:
+        transport: Transport of the owning client
+        persona: Persona key for the AI agent
+        language: Language code
+        audio_format: Encoding of uploaded frames (pcm16, mulaw, opus)
+        sample_rate: Sample rate of uploaded frames in Hz
+        frame_ms: Duration of one uploaded frame, used for pacing
+        pace: Send frames no faster than real time
+        send_queue_size: Max frames buffered for upload
+        receive_queue_size: Max events buffered for the consumer
+        auto_barge_in: Drop buffered response audio when the server
+                       reports that the caller started talking
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        audio_format: str = "pcm16",
+        sample_rate: int = 16000,
+        frame_ms: float = 20.0,
+        pace: bool = True,
+        send_queue_size: int = 50,
+        receive_queue_size: int = 200,
+        auto_barge_in: bool = True,
+    ) -> None:
+        self._transport = transport
+        self.persona = persona
+        self.language = language
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.auto_barge_in = auto_barge_in
+        self._pacer = FramePacer(frame_ms) if pace else None
+        self._send_queue_size = send_queue_size
+        self._receive_queue_size = receive_queue_size
+        self._send_queue: "asyncio.Queue[Optional[Union[bytes, str]]]"
+        self._receive_queue: "asyncio.Queue[Optional[RealtimeEvent]]"
+        self._ws: Any = None
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    async def connect(self) -> "AsyncRealtimeSession":
+        """Open the WebSocket and start the send/receive loops."""
+        # Queues are created here so they bind to the running event loop
+        self._send_queue = asyncio.Queue(self._send_queue_size)
+        self._receive_queue = asyncio.Queue(self._receive_queue_size)
+        connect, header_kwarg = _load_websockets_async()
+        http_client = self._transport.http_client
+        self._ws = await connect(
+            _realtime_url(
+                http_client, {"persona": self.persona, "language": self.language}
+            ),
+            **{header_kwarg: _realtime_headers(http_client)},
+        )
+        await self._ws.send(
+            _control(
+                "session.start",
+                persona=self.persona,
+                language=self.language,
+                audio_format=self.audio_format,
+                sample_rate=self.sample_rate,
+            )
+        )
+        self._tasks = [
+            asyncio.ensure_future(self._send_loop()),
+            asyncio.ensure_future(self._receive_loop()),
+        ]
+        return self
+
+    async def send_audio(self, frame: bytes) -> None:
+        """Queue an audio frame, waiting while the send queue is full."""
+        self._check_open()
+        await self._send_queue.put(bytes(frame))
+
+    def try_send_audio(self, frame: bytes) -> bool:
+        """Queue an audio frame without waiting; False if the queue is full."""
+        self._check_open()
+        try:
+            self._send_queue.put_nowait(bytes(frame))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def commit(self) -> None:
+        """Signal the end of the caller's utterance, after any queued audio."""
+        self._check_open()
+        await self._send_queue.put(_control("input.commit"))
+
+    async def interrupt(self) -> None:
+        """
+        Barge in: cancel the current assistant turn.
+
+        Sent immediately, ahead of any queued audio, and buffered response
+        events are discarded so playback can stop at once.
+        """
+        self._check_open()
+        self._drop_pending_response()
+        await self._ws.send(_control("response.cancel"))
+
+    async def receive(self) -> Optional[RealtimeEvent]:
+        """Next server event, or None once the session has ended."""
+        event = await self._receive_queue.get()
+        if event is None:
+            self._receive_queue.put_nowait(None)
+            if self._error is not None:
+                raise self._error
+        return event
+
+    def __aiter__(self) -> AsyncIterator[RealtimeEvent]:
+        return self._iter_events()
+
+    async def _iter_events(self) -> AsyncIterator[RealtimeEvent]:
+        while True:
+            event = await self.receive()
+            if event is None:
+                return
+            yield event
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush queued audio, end the session and close the socket.
+
+        If the audio and the end-of-session message cannot be sent within
+        ``timeout`` seconds (a stalled connection), the rest is dropped.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._ws is not None:
+            sender = self._tasks[0]
+            try:
+                await asyncio.wait_for(self._finish(sender), timeout)
+            except asyncio.TimeoutError:
+                sender.cancel()
+            await self._ws.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _finish(self, sender: "asyncio.Task[None]") -> None:
+        if not sender.done():
+            await self._send_queue.put(None)
+        await asyncio.gather(sender, return_exceptions=True)
+        try:
+            await self._ws.send(_control("session.end"))
+        except Exception:
+            pass
+
+    async def __aenter__(self) -> "AsyncRealtimeSession":
+        return await self.connect()
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def _check_open(self) -> None:
+        if self._ws is None or self._closed:
+            raise VocalIAError("Realtime session is not open")
+        if self._error is not None:
+            raise self._error
+
+    def _drop_pending_response(self) -> None:
+        kept = []
+        while not self._receive_queue.empty():
+            event = self._receive_queue.get_nowait()
+            if event is None or event.type not in _RESPONSE_EVENTS:
+                kept.append(event)
+        for event in kept:
+            self._receive_queue.put_nowait(event)
+
+    async def _send_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                frame = await self._send_queue.get()
+                if frame is None:
+                    return
+                if isinstance(frame, bytes) and self._pacer is not None:
+                    wait = self._pacer.delay(loop.time())
+                    if wait:
+                        await asyncio.sleep(wait)
+                await self._ws.send(frame)
+        except Exception as e:
+            self._error = e
+
+    async def _receive_loop(self) -> None:
+        try:
+            async for message in self._ws:
+                event = _decode_event(message, self._transport.codec)
+                if event.type == "input.speech_started" and self.auto_barge_in:
+                    self._drop_pending_response()
+                _raise_for_event(event)
+                await self._receive_queue.put(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error = e
+        finally:
+            self._end_receive()
+
+    def _end_receive(self) -> None:
+        while True:
+            try:
+                self._receive_queue.put_nowait(None)
+                return
+            except asyncio.QueueFull:
+                self._receive_queue.get_nowait()
+
+
+class RealtimeSession:
+    """
+    Full-duplex realtime voice session for threaded code.
+
+    Same protocol, queues and pacing as :class:`AsyncRealtimeSession`,
+    driven by a sender and a receiver thread.
+
+    Usage:
+        with client.voice.realtime(persona="DENTAL", language="fr") as s:
+            s.send_audio(frame)
+            for event in s:
+                ...
+    """
+
+    def __init__(
+        self,
+        transport: SyncTransport,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        audio_format: str = "pcm16",
+        sample_rate: int = 16000,
+        frame_ms: float = 20.0,
+        pace: bool = True,
+        send_queue_size: int = 50,
+        receive_queue_size: int = 200,
+        auto_barge_in: bool = True,
+    ) -> None:
+        self._transport = transport
+        self.persona = persona
+        self.language = language
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.auto_barge_in = auto_barge_in
+        self._pacer = FramePacer(frame_ms) if pace else None
+        self._send_queue: "queue.Queue[Optional[Union[bytes, str]]]" = (
+            queue.Queue(send_queue_size)
+        )
+        self._receive_queue: "queue.Queue[Optional[RealtimeEvent]]" = queue.Queue(
+            receive_queue_size
+        )
+        self._receive_lock = threading.Lock()
+        # Signalled whenever the receive queue gains room
+        self._receive_space = threading.Condition(self._receive_lock)
+        self._ws: Any = None
+        self._threads: List[threading.Thread] = []
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def connect(self) -> "RealtimeSession":
+        """Open the WebSocket and start the send/receive threads."""
+        connect = _load_websockets_sync()
+        http_client = self._transport.http_client
+        self._ws = connect(
+            _realtime_url(
+                http_client, {"persona": self.persona, "language": self.language}
+            ),
+            additional_headers=_realtime_headers(http_client),
+        )
+        self._ws.send(
+            _control(
+                "session.start",
+                persona=self.persona,
+                language=self.language,
+                audio_format=self.audio_format,
+                sample_rate=self.sample_rate,
+            )
+        )
+        self._threads = [
+            threading.Thread(target=self._send_loop, daemon=True),
+            threading.Thread(target=self._receive_loop, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def send_audio(self, frame: bytes, timeout: Optional[float] = None) -> None:
+        """Queue an audio frame, blocking while the send queue is full."""
+        self._check_open()
+        self._send_queue.put(bytes(frame), timeout=timeout)
+
+    def try_send_audio(self, frame: bytes) -> bool:
+        """Queue an audio frame without blocking; False if the queue is full."""
+        self._check_open()
+        try:
+            self._send_queue.put_nowait(bytes(frame))
+        except queue.Full:
+            return False
+        return True
+
+    def commit(self) -> None:
+        """Signal the end of the caller's utterance, after any queued audio."""
+        self._check_open()
+        self._send_queue.put(_control("input.commit"))
+
+    def interrupt(self) -> None:
+        """Barge in: cancel the current assistant turn."""
+        self._check_open()
+        self._drop_pending_response()
+        self._ws.send(_control("response.cancel"))
+
+    def receive(self, timeout: Optional[float] = None) -> Optional[RealtimeEvent]:
+        """Next server event, or None once the session has ended."""
+        event = self._receive_queue.get(timeout=timeout)
+        with self._receive_space:
+            self._receive_space.notify()
+        if event is None:
+            self._receive_queue.put(None)
+            if self._error is not None:
+                raise self._error
+        return event
+
+    def __iter__(self) -> Iterator[RealtimeEvent]:
+        while True:
+            event = self.receive()
+            if event is None:
+                return
+            yield event
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush queued audio, end the session and close the socket.
+
+        If the queued audio cannot be sent within ``timeout`` seconds
+        (a stalled connection), the rest is dropped.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        with self._receive_space:
+            self._receive_space.notify_all()
+        if self._ws is not None:
+            sender = self._threads[0]
+            deadline = time.monotonic() + timeout
+            try:
+                if sender.is_alive():
+                    self._send_queue.put(None, timeout=timeout)
+                sender.join(max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                pass
+            if not sender.is_alive():
+                try:
+                    self._ws.send(_control("session.end"))
+                except Exception:
+                    pass
+            # Closing the socket also fails a send stuck in the sender
+            self._ws.close()
+            self._threads[1].join(timeout=5)
+
+    def __enter__(self) -> "RealtimeSession":
+        return self.connect()
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _check_open(self) -> None:
+        if self._ws is None or self._closed:
+            raise VocalIAError("Realtime session is not open")
+        if self._error is not None:
+            raise self._error
+
+    def _drop_pending_response(self) -> None:
+        with self._receive_lock:
+            kept = []
+            while True:
+                try:
+                    event = self._receive_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None or event.type not in _RESPONSE_EVENTS:
+                    kept.append(event)
+            for event in kept:
+                self._receive_queue.put_nowait(event)
+            self._receive_space.notify_all()
+
+    def _put_event(self, event: RealtimeEvent) -> None:
+        # Puts happen under the lock so a concurrent barge-in drain cannot
+        # overfill the queue; waiting on the condition releases it, so
+        # interrupt() is never blocked behind a slow consumer. The event is
+        # dropped once the session is closed or has failed.
+        with self._receive_space:
+            while True:
+                try:
+                    self._receive_queue.put_nowait(event)
+                    return
+                except queue.Full:
+                    pass
+                if self._closed or self._error is not None:
+                    return
+                self._receive_space.wait()
+
+    def _send_loop(self) -> None:
+        try:
+            while True:
+                frame = self._send_queue.get()
+                if frame is None:
+                    return
+                if isinstance(frame, bytes) and self._pacer is not None:
+                    wait = self._pacer.delay(time.monotonic())
+                    if wait:
+                        time.sleep(wait)
+                self._ws.send(frame)
+        except Exception as e:
+            self._error = e
+            with self._receive_space:
+                self._receive_space.notify_all()
+
+    def _receive_loop(self) -> None:
+        try:
+            for message in self._ws:
+                event = _decode_event(message, self._transport.codec)
+                if event.type == "input.speech_started" and self.auto_barge_in:
+                    self._drop_pending_response()
+                _raise_for_event(event)
+                self._put_event(event)
+        except Exception as e:
+            self._error = e
+        finally:
+            with self._receive_lock:
+                while True:
+                    try:
+                        self._receive_queue.put_nowait(None)
+                        break
+                    except queue.Full:
+                        self._receive_queue.get_nowait()
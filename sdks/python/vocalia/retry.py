@@ -0,0 +1,111 @@
+"""
+VocalIA Retry - Backoff policy for transient API failures
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional, Union
+
+import httpx
+
+from .exceptions import APIError, RateLimitError, VocalIAError
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Returns None when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Only idempotent requests are retried: safe HTTP methods, plus any
+    request explicitly marked idempotent. Delays use exponential backoff
+    with full jitter, or the server's Retry-After when it sends one. No
+    retry is attempted once it would push the call past ``total_budget``.
+
+    Args:
+        max_retries: Retries after the first attempt (0 disables retrying)
+        backoff_base: Backoff ceiling for the first retry, in seconds
+        backoff_max: Upper bound of the backoff ceiling, in seconds
+        total_budget: Max seconds spent on one call, retries included
+        retry_statuses: HTTP statuses considered transient
+        respect_retry_after: Wait for the server's Retry-After when present
+
+    Example:
+        client = VocalIA(retry=RetryPolicy(max_retries=5, total_budget=60))
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    total_budget: float = 30.0
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({408, 429, 500, 502, 503, 504})
+    )
+    respect_retry_after: bool = True
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt + 1``."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def is_retryable(self, error: Union[VocalIAError, httpx.TransportError]) -> bool:
+        """Whether ``error`` is worth another attempt."""
+        if isinstance(error, httpx.TransportError):
+            return True
+        return error.status_code in self.retry_statuses
+
+    def next_delay(
+        self,
+        idempotent: bool,
+        attempt: int,
+        elapsed: float,
+        error: Union[VocalIAError, httpx.TransportError],
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying, or None to give up.
+
+        Args:
+            idempotent: Whether the request may safely be sent again
+            attempt: Number of retries already made
+            elapsed: Seconds spent on the call so far
+            error: Failure of the last attempt
+        """
+        if not idempotent or attempt >= self.max_retries:
+            return None
+        if not self.is_retryable(error):
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and isinstance(error, (RateLimitError, APIError)):
+            if error.retry_after is not None:
+                delay = error.retry_after
+
+        if elapsed + delay > self.total_budget:
+            return None
+        return delay
@@ -0,0 +1,555 @@
+"""
+VocalIA Streaming - Incremental voice responses and synthesized audio
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import ssl
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+from .exceptions import APIError
+from .models import VoiceChunk, VoiceResponse
+from .transport import AsyncTransport, RequestSpec, SyncTransport
+
+STREAM_ACCEPT = "text/event-stream, application/x-ndjson"
+
+_SSE_FIELDS = ("data:", "event:", "id:", "retry:", ":")
+_FINAL_TYPES = {"done", "final", "response"}
+
+
+class EventDecoder:
+    """
+    Line-oriented decoder for Server-Sent Events and NDJSON bodies.
+
+    The format is taken from the response ``Content-Type`` when it is
+    known, otherwise it is sniffed from the first non-empty line. Payloads
+    whose JSON value is not an object (keep-alives such as ``"ping"``)
+    are skipped.
+    """
+
+    def __init__(
+        self, content_type: str = "", loads: Callable[[str], Any] = json.loads
+    ) -> None:
+        self._loads = loads
+        self._sse: Optional[bool] = None
+        if "event-stream" in content_type:
+            self._sse = True
+        elif "json" in content_type:
+            self._sse = False
+        self._event: Optional[str] = None
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[Dict[str, Any]]:
+        """Feed one line (without terminator); return a complete event or None."""
+        if self._sse is None:
+            if not line.strip():
+                return None
+            self._sse = line.startswith(_SSE_FIELDS)
+
+        if not self._sse:
+            line = line.strip()
+            return self._decode(line) if line else None
+
+        if not line:
+            return self.flush()
+        if line.startswith(":"):
+            return None
+
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        return None
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Dispatch any buffered SSE event."""
+        if not self._data:
+            self._event = None
+            return None
+
+        data = "\n".join(self._data)
+        event_name = self._event
+        self._data = []
+        self._event = None
+
+        if data == "[DONE]":
+            return None
+        event = self._decode(data)
+        if event is not None and event_name and "type" not in event:
+            event["type"] = event_name
+        return event
+
+    def _decode(self, data: str) -> Optional[Dict[str, Any]]:
+        event = self._loads(data)
+        return event if isinstance(event, dict) else None
+
+
+class ResponseAssembler:
+    """
+    Turns decoded stream events into :class:`VoiceChunk` objects and builds
+    the final :class:`VoiceResponse`.
+
+    Shared by the sync and async stream wrappers so both interpret the
+    wire format identically.
+    """
+
+    def __init__(
+        self,
+        persona: str,
+        language: str,
+        content_type: str = "",
+        loads: Callable[[str], Any] = json.loads,
+    ) -> None:
+        self._persona = persona
+        self._language = language
+        self._decoder = EventDecoder(content_type, loads)
+        self._text: List[str] = []
+        self._index = 0
+        self.final: Optional[VoiceResponse] = None
+
+    def feed_line(self, line: str) -> List[VoiceChunk]:
+        """Feed one body line and return the chunks it completes."""
+        return self._add(self._decoder.feed(line))
+
+    def finish(self) -> List[VoiceChunk]:
+        """Flush the decoder at end of body and return any trailing chunks."""
+        return self._add(self._decoder.flush())
+
+    def response(self) -> VoiceResponse:
+        """Final response, rebuilt from the text deltas if the server sent none."""
+        if self.final is None:
+            self.final = VoiceResponse.model_validate(
+                {
+                    "text": "".join(self._text),
+                    "persona": self._persona,
+                    "language": self._language,
+                }
+            )
+        return self.final
+
+    def _add(self, event: Optional[Dict[str, Any]]) -> List[VoiceChunk]:
+        if event is None:
+            return []
+
+        event_type = event.get("type")
+        if event_type == "error":
+            raise APIError(
+                event.get("message") or event.get("error") or "Stream error",
+                status_code=event.get("status_code"),
+                response=event,
+            )
+        if event_type in _FINAL_TYPES:
+            data = event.get("response")
+            if data is None:
+                data = {k: v for k, v in event.items() if k != "type"}
+            data.setdefault("text", "".join(self._text))
+            data.setdefault("persona", self._persona)
+            data.setdefault("language", self._language)
+            self.final = VoiceResponse(**data)
+            return []
+
+        text = event.get("delta", event.get("text"))
+        audio = event.get("audio_base64", event.get("audio"))
+        if event_type is None:
+            event_type = "audio" if audio and text is None else "text"
+
+        chunk = VoiceChunk(
+            type=event_type,
+            index=self._index,
+            text=text,
+            audio_base64=audio,
+            audio_format=event.get("audio_format", event.get("format")),
+        )
+        self._index += 1
+        if text:
+            self._text.append(text)
+        return [chunk]
+
+
+class VoiceResponseStream:
+    """
+    Iterator over the chunks of a streamed ``generate_response`` call.
+
+    The request is sent on first iteration. Once the stream is exhausted,
+    :attr:`response` holds the final :class:`VoiceResponse`.
+
+    Usage:
+        with client.voice.stream_response("Bonjour") as stream:
+            for chunk in stream:
+                if chunk.text:
+                    tts.feed(chunk.text)
+            print(stream.response.text)
+    """
+
+    def __init__(
+        self,
+        transport: SyncTransport,
+        spec: RequestSpec[Any],
+        persona: str,
+        language: str,
+    ) -> None:
+        self._transport = transport
+        self._spec = spec
+        self._persona = persona
+        self._language = language
+        self._http_response: Optional[httpx.Response] = None
+        self._iterator: Optional[Iterator[VoiceChunk]] = None
+        self.response: Optional[VoiceResponse] = None
+
+    def __iter__(self) -> "VoiceResponseStream":
+        return self
+
+    def __next__(self) -> VoiceChunk:
+        if self._iterator is None:
+            self._iterator = self._iter_chunks()
+        return next(self._iterator)
+
+    def _iter_chunks(self) -> Iterator[VoiceChunk]:
+        response = self._transport.open_stream(self._spec)
+        self._http_response = response
+        try:
+            assembler = ResponseAssembler(
+                self._persona,
+                self._language,
+                response.headers.get("content-type", ""),
+                self._transport.codec.loads,
+            )
+            for line in response.iter_lines():
+                yield from assembler.feed_line(line)
+            yield from assembler.finish()
+            self.response = assembler.response()
+        finally:
+            self.close()
+
+    def iter_text(self) -> Iterator[str]:
+        """Yield only the text deltas."""
+        for chunk in self:
+            if chunk.text:
+                yield chunk.text
+
+    def get_final_response(self) -> VoiceResponse:
+        """Drain the remaining chunks and return the final response."""
+        for _ in self:
+            pass
+        if self.response is None:
+            raise APIError("Stream closed before completion")
+        return self.response
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection."""
+        if self._http_response is not None:
+            self._http_response.close()
+            self._http_response = None
+
+    def __enter__(self) -> "VoiceResponseStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncVoiceResponseStream:
+    """
+    Async iterator over the chunks of a streamed ``generate_response`` call.
+
+    Usage:
+        async with client.voice.stream_response("Bonjour") as stream:
+            async for chunk in stream:
+                ...
+            print(stream.response.text)
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        spec: RequestSpec[Any],
+        persona: str,
+        language: str,
+    ) -> None:
+        self._transport = transport
+        self._spec = spec
+        self._persona = persona
+        self._language = language
+        self._http_response: Optional[httpx.Response] = None
+        self._iterator: Optional[AsyncIterator[VoiceChunk]] = None
+        self.response: Optional[VoiceResponse] = None
+
+    def __aiter__(self) -> "AsyncVoiceResponseStream":
+        return self
+
+    async def __anext__(self) -> VoiceChunk:
+        if self._iterator is None:
+            self._iterator = self._iter_chunks()
+        return await self._iterator.__anext__()
+
+    async def _iter_chunks(self) -> AsyncIterator[VoiceChunk]:
+        response = await self._transport.open_stream(self._spec)
+        self._http_response = response
+        try:
+            assembler = ResponseAssembler(
+                self._persona,
+                self._language,
+                response.headers.get("content-type", ""),
+                self._transport.codec.loads,
+            )
+            async for line in response.aiter_lines():
+                for chunk in assembler.feed_line(line):
+                    yield chunk
+            for chunk in assembler.finish():
+                yield chunk
+            self.response = assembler.response()
+        finally:
+            await self.aclose()
+
+    async def iter_text(self) -> AsyncIterator[str]:
+        """Yield only the text deltas."""
+        async for chunk in self:
+            if chunk.text:
+                yield chunk.text
+
+    async def get_final_response(self) -> VoiceResponse:
+        """Drain the remaining chunks and return the final response."""
+        async for _ in self:
+            pass
+        if self.response is None:
+            raise APIError("Stream closed before completion")
+        return self.response
+
+    async def aclose(self) -> None:
+        """Release the underlying HTTP connection."""
+        if self._http_response is not None:
+            await self._http_response.aclose()
+            self._http_response = None
+
+    async def __aenter__(self) -> "AsyncVoiceResponseStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+def _open_sink(target: Any) -> Tuple[Callable[[bytes], Any], Optional[IO[bytes]]]:
+    """Return a write function for a path, file object or socket."""
+    if isinstance(target, (str, os.PathLike)):
+        f = open(target, "wb")
+        return f.write, f
+    if hasattr(target, "sendall"):
+        return target.sendall, None
+    if hasattr(target, "write"):
+        return target.write, None
+    raise TypeError(f"Cannot write audio to {type(target).__name__}")
+
+
+AsyncSink = Tuple[Callable[[bytes], Awaitable[Any]], Callable[[], Awaitable[None]]]
+
+
+async def _open_async_sink(target: Any) -> AsyncSink:
+    """
+    Return (write, close) coroutine functions for a path, file object,
+    socket or ``asyncio.StreamWriter`` that never block the event loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    if isinstance(target, socket.socket) and not isinstance(target, ssl.SSLSocket):
+        timeout = target.gettimeout()
+        target.setblocking(False)
+
+        async def send(chunk: bytes) -> None:
+            await loop.sock_sendall(target, chunk)
+
+        async def restore() -> None:
+            target.settimeout(timeout)
+
+        return send, restore
+
+    drain = getattr(target, "drain", None)
+    if drain is not None:
+
+        async def write_and_drain(chunk: bytes) -> None:
+            target.write(chunk)
+            await drain()
+
+        async def keep_open() -> None:
+            pass
+
+        return write_and_drain, keep_open
+
+    # Paths, files and other blocking sinks are written from the executor
+    write, owned = await loop.run_in_executor(None, _open_sink, target)
+
+    async def offload(chunk: bytes) -> None:
+        await loop.run_in_executor(None, write, chunk)
+
+    async def close() -> None:
+        if owned is not None:
+            await loop.run_in_executor(None, owned.close)
+
+    return offload, close
+
+
+class AudioStream:
+    """
+    Iterator over audio chunks of a streamed synthesis, yielded as the
+    server produces them.
+
+    The request is sent on first iteration (or by :meth:`write_to`).
+
+    Usage:
+        with client.voice.synthesize_stream("Bienvenue") as audio:
+            for chunk in audio:
+                player.feed(chunk)
+    """
+
+    def __init__(
+        self,
+        transport: SyncTransport,
+        spec: RequestSpec[Any],
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        self._transport = transport
+        self._spec = spec
+        self._chunk_size = chunk_size
+        self._http_response: Optional[httpx.Response] = None
+        self._iterator: Optional[Iterator[bytes]] = None
+        self.content_type: Optional[str] = None
+
+    def __iter__(self) -> "AudioStream":
+        return self
+
+    def __next__(self) -> bytes:
+        if self._iterator is None:
+            self._iterator = self._iter_chunks()
+        return next(self._iterator)
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        response = self._transport.open_stream(self._spec)
+        self._http_response = response
+        self.content_type = response.headers.get("content-type")
+        try:
+            for chunk in response.iter_bytes(self._chunk_size):
+                yield chunk
+        finally:
+            self.close()
+
+    def write_to(self, target: Any) -> int:
+        """
+        Write the audio to a path, binary file object or socket as it
+        arrives, without concatenating it in memory.
+
+        Returns:
+            Number of bytes written
+        """
+        write, owned = _open_sink(target)
+        written = 0
+        try:
+            for chunk in self:
+                write(chunk)
+                written += len(chunk)
+        finally:
+            if owned is not None:
+                owned.close()
+        return written
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection."""
+        if self._http_response is not None:
+            self._http_response.close()
+            self._http_response = None
+
+    def __enter__(self) -> "AudioStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncAudioStream:
+    """
+    Async iterator over audio chunks of a streamed synthesis.
+
+    Usage:
+        async with client.voice.synthesize_stream("Bienvenue") as audio:
+            async for chunk in audio:
+                await rtp.send(chunk)
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        spec: RequestSpec[Any],
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        self._transport = transport
+        self._spec = spec
+        self._chunk_size = chunk_size
+        self._http_response: Optional[httpx.Response] = None
+        self._iterator: Optional[AsyncIterator[bytes]] = None
+        self.content_type: Optional[str] = None
+
+    def __aiter__(self) -> "AsyncAudioStream":
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self._iterator is None:
+            self._iterator = self._iter_chunks()
+        return await self._iterator.__anext__()
+
+    async def _iter_chunks(self) -> AsyncIterator[bytes]:
+        response = await self._transport.open_stream(self._spec)
+        self._http_response = response
+        self.content_type = response.headers.get("content-type")
+        try:
+            async for chunk in response.aiter_bytes(self._chunk_size):
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def write_to(self, target: Any) -> int:
+        """
+        Write the audio to a path, binary file object, socket or
+        ``asyncio.StreamWriter`` as it arrives.
+
+        Returns:
+            Number of bytes written
+        """
+        write, close = await _open_async_sink(target)
+        written = 0
+        try:
+            async for chunk in self:
+                await write(chunk)
+                written += len(chunk)
+        finally:
+            await close()
+        return written
+
+    async def aclose(self) -> None:
+        """Release the underlying HTTP connection."""
+        if self._http_response is not None:
+            await self._http_response.aclose()
+            self._http_response = None
+
+    async def __aenter__(self) -> "AsyncAudioStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -4,12 +4,261 @@ VocalIA Telephony Client - PSTN Voice AI
 
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
 from datetime import datetime
+from os import PathLike
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Union
 
 import httpx
 
-from .models import CallSession, CallStatus, CallEvent
+from .campaign import (
+    CallResult,
+    ProgressCallback,
+    run_campaign,
+    run_campaign_async,
+)
+from .downloads import (
+    DEFAULT_CHUNK_SIZE,
+    PathOrFile,
+    RangeDownload,
+    RangeSpecFactory,
+    adownload_to,
+    aiter_download,
+    download_to,
+    iter_download,
+)
+from .idempotency import IDEMPOTENCY_HEADER, new_key
+from .models import CallSession
+from .pagination import AsyncPageIterator, Page, PageIterator, PageSpecFactory
+from .transport import AsyncTransport, RequestSpec, SyncTransport
+from .validation import ValidationMode, build_models, check_mode
+from .watcher import CallWatcher
+
+
+def _call_session(data: Dict[str, Any]) -> CallSession:
+    return CallSession(**data)
+
+
+def _initiate_call_request(
+    to: str,
+    persona: str,
+    language: str,
+    from_number: Optional[str],
+    webhook_url: Optional[str],
+    metadata: Optional[Dict[str, Any]],
+    knowledge_base_id: Optional[str],
+    max_duration: int,
+    idempotency_key: Optional[str] = None,
+) -> RequestSpec[CallSession]:
+    payload: Dict[str, Any] = {
+        "to": to,
+        "persona": persona,
+        "language": language,
+        "max_duration": max_duration,
+    }
+
+    if from_number:
+        payload["from"] = from_number
+    if webhook_url:
+        payload["webhook_url"] = webhook_url
+    if metadata:
+        payload["metadata"] = metadata
+    if knowledge_base_id:
+        payload["knowledge_base_id"] = knowledge_base_id
+
+    # With an idempotency key the server de-duplicates repeats, which
+    # makes the POST safe to retry.
+    return RequestSpec(
+        "POST",
+        "/v1/telephony/calls",
+        json=payload,
+        headers={IDEMPOTENCY_HEADER: idempotency_key or new_key()},
+        parse=_call_session,
+        idempotent=True,
+        operation="telephony.initiate_call",
+    )
+
+
+def _get_call_request(call_id: str) -> RequestSpec[CallSession]:
+    return RequestSpec(
+        "GET",
+        f"/v1/telephony/calls/{call_id}",
+        parse=_call_session,
+        operation="telephony.get_call",
+    )
+
+
+def _list_calls_params(
+    limit: int,
+    offset: int,
+    status: Optional[str],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "limit": limit,
+        "offset": offset,
+    }
+
+    if status:
+        params["status"] = status
+    if from_date:
+        params["from_date"] = from_date.isoformat()
+    if to_date:
+        params["to_date"] = to_date.isoformat()
+    return params
+
+
+def _list_calls_request(
+    limit: int,
+    offset: int,
+    status: Optional[str],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    validation: str = "strict",
+) -> RequestSpec[List[CallSession]]:
+    return RequestSpec(
+        "GET",
+        "/v1/telephony/calls",
+        params=_list_calls_params(limit, offset, status, from_date, to_date),
+        parse=lambda data: build_models(CallSession, data["calls"], validation),
+        operation="telephony.list_calls",
+    )
+
+
+def _parse_call_page(data: Dict[str, Any], validation: str = "strict") -> Page:
+    return Page(
+        build_models(CallSession, data["calls"], validation),
+        next_cursor=data.get("next_cursor"),
+        has_more=data.get("has_more"),
+    )
+
+
+def _call_pages(
+    status: Optional[str],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+    validation: str = "strict",
+) -> PageSpecFactory:
+    def parse(data: Dict[str, Any]) -> Page:
+        return _parse_call_page(data, validation)
+
+    def make_spec(offset: int, cursor: Optional[str], limit: int) -> RequestSpec[Page]:
+        params = _list_calls_params(limit, offset, status, from_date, to_date)
+        if cursor:
+            # The cursor already encodes the position; an offset on top of
+            # it would skip that many calls again
+            del params["offset"]
+            params["cursor"] = cursor
+        return RequestSpec(
+            "GET",
+            "/v1/telephony/calls",
+            params=params,
+            parse=parse,
+            operation="telephony.iter_calls",
+        )
+
+    return make_spec
+
+
+def _end_call_request(
+    call_id: str, idempotency_key: Optional[str] = None
+) -> RequestSpec[CallSession]:
+    return RequestSpec(
+        "POST",
+        f"/v1/telephony/calls/{call_id}/end",
+        headers={IDEMPOTENCY_HEADER: idempotency_key or new_key()},
+        parse=_call_session,
+        idempotent=True,
+        operation="telephony.end_call",
+    )
+
+
+def _transfer_call_request(
+    call_id: str,
+    to: str,
+    announce: Optional[str],
+    idempotency_key: Optional[str] = None,
+) -> RequestSpec[CallSession]:
+    payload: Dict[str, Any] = {"to": to}
+    if announce:
+        payload["announce"] = announce
+
+    return RequestSpec(
+        "POST",
+        f"/v1/telephony/calls/{call_id}/transfer",
+        json=payload,
+        headers={IDEMPOTENCY_HEADER: idempotency_key or new_key()},
+        parse=_call_session,
+        idempotent=True,
+        operation="telephony.transfer_call",
+    )
+
+
+def _get_transcript_request(call_id: str) -> RequestSpec[List[Dict[str, Any]]]:
+    return RequestSpec(
+        "GET",
+        f"/v1/telephony/calls/{call_id}/transcript",
+        parse=lambda data: data["transcript"],
+        operation="telephony.get_transcript",
+    )
+
+
+def _get_recording_request(
+    call_id: str, headers: Optional[Dict[str, str]] = None
+) -> RequestSpec[bytes]:
+    return RequestSpec(
+        "GET",
+        f"/v1/telephony/calls/{call_id}/recording",
+        headers=headers,
+        raw=True,
+        operation="telephony.get_recording",
+    )
+
+
+def _recording_ranges(call_id: str) -> RangeSpecFactory:
+    return lambda headers: _get_recording_request(call_id, headers)
+
+
+def _get_analytics_request(
+    call_id: Optional[str],
+    from_date: Optional[datetime],
+    to_date: Optional[datetime],
+) -> RequestSpec[Dict[str, Any]]:
+    params: Dict[str, Any] = {}
+
+    if call_id:
+        params["call_id"] = call_id
+    if from_date:
+        params["from_date"] = from_date.isoformat()
+    if to_date:
+        params["to_date"] = to_date.isoformat()
+
+    return RequestSpec(
+        "GET",
+        "/v1/telephony/analytics",
+        params=params,
+        operation="telephony.get_analytics",
+    )
+
+
+def _configure_webhook_request(
+    url: str,
+    events: List[str],
+    secret: Optional[str],
+) -> RequestSpec[Dict[str, Any]]:
+    payload: Dict[str, Any] = {
+        "url": url,
+        "events": events,
+    }
+    if secret:
+        payload["secret"] = secret
+
+    return RequestSpec(
+        "POST",
+        "/v1/telephony/webhooks",
+        json=payload,
+        operation="telephony.configure_webhook",
+    )
 
 
 class TelephonyClient:
@@ -20,8 +269,13 @@ class TelephonyClient:
     voice AI conversations over phone lines.
     """
 
-    def __init__(self, http_client: httpx.Client) -> None:
-        self._client = http_client
+    def __init__(
+        self,
+        http_client: Union[httpx.Client, SyncTransport],
+        validation: ValidationMode = "strict",
+    ) -> None:
+        self._transport = SyncTransport.wrap(http_client)
+        self._validation = check_mode(validation)
 
     def initiate_call(
         self,
@@ -33,6 +287,7 @@ class TelephonyClient:
         metadata: Optional[Dict[str, Any]] = None,
         knowledge_base_id: Optional[str] = None,
         max_duration: int = 600,
+        idempotency_key: Optional[str] = None,
     ) -> CallSession:
         """
         Initiate an outbound voice AI call.
@@ -46,6 +301,10 @@ class TelephonyClient:
             metadata: Custom metadata to attach
             knowledge_base_id: KB for RAG retrieval
             max_duration: Max call duration in seconds
+            idempotency_key: Key the server uses to de-duplicate repeats of
+                             this request, which makes it safe to retry.
+                             A random key is generated when not given;
+                             pass your own to de-duplicate resubmissions.
 
         Returns:
             CallSession with call details
@@ -59,26 +318,72 @@ class TelephonyClient:
             )
             print(f"Call started: {call.id}")
         """
-        payload: Dict[str, Any] = {
-            "to": to,
-            "persona": persona,
-            "language": language,
-            "max_duration": max_duration,
-        }
-
-        if from_number:
-            payload["from"] = from_number
-        if webhook_url:
-            payload["webhook_url"] = webhook_url
-        if metadata:
-            payload["metadata"] = metadata
-        if knowledge_base_id:
-            payload["knowledge_base_id"] = knowledge_base_id
-
-        response = self._client.post("/v1/telephony/calls", json=payload)
-        response.raise_for_status()
-
-        return CallSession(**response.json())
+        return self._transport.call(
+            _initiate_call_request(
+                to,
+                persona,
+                language,
+                from_number,
+                webhook_url,
+                metadata,
+                knowledge_base_id,
+                max_duration,
+                idempotency_key,
+            )
+        )
+
+    def initiate_calls(
+        self,
+        batch: Sequence[Dict[str, Any]],
+        concurrency: int = 10,
+        campaign_id: Optional[str] = None,
+        journal: Optional[Union[str, "PathLike[str]"]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> List[CallResult]:
+        """
+        Place a batch of outbound calls with bounded concurrency.
+
+        Every item gets a deterministic idempotency key derived from the
+        campaign, its position and its parameters, so running the same
+        batch again after a crash does not dial anyone twice. Requests go
+        through the client's rate limiter and retry policy.
+
+        Args:
+            batch: ``initiate_call`` keyword arguments, one dict per call.
+                   An ``idempotency_key`` entry overrides the derived key.
+            concurrency: Max calls being placed at the same time
+            campaign_id: Stable campaign identifier for key derivation
+                         (defaults to a hash of the batch)
+            journal: Optional JSONL file recording placed calls; items
+                     already in it are returned without being re-dialled
+            on_progress: Called as ``on_progress(done, total, result)``
+                         after each item; errors it raises are logged
+
+        Returns:
+            One CallResult per item, in input order. Failures are reported
+            in ``result.error`` rather than raised.
+
+        Raises:
+            OSError: The journal could not be written; no further items
+                     are dialled
+
+        Example:
+            results = client.telephony.initiate_calls(
+                [{"to": p.phone, "persona": "DENTAL"} for p in patients],
+                concurrency=20,
+                campaign_id="rappels-2026-10-17",
+                journal="rappels.jsonl",
+            )
+            failed = [r for r in results if not r.ok]
+        """
+        return run_campaign(
+            lambda item, key: self.initiate_call(**item, idempotency_key=key),
+            batch,
+            concurrency=concurrency,
+            campaign_id=campaign_id,
+            journal=journal,
+            on_progress=on_progress,
+        )
 
     def get_call(self, call_id: str) -> CallSession:
         """
@@ -90,10 +395,7 @@ class TelephonyClient:
         Returns:
             CallSession with current status
         """
-        response = self._client.get(f"/v1/telephony/calls/{call_id}")
-        response.raise_for_status()
-
-        return CallSession(**response.json())
+        return self._transport.call(_get_call_request(call_id))
 
     def list_calls(
         self,
@@ -116,43 +418,78 @@ class TelephonyClient:
         Returns:
             List of CallSession objects
         """
-        params: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
+        return self._transport.call(
+            _list_calls_request(
+                limit, offset, status, from_date, to_date, self._validation
+            )
+        )
 
-        if status:
-            params["status"] = status
-        if from_date:
-            params["from_date"] = from_date.isoformat()
-        if to_date:
-            params["to_date"] = to_date.isoformat()
+    def iter_calls(
+        self,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> PageIterator[CallSession]:
+        """
+        Iterate over all matching calls, fetching pages as needed.
 
-        response = self._client.get("/v1/telephony/calls", params=params)
-        response.raise_for_status()
+        The next page is requested in the background while the current
+        one is consumed, so a full walk is bound by network throughput
+        rather than by sequential round-trips.
 
-        return [CallSession(**c) for c in response.json()["calls"]]
+        Args:
+            status: Filter by status (active, completed, failed)
+            from_date: Filter calls after this date
+            to_date: Filter calls before this date
+            page_size: Calls per request (1-100)
+            cursor: Resume from a cursor saved from a previous iterator
+            max_items: Stop after this many calls
+            prefetch: Fetch the next page while the current one is consumed
 
-    def end_call(self, call_id: str) -> CallSession:
+        Returns:
+            Iterator of CallSession objects; its ``cursor`` attribute is
+            the resumable position after the last call yielded
+
+        Example:
+            calls = client.telephony.iter_calls(status="completed")
+            for call in calls:
+                archive(call)
+                checkpoint.save(calls.cursor)
+        """
+        return PageIterator(
+            self._transport,
+            _call_pages(status, from_date, to_date, self._validation),
+            page_size=page_size,
+            cursor=cursor,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    def end_call(
+        self, call_id: str, idempotency_key: Optional[str] = None
+    ) -> CallSession:
         """
         End an active call.
 
         Args:
             call_id: The call session ID
+            idempotency_key: De-duplication key (see :meth:`initiate_call`)
 
         Returns:
             Updated CallSession
         """
-        response = self._client.post(f"/v1/telephony/calls/{call_id}/end")
-        response.raise_for_status()
-
-        return CallSession(**response.json())
+        return self._transport.call(_end_call_request(call_id, idempotency_key))
 
     def transfer_call(
         self,
         call_id: str,
         to: str,
         announce: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CallSession:
         """
         Transfer an active call to another number.
@@ -161,21 +498,14 @@ class TelephonyClient:
             call_id: The call session ID
             to: Destination number for transfer
             announce: Optional announcement before transfer
+            idempotency_key: De-duplication key (see :meth:`initiate_call`)
 
         Returns:
             Updated CallSession
         """
-        payload: Dict[str, Any] = {"to": to}
-        if announce:
-            payload["announce"] = announce
-
-        response = self._client.post(
-            f"/v1/telephony/calls/{call_id}/transfer",
-            json=payload,
+        return self._transport.call(
+            _transfer_call_request(call_id, to, announce, idempotency_key)
         )
-        response.raise_for_status()
-
-        return CallSession(**response.json())
 
     def get_transcript(self, call_id: str) -> List[Dict[str, Any]]:
         """
@@ -187,10 +517,7 @@ class TelephonyClient:
         Returns:
             List of transcript segments with speaker and text
         """
-        response = self._client.get(f"/v1/telephony/calls/{call_id}/transcript")
-        response.raise_for_status()
-
-        return response.json()["transcript"]
+        return self._transport.call(_get_transcript_request(call_id))
 
     def get_recording(self, call_id: str) -> bytes:
         """
@@ -201,11 +528,78 @@ class TelephonyClient:
 
         Returns:
             Audio bytes (MP3 format)
+
+        Note:
+            The whole recording is held in memory. Prefer
+            :meth:`download_recording` or :meth:`iter_recording` for
+            long calls.
         """
-        response = self._client.get(f"/v1/telephony/calls/{call_id}/recording")
-        response.raise_for_status()
+        return self._transport.call(_get_recording_request(call_id))
 
-        return response.content
+    def iter_recording(
+        self,
+        call_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        expected_sha256: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream the call recording in chunks.
+
+        A dropped connection is resumed with an HTTP Range request from
+        the last byte received. The total size (and the SHA-256 when the
+        server or caller provides one) is verified at the end.
+
+        Args:
+            call_id: The call session ID
+            chunk_size: Bytes per yielded chunk
+            expected_sha256: Optional hex digest to verify against
+
+        Returns:
+            Iterator of audio byte chunks (MP3 format)
+        """
+        return iter_download(
+            self._transport,
+            _recording_ranges(call_id),
+            RangeDownload(expected_sha256=expected_sha256),
+            chunk_size,
+        )
+
+    def download_recording(
+        self,
+        call_id: str,
+        path_or_fileobj: PathOrFile,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        expected_sha256: Optional[str] = None,
+    ) -> int:
+        """
+        Download the call recording to disk with flat memory usage.
+
+        When given a path, data is written to ``<path>.part`` and renamed
+        into place once verified; an interrupted download leaves the
+        ``.part`` file behind and the next call resumes from it.
+
+        Args:
+            call_id: The call session ID
+            path_or_fileobj: Destination path or writable binary file
+            chunk_size: Bytes read per chunk
+            resume: Continue from an existing ``.part`` file
+            expected_sha256: Optional hex digest to verify against
+
+        Returns:
+            Size of the recording in bytes
+
+        Example:
+            client.telephony.download_recording(call.id, f"archive/{call.id}.mp3")
+        """
+        return download_to(
+            self._transport,
+            _recording_ranges(call_id),
+            path_or_fileobj,
+            chunk_size,
+            resume,
+            expected_sha256,
+        )
 
     def get_analytics(
         self,
@@ -224,19 +618,9 @@ class TelephonyClient:
         Returns:
             Analytics data including duration, sentiment, etc.
         """
-        params: Dict[str, Any] = {}
-
-        if call_id:
-            params["call_id"] = call_id
-        if from_date:
-            params["from_date"] = from_date.isoformat()
-        if to_date:
-            params["to_date"] = to_date.isoformat()
-
-        response = self._client.get("/v1/telephony/analytics", params=params)
-        response.raise_for_status()
-
-        return response.json()
+        return self._transport.call(
+            _get_analytics_request(call_id, from_date, to_date)
+        )
 
     def configure_webhook(
         self,
@@ -250,19 +634,204 @@ class TelephonyClient:
         Args:
             url: Webhook endpoint URL
             events: List of event types to receive
-            secret: Optional signing secret
+            secret: Optional signing secret; deliveries can then be
+                    verified with :mod:`vocalia.webhooks`
 
         Returns:
             Webhook configuration
         """
-        payload: Dict[str, Any] = {
-            "url": url,
-            "events": events,
-        }
-        if secret:
-            payload["secret"] = secret
+        return self._transport.call(_configure_webhook_request(url, events, secret))
+
 
-        response = self._client.post("/v1/telephony/webhooks", json=payload)
-        response.raise_for_status()
+class AsyncTelephonyClient:
+    """
+    Async client for VocalIA Telephony/PSTN functionality.
 
-        return response.json()
+    Mirrors :class:`TelephonyClient` method for method; both share the
+    same request builders and response parsers.
+    """
+
+    def __init__(
+        self,
+        http_client: Union[httpx.AsyncClient, AsyncTransport],
+        validation: ValidationMode = "strict",
+    ) -> None:
+        self._transport = AsyncTransport.wrap(http_client)
+        self._validation = check_mode(validation)
+
+    async def initiate_call(
+        self,
+        to: str,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        from_number: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        knowledge_base_id: Optional[str] = None,
+        max_duration: int = 600,
+        idempotency_key: Optional[str] = None,
+    ) -> CallSession:
+        """Initiate an outbound call. See :meth:`TelephonyClient.initiate_call`."""
+        return await self._transport.call(
+            _initiate_call_request(
+                to,
+                persona,
+                language,
+                from_number,
+                webhook_url,
+                metadata,
+                knowledge_base_id,
+                max_duration,
+                idempotency_key,
+            )
+        )
+
+    async def initiate_calls(
+        self,
+        batch: Sequence[Dict[str, Any]],
+        concurrency: int = 10,
+        campaign_id: Optional[str] = None,
+        journal: Optional[Union[str, "PathLike[str]"]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> List[CallResult]:
+        """Place a batch of calls. See :meth:`TelephonyClient.initiate_calls`.
+
+        ``on_progress`` runs on the event loop, so it must not block.
+        """
+        return await run_campaign_async(
+            lambda item, key: self.initiate_call(**item, idempotency_key=key),
+            batch,
+            concurrency=concurrency,
+            campaign_id=campaign_id,
+            journal=journal,
+            on_progress=on_progress,
+        )
+
+    async def get_call(self, call_id: str) -> CallSession:
+        """Get details of a specific call."""
+        return await self._transport.call(_get_call_request(call_id))
+
+    async def list_calls(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> List[CallSession]:
+        """List call sessions. See :meth:`TelephonyClient.list_calls`."""
+        return await self._transport.call(
+            _list_calls_request(
+                limit, offset, status, from_date, to_date, self._validation
+            )
+        )
+
+    def iter_calls(
+        self,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncPageIterator[CallSession]:
+        """Iterate over all matching calls. See :meth:`TelephonyClient.iter_calls`."""
+        return AsyncPageIterator(
+            self._transport,
+            _call_pages(status, from_date, to_date, self._validation),
+            page_size=page_size,
+            cursor=cursor,
+            max_items=max_items,
+            prefetch=prefetch,
+        )
+
+    async def end_call(
+        self, call_id: str, idempotency_key: Optional[str] = None
+    ) -> CallSession:
+        """End an active call."""
+        return await self._transport.call(_end_call_request(call_id, idempotency_key))
+
+    async def transfer_call(
+        self,
+        call_id: str,
+        to: str,
+        announce: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> CallSession:
+        """Transfer an active call to another number."""
+        return await self._transport.call(
+            _transfer_call_request(call_id, to, announce, idempotency_key)
+        )
+
+    async def get_transcript(self, call_id: str) -> List[Dict[str, Any]]:
+        """Get the conversation transcript for a call."""
+        return await self._transport.call(_get_transcript_request(call_id))
+
+    async def get_recording(self, call_id: str) -> bytes:
+        """Download the call recording (MP3 bytes)."""
+        return await self._transport.call(_get_recording_request(call_id))
+
+    def iter_recording(
+        self,
+        call_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        expected_sha256: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream the call recording. See :meth:`TelephonyClient.iter_recording`."""
+        return aiter_download(
+            self._transport,
+            _recording_ranges(call_id),
+            RangeDownload(expected_sha256=expected_sha256),
+            chunk_size,
+        )
+
+    async def download_recording(
+        self,
+        call_id: str,
+        path_or_fileobj: PathOrFile,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        expected_sha256: Optional[str] = None,
+    ) -> int:
+        """Stream the recording to a path or file object, resuming with Range."""
+        return await adownload_to(
+            self._transport,
+            _recording_ranges(call_id),
+            path_or_fileobj,
+            chunk_size,
+            resume,
+            expected_sha256,
+        )
+
+    async def get_analytics(
+        self,
+        call_id: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Get call analytics. See :meth:`TelephonyClient.get_analytics`."""
+        return await self._transport.call(
+            _get_analytics_request(call_id, from_date, to_date)
+        )
+
+    def watcher(self, **options: Any) -> CallWatcher:
+        """
+        Create a :class:`~vocalia.watcher.CallWatcher` that tracks many
+        calls from one polling loop instead of polling each ``get_call``.
+
+        Args:
+            **options: CallWatcher options (intervals, concurrency, ...)
+        """
+        return CallWatcher(self, **options)
+
+    async def configure_webhook(
+        self,
+        url: str,
+        events: List[str],
+        secret: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Configure webhook for call events."""
+        return await self._transport.call(
+            _configure_webhook_request(url, events, secret)
+        )
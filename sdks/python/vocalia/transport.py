@@ -0,0 +1,533 @@
+"""
+VocalIA Transport - Shared request core for sync and async clients
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar, Union
+
+import httpx
+
+from .circuit import CircuitBreaker
+from .coalesce import AsyncSingleflight, Singleflight, request_key
+from .codec import JSONCodec, encode_payload, get_codec
+from .exceptions import (
+    APIConnectionError,
+    RateLimitError,
+    VocalIAError,
+    handle_api_error,
+)
+from .hedging import HedgingPolicy
+from .idempotency import idempotency_key
+from .metrics import MetricsSink, RequestTiming
+from .ratelimit import AdaptiveRateLimiter
+from .retry import IDEMPOTENT_METHODS, RetryPolicy, parse_retry_after
+from .uploads import StreamingBody
+
+T = TypeVar("T")
+
+_STDLIB_CODEC = JSONCodec()
+
+
+@dataclass
+class RequestSpec(Generic[T]):
+    """
+    Description of a single API call.
+
+    Sub-clients build a spec for each endpoint and hand it to a transport.
+    The transport sends it and ``parse`` turns the decoded JSON body into
+    the method's return value, so sync and async clients share one
+    definition per endpoint.
+
+    Attributes:
+        method: HTTP method
+        path: Path relative to the client base URL
+        params: Query string parameters
+        json: JSON request body; top-level RawJSON values are spliced in
+        files: Multipart files
+        content: Raw request body, or a StreamingBody sent chunk by chunk
+        headers: Extra request headers
+        parse: Converts the decoded JSON body into the return value
+        raw: Return the raw response bytes instead of decoded JSON
+        idempotent: Whether the call may be retried; defaults to True for
+                    safe HTTP methods
+        operation: SDK method name used to label metrics, e.g.
+                   ``"telephony.get_call"``
+    """
+
+    method: str
+    path: str
+    params: Optional[Dict[str, Any]] = None
+    json: Optional[Any] = None
+    files: Optional[Dict[str, Any]] = None
+    content: Optional[Any] = None
+    headers: Optional[Dict[str, str]] = None
+    parse: Optional[Callable[[Any], T]] = None
+    raw: bool = False
+    idempotent: Optional[bool] = None
+    operation: Optional[str] = None
+
+    @property
+    def is_idempotent(self) -> bool:
+        """Whether the call may safely be sent more than once."""
+        if self.idempotent is not None:
+            return self.idempotent
+        return self.method.upper() in IDEMPOTENT_METHODS
+
+    def handle(
+        self,
+        response: httpx.Response,
+        codec: Optional[JSONCodec] = None,
+        timing: Optional[RequestTiming] = None,
+    ) -> T:
+        """Convert a successful response into the endpoint return value."""
+        if self.raw:
+            return response.content  # type: ignore[return-value]
+
+        loads = (codec or _STDLIB_CODEC).loads
+        if timing is None:
+            data = loads(response.content)
+            if self.parse is None:
+                return data  # type: ignore[no-any-return]
+            return self.parse(data)
+
+        started = time.perf_counter()
+        data = loads(response.content)
+        decoded = time.perf_counter()
+        timing.add("decode", started, decoded)
+        if self.parse is None:
+            return data  # type: ignore[no-any-return]
+        result = self.parse(data)
+        timing.add("validate", decoded)
+        return result
+
+
+def _build_request(
+    http_client: Union[httpx.Client, httpx.AsyncClient],
+    spec: RequestSpec[Any],
+    codec: JSONCodec,
+) -> httpx.Request:
+    content = spec.content
+    headers = spec.headers
+    if spec.json is not None:
+        # Encoded here rather than by httpx so the client's codec is used
+        content = encode_payload(codec, spec.json)
+        headers = {"Content-Type": "application/json", **(headers or {})}
+    elif isinstance(content, StreamingBody):
+        headers = {**content.headers(), **(headers or {})}
+        if isinstance(http_client, httpx.AsyncClient):
+            content = content.aiter_chunks()
+        else:
+            content = content.iter_chunks()
+    return http_client.build_request(
+        spec.method,
+        spec.path,
+        params=spec.params,
+        files=spec.files,
+        content=content,
+        headers=headers,
+    )
+
+
+def _retrieve(task: "asyncio.Future[Any]") -> None:
+    # Mark a hedged request's failure as seen once its result is not needed
+    if not task.cancelled():
+        task.exception()
+
+
+def _error_from_response(response: httpx.Response) -> VocalIAError:
+    """Build the typed exception for an error response whose body was read."""
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if not isinstance(body, dict):
+        body = {"message": response.text[:500] or response.reason_phrase}
+    return handle_api_error(
+        response.status_code,
+        body,
+        retry_after=parse_retry_after(response.headers.get("retry-after")),
+    )
+
+
+class _RetryState:
+    """Attempt bookkeeping for one call, shared by both transports."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        spec: RequestSpec[Any],
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self.policy = policy
+        self.path = spec.path
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.idempotent = spec.is_idempotent
+        self.started = time.monotonic()
+        self.attempt = 0
+        # Circuit breaker token of the attempt in flight, if admitted
+        self._token: Optional[int] = None
+        self._sent = 0.0
+
+    def admit(self) -> None:
+        """Raise CircuitOpenError when the endpoint's circuit is open."""
+        if self.circuit_breaker is not None:
+            self._token = self.circuit_breaker.check(self.path)
+
+    def sending(self) -> None:
+        self._sent = time.monotonic()
+
+    def _report(
+        self, error: Optional[Union[VocalIAError, httpx.TransportError]] = None
+    ) -> None:
+        token, self._token = self._token, None
+        if self.circuit_breaker is not None and token is not None:
+            elapsed = time.monotonic() - self._sent
+            self.circuit_breaker.on_result(self.path, elapsed, error, token)
+
+    def abandon(self) -> None:
+        """Release an admitted attempt that ended without a result."""
+        token, self._token = self._token, None
+        if self.circuit_breaker is not None and token is not None:
+            self.circuit_breaker.release(self.path, token)
+
+    def succeeded(self) -> None:
+        self._report()
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_success(self.path)
+
+    def next_delay(self, error: Union[VocalIAError, httpx.TransportError]) -> float:
+        """Delay before the next attempt; re-raises ``error`` when giving up."""
+        self._report(error)
+        if self.rate_limiter is not None and isinstance(error, RateLimitError):
+            self.rate_limiter.on_rate_limited(self.path, error.retry_after)
+        delay = self.policy.next_delay(
+            self.idempotent,
+            self.attempt,
+            time.monotonic() - self.started,
+            error,
+        )
+        if delay is None:
+            if isinstance(error, httpx.TransportError):
+                raise APIConnectionError(str(error) or type(error).__name__) from error
+            raise error
+        self.attempt += 1
+        return delay
+
+
+class SyncTransport:
+    """
+    Sends request specs over a synchronous ``httpx.Client``.
+
+    Error responses are raised as typed VocalIA exceptions, and transient
+    failures of idempotent calls are retried according to ``retry``. When
+    a ``rate_limiter`` is set, every attempt waits for a slot from it.
+    Bodies are encoded and decoded with ``codec`` (see :mod:`vocalia.codec`).
+    With a ``coalescer`` (see :mod:`vocalia.coalesce`), identical GETs made
+    concurrently share one request and its parsed result. With
+    ``idempotency``, calls carrying the same idempotency key (see
+    :mod:`vocalia.idempotency`) share one request, and its result is
+    returned to repeats for the table's ttl. With ``metrics``
+    (see :mod:`vocalia.metrics`), each request's phases are timed and
+    recorded; without it no timing is taken. With a ``circuit_breaker``
+    (see :mod:`vocalia.circuit`), attempts to an endpoint family whose
+    circuit is open raise CircuitOpenError without being sent.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.Client,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        coalescer: Optional[Singleflight] = None,
+        metrics: Optional[MetricsSink] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        idempotency: Optional[Singleflight] = None,
+    ) -> None:
+        self.http_client = http_client
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.codec = codec or get_codec()
+        self.coalescer = coalescer
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self.idempotency = idempotency
+        if circuit_breaker is not None and metrics is not None:
+            circuit_breaker.subscribe(metrics.record_circuit)
+
+    @classmethod
+    def wrap(cls, client: Union[httpx.Client, "SyncTransport"]) -> "SyncTransport":
+        """Accept either a transport or a bare ``httpx.Client``."""
+        if isinstance(client, SyncTransport):
+            return client
+        return cls(client)
+
+    def send(self, spec: RequestSpec[Any]) -> httpx.Response:
+        """Send a spec and return the successful HTTP response."""
+        return self._timed(spec, False, False)  # type: ignore[no-any-return]
+
+    def open_stream(self, spec: RequestSpec[Any]) -> httpx.Response:
+        """
+        Send a spec without reading the body.
+
+        The caller owns the returned response and must close it. With
+        metrics, the request is recorded when the response is closed.
+        """
+        return self._timed(spec, True, False)  # type: ignore[no-any-return]
+
+    def call(self, spec: RequestSpec[T]) -> T:
+        """
+        Send a spec and return its parsed result.
+
+        With a coalescer, identical concurrent GETs share one request; with
+        an idempotency table, so do repeats of a keyed call.
+        """
+        coalescer = self.coalescer
+        key = request_key(spec) if coalescer is not None else None
+        if key is None and self.idempotency is not None:
+            coalescer, key = self.idempotency, idempotency_key(spec)
+        if coalescer is None or key is None:
+            return self._timed(spec, False, True)  # type: ignore[no-any-return]
+        return coalescer.do(  # type: ignore[no-any-return]
+            key, lambda: self._timed(spec, False, True)
+        )
+
+    def _timed(self, spec: RequestSpec[Any], stream: bool, parse: bool) -> Any:
+        metrics = self.metrics
+        if metrics is None:
+            response = self._send(spec, stream)
+            return spec.handle(response, self.codec) if parse else response
+
+        timing = RequestTiming(spec.operation or spec.method, spec.method)
+        try:
+            response = self._send(spec, stream, timing)
+            if stream:
+                timing.close_with(lambda: metrics.record(timing.finish()))
+                return response
+            result = spec.handle(response, self.codec, timing) if parse else response
+        except BaseException as e:
+            metrics.record(timing.finish(e))
+            raise
+        metrics.record(timing.finish())
+        return result
+
+    def _send(
+        self,
+        spec: RequestSpec[Any],
+        stream: bool,
+        timing: Optional[RequestTiming] = None,
+    ) -> httpx.Response:
+        state = _RetryState(self.retry, spec, self.rate_limiter, self.circuit_breaker)
+        try:
+            while True:
+                state.admit()
+                if self.rate_limiter is not None:
+                    waited = time.perf_counter()
+                    self.rate_limiter.acquire(spec.path)
+                    if timing is not None:
+                        timing.add("rate_limit", waited)
+                request = _build_request(self.http_client, spec, self.codec)
+                if timing is not None:
+                    timing.begin_attempt()
+                    request.extensions["trace"] = timing.trace
+                state.sending()
+                try:
+                    response = self.http_client.send(request, stream=stream)
+                except httpx.TransportError as e:
+                    delay = state.next_delay(e)
+                else:
+                    if timing is not None:
+                        timing.status = response.status_code
+                    if not response.is_error:
+                        state.succeeded()
+                        return response
+                    response.read()
+                    response.close()
+                    delay = state.next_delay(_error_from_response(response))
+                slept = time.perf_counter()
+                time.sleep(delay)
+                if timing is not None:
+                    timing.add("backoff", slept)
+        finally:
+            state.abandon()
+
+
+class AsyncTransport:
+    """
+    Sends request specs over an ``httpx.AsyncClient``.
+
+    Same error mapping, retry, rate limiting, codec, coalescing,
+    idempotency, metrics and circuit breaking as :class:`SyncTransport`.
+    With ``hedging`` (see :mod:`vocalia.hedging`), slow reads are raced
+    against a second copy.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        coalescer: Optional[AsyncSingleflight] = None,
+        metrics: Optional[MetricsSink] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        idempotency: Optional[AsyncSingleflight] = None,
+    ) -> None:
+        self.http_client = http_client
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.codec = codec or get_codec()
+        self.coalescer = coalescer
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.idempotency = idempotency
+        if circuit_breaker is not None and metrics is not None:
+            circuit_breaker.subscribe(metrics.record_circuit)
+
+    @classmethod
+    def wrap(
+        cls, client: Union[httpx.AsyncClient, "AsyncTransport"]
+    ) -> "AsyncTransport":
+        """Accept either a transport or a bare ``httpx.AsyncClient``."""
+        if isinstance(client, AsyncTransport):
+            return client
+        return cls(client)
+
+    async def send(self, spec: RequestSpec[Any]) -> httpx.Response:
+        """Send a spec and return the successful HTTP response."""
+        return await self._timed(spec, False, False)  # type: ignore[no-any-return]
+
+    async def open_stream(self, spec: RequestSpec[Any]) -> httpx.Response:
+        """
+        Send a spec without reading the body.
+
+        The caller owns the returned response and must close it. With
+        metrics, the request is recorded when the response is closed.
+        """
+        return await self._timed(spec, True, False)  # type: ignore[no-any-return]
+
+    async def call(self, spec: RequestSpec[T]) -> T:
+        """
+        Send a spec and return its parsed result.
+
+        With a coalescer, identical concurrent GETs share one request; with
+        an idempotency table, so do repeats of a keyed call. With hedging,
+        reads it covers may be sent twice (first response wins).
+        """
+        coalescer = self.coalescer
+        key = request_key(spec) if coalescer is not None else None
+        if key is None and self.idempotency is not None:
+            coalescer, key = self.idempotency, idempotency_key(spec)
+        hedging = self.hedging
+        if hedging is not None and hedging.applies(spec):
+            if coalescer is None or key is None:
+                return await self._hedged(spec, hedging)
+            return await coalescer.do(key, lambda: self._hedged(spec, hedging))
+        if coalescer is None or key is None:
+            return await self._timed(spec, False, True)  # type: ignore[no-any-return]
+        return await coalescer.do(key, lambda: self._timed(spec, False, True))
+
+    async def _hedged(self, spec: RequestSpec[T], hedging: HedgingPolicy) -> T:
+        operation = spec.operation or spec.method
+        delay = hedging.hedge_delay(operation)
+        primary = asyncio.ensure_future(self._timed(spec, False, True))
+        primary.add_done_callback(_retrieve)
+        tasks = [primary]
+        # Start time of each task: a winning hedge is measured from its own
+        # start, not from the primary's, so the hedge delay is not counted
+        started = [time.perf_counter()]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and hedging.acquire():
+                    hedge = asyncio.ensure_future(self._timed(spec, False, True))
+                    hedge.add_done_callback(_retrieve)
+                    tasks.append(hedge)
+                    started.append(time.perf_counter())
+
+            error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task, start in zip(tasks, started):
+                    if not task.done() or task.cancelled():
+                        continue
+                    if task.exception() is None:
+                        elapsed = time.perf_counter() - start
+                        hedging.observe(operation, elapsed, task is not primary)
+                        return task.result()  # type: ignore[no-any-return]
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed(self, spec: RequestSpec[Any], stream: bool, parse: bool) -> Any:
+        metrics = self.metrics
+        if metrics is None:
+            response = await self._send(spec, stream)
+            return spec.handle(response, self.codec) if parse else response
+
+        timing = RequestTiming(spec.operation or spec.method, spec.method)
+        try:
+            response = await self._send(spec, stream, timing)
+            if stream:
+                timing.close_with(lambda: metrics.record(timing.finish()))
+                return response
+            result = spec.handle(response, self.codec, timing) if parse else response
+        except BaseException as e:
+            metrics.record(timing.finish(e))
+            raise
+        metrics.record(timing.finish())
+        return result
+
+    async def _send(
+        self,
+        spec: RequestSpec[Any],
+        stream: bool,
+        timing: Optional[RequestTiming] = None,
+    ) -> httpx.Response:
+        state = _RetryState(self.retry, spec, self.rate_limiter, self.circuit_breaker)
+        try:
+            while True:
+                state.admit()
+                if self.rate_limiter is not None:
+                    waited = time.perf_counter()
+                    await self.rate_limiter.acquire_async(spec.path)
+                    if timing is not None:
+                        timing.add("rate_limit", waited)
+                request = _build_request(self.http_client, spec, self.codec)
+                if timing is not None:
+                    timing.begin_attempt()
+                    request.extensions["trace"] = timing.atrace
+                state.sending()
+                try:
+                    response = await self.http_client.send(request, stream=stream)
+                except httpx.TransportError as e:
+                    delay = state.next_delay(e)
+                else:
+                    if timing is not None:
+                        timing.status = response.status_code
+                    if not response.is_error:
+                        state.succeeded()
+                        return response
+                    await response.aread()
+                    await response.aclose()
+                    delay = state.next_delay(_error_from_response(response))
+                slept = time.perf_counter()
+                await asyncio.sleep(delay)
+                if timing is not None:
+                    timing.add("backoff", slept)
+        finally:
+            state.abandon()
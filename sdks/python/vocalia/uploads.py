@@ -0,0 +1,198 @@
+"""
+VocalIA Uploads - Streaming multipart bodies for audio uploads
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+from abc import ABC, abstractmethod
+from typing import (
+    IO,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+AudioSource = Union[
+    bytes,
+    bytearray,
+    memoryview,
+    str,
+    "os.PathLike[str]",
+    IO[bytes],
+    Iterable[bytes],
+    AsyncIterable[bytes],
+]
+
+
+class StreamingBody(ABC):
+    """
+    Request body produced chunk by chunk.
+
+    Transports call :meth:`iter_chunks` on sync clients and
+    :meth:`aiter_chunks` on async ones. When :meth:`size` is unknown the
+    body is sent with chunked transfer encoding.
+    """
+
+    def headers(self) -> Dict[str, str]:
+        headers = {}
+        size = self.size()
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        return headers
+
+    def size(self) -> Optional[int]:
+        return None
+
+    @abstractmethod
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the body for a sync client."""
+
+    @abstractmethod
+    def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield the body for an async client."""
+
+
+def _source_size(source: AudioSource) -> Optional[int]:
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if hasattr(source, "read"):
+        file: IO[bytes] = source  # type: ignore[assignment]
+        try:
+            if file.seekable():
+                return max(0, os.fstat(file.fileno()).st_size - file.tell())
+        except (AttributeError, OSError, ValueError):
+            return None
+    return None
+
+
+def _iter_buffer(buffer: memoryview, chunk_size: int) -> Iterator[bytes]:
+    # Slicing a memoryview does not copy; the socket layer accepts it as is
+    flat = buffer.cast("B") if buffer.ndim != 1 or buffer.format != "B" else buffer
+    for start in range(0, len(flat), chunk_size):
+        yield flat[start : start + chunk_size]  # type: ignore[misc]
+
+
+def _iter_file(file: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class MultipartAudio(StreamingBody):
+    """
+    Single-file ``multipart/form-data`` body streamed from an audio source.
+
+    The audio is never concatenated into one buffer: bytes-like sources
+    are sliced through a memoryview, paths and file objects are read in
+    chunks, and iterators are forwarded as they produce data (so a
+    recording can be uploaded while it is still being captured).
+
+    Args:
+        source: Bytes-like object, file path, binary file object, or a
+                sync/async iterator of byte chunks
+        filename: Filename reported for the form field
+        content_type: MIME type of the audio
+        field: Form field name
+        chunk_size: Read size for paths, files and buffers
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        filename: str,
+        content_type: str,
+        field: str = "audio",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.source = source
+        self.chunk_size = chunk_size
+        self.boundary = "vocalia-" + secrets.token_hex(16)
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; '
+            f'filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._size = _source_size(source)
+
+    def headers(self) -> Dict[str, str]:
+        headers = super().headers()
+        headers["Content-Type"] = f"multipart/form-data; boundary={self.boundary}"
+        return headers
+
+    def size(self) -> Optional[int]:
+        if self._size is None:
+            return None
+        return len(self._head) + self._size + len(self._tail)
+
+    def _iter_source(self) -> Iterator[bytes]:
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            yield from _iter_buffer(memoryview(source), self.chunk_size)
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from _iter_file(f, self.chunk_size)
+        elif hasattr(source, "read"):
+            yield from _iter_file(source, self.chunk_size)  # type: ignore[arg-type]
+        elif hasattr(source, "__aiter__"):
+            raise TypeError("Async iterators can only be uploaded with AsyncVocalIA")
+        else:
+            for chunk in source:
+                if chunk:
+                    yield chunk
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        yield self._head
+        yield from self._iter_source()
+        yield self._tail
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        yield self._head
+        source = self.source
+        if hasattr(source, "__aiter__"):
+            async for chunk in source:
+                if chunk:
+                    yield chunk
+        elif isinstance(source, (str, os.PathLike)) or hasattr(source, "read"):
+            async for chunk in self._aiter_file():
+                yield chunk
+        else:
+            for chunk in self._iter_source():
+                yield chunk
+        yield self._tail
+
+    async def _aiter_file(self) -> AsyncIterator[bytes]:
+        # Disk reads run in the executor so a slow disk does not stall the loop
+        loop = asyncio.get_running_loop()
+        source = self.source
+        owned = isinstance(source, (str, os.PathLike))
+        if isinstance(source, (str, os.PathLike)):
+            path = source
+            file: IO[bytes] = await loop.run_in_executor(None, lambda: open(path, "rb"))
+        else:
+            file = source  # type: ignore[assignment]
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, file.read, self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            if owned:
+                await loop.run_in_executor(None, file.close)
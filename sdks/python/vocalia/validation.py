@@ -0,0 +1,152 @@
+"""
+VocalIA Validation - Strict, trusted and lazy model construction
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Literal,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+#: How list responses are turned into models:
+#: ``"strict"`` validates each item on its own (the default),
+#: ``"trusted"`` validates the whole list in one pydantic-core call,
+#: ``"lazy"`` returns :class:`LazyModel` proxies that validate a field on
+#: first access.
+ValidationMode = Literal["strict", "trusted", "lazy"]
+
+VALIDATION_MODES = ("strict", "trusted", "lazy")
+
+
+def check_mode(mode: str) -> ValidationMode:
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"validation must be one of {', '.join(VALIDATION_MODES)}; got {mode!r}"
+        )
+    return cast(ValidationMode, mode)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter[List[Any]]:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+_PRIMITIVES = (str, int, float, bool)
+
+
+def _exact_types(annotation: Any) -> FrozenSet[type]:
+    # Raw JSON values of these types need no conversion for this field
+    if annotation in _PRIMITIVES:
+        return frozenset((annotation,))
+    args = get_args(annotation)
+    if get_origin(annotation) is Union and all(
+        arg in _PRIMITIVES or arg is type(None) for arg in args
+    ):
+        return frozenset(args)
+    return frozenset()
+
+
+# attribute name -> (key in the payload, exact types, adapter, FieldInfo)
+_FieldTable = Dict[str, Tuple[str, FrozenSet[type], TypeAdapter[Any], Any]]
+_FIELD_TABLES: Dict[Type[BaseModel], _FieldTable] = {}
+
+
+def _field_table(model: Type[BaseModel]) -> _FieldTable:
+    table = _FIELD_TABLES.get(model)
+    if table is None:
+        table = {
+            name: (
+                info.alias or name,
+                _exact_types(info.annotation),
+                TypeAdapter(info.annotation or Any),
+                info,
+            )
+            for name, info in model.model_fields.items()
+        }
+        _FIELD_TABLES[model] = table
+    return table
+
+
+class LazyModel(Generic[M]):
+    """
+    Read-only proxy over a raw API object.
+
+    Attribute access validates just that field, with the same rules as
+    the full model, and caches the result; fields that are never read are
+    never parsed. :meth:`resolve` builds the complete model, and a missing
+    required field raises pydantic's ``ValidationError`` when read.
+    """
+
+    __slots__ = ("_model", "_data", "_values")
+
+    def __init__(self, model: Type[M], data: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_values", {})
+
+    def __getattr__(self, name: str) -> Any:
+        values = self._values
+        if name in values:
+            return values[name]
+        try:
+            key, exact, adapter, info = _field_table(self._model)[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._model.__name__!r} object has no attribute {name!r}"
+            ) from None
+
+        data = self._data
+        if key not in data and name in data:
+            key = name
+        if key in data:
+            value = data[key]
+            if type(value) not in exact:
+                value = adapter.validate_python(value)
+        elif info.is_required():
+            # Let the full model report the error in its usual form
+            self.resolve()
+            raise AttributeError(name)  # pragma: no cover
+        else:
+            value = info.get_default(call_default_factory=True)
+        values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def resolve(self) -> M:
+        """Validate every field and return the full model."""
+        return self._model.model_validate(self._data)  # type: ignore[no-any-return]
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.resolve().model_dump(**kwargs)
+
+    def __repr__(self) -> str:
+        return f"Lazy{self._model.__name__}({self._data!r})"
+
+
+def build_models(model: Type[M], items: List[Dict[str, Any]], mode: str) -> List[M]:
+    """Turn a list of raw API objects into models according to ``mode``."""
+    if mode == "trusted":
+        adapter = _list_adapter(model)
+        return adapter.validate_python(items)
+    if mode == "lazy":
+        return [LazyModel(model, item) for item in items]  # type: ignore[misc]
+    return [model(**item) for item in items]
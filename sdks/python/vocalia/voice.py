@@ -4,11 +4,152 @@ VocalIA Voice Client - Widget & Web Speech API
 
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
+import asyncio
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
-
-from .models import VoiceResponse, ConversationMessage, Persona, Language
+from pydantic import TypeAdapter
+
+from .audiocache import AudioData, SynthesisCache, synthesis_key
+from .catalog import CatalogCache
+from .codec import RawJSON
+from .models import ConversationMessage, Language, Persona, VoiceResponse
+from .realtime import AsyncRealtimeSession, RealtimeSession
+from .streaming import (
+    STREAM_ACCEPT,
+    AsyncAudioStream,
+    AsyncVoiceResponseStream,
+    AudioStream,
+    VoiceResponseStream,
+)
+from .transport import AsyncTransport, RequestSpec, SyncTransport
+from .uploads import AudioSource, MultipartAudio
+from .validation import ValidationMode, build_models, check_mode
+
+# Serializes conversation history straight to JSON bytes, without the
+# per-message dicts model_dump() would build
+_CONTEXT_ADAPTER = TypeAdapter(List[ConversationMessage])
+
+
+def _generate_request(
+    text: str,
+    persona: str,
+    language: str,
+    context: Optional[List[ConversationMessage]],
+    knowledge_base_id: Optional[str],
+    stream: bool,
+) -> RequestSpec[VoiceResponse]:
+    payload: Dict[str, Any] = {
+        "text": text,
+        "persona": persona,
+        "language": language,
+        "stream": stream,
+    }
+
+    if context:
+        payload["context"] = RawJSON(_CONTEXT_ADAPTER.dump_json(context))
+    if knowledge_base_id:
+        payload["knowledge_base_id"] = knowledge_base_id
+
+    return RequestSpec(
+        "POST",
+        "/v1/voice/generate",
+        json=payload,
+        headers={"Accept": STREAM_ACCEPT} if stream else None,
+        parse=lambda data: VoiceResponse(**data),
+        operation="voice.generate_response",
+    )
+
+
+def _transcribe_request(
+    audio_data: AudioSource,
+    language: str,
+    format: str,
+) -> RequestSpec[str]:
+    # Streamed rather than passed as httpx ``files`` so the audio is never
+    # copied into one buffer; iterator sources go out chunk-encoded.
+    return RequestSpec(
+        "POST",
+        "/v1/voice/transcribe",
+        content=MultipartAudio(audio_data, "audio." + format, f"audio/{format}"),
+        params={"language": language},
+        parse=lambda data: data["text"],
+        operation="voice.transcribe",
+    )
+
+
+def _synthesize_request(
+    text: str,
+    voice_id: Optional[str],
+    language: str,
+    speed: float,
+    stream: bool = False,
+) -> RequestSpec[bytes]:
+    payload: Dict[str, Any] = {
+        "text": text,
+        "language": language,
+        "speed": speed,
+    }
+    if voice_id:
+        payload["voice_id"] = voice_id
+    if stream:
+        payload["stream"] = True
+
+    return RequestSpec(
+        "POST",
+        "/v1/voice/synthesize",
+        json=payload,
+        raw=True,
+        operation="voice.synthesize",
+    )
+
+
+def _list_personas_request(validation: str = "strict") -> RequestSpec[List[Persona]]:
+    return RequestSpec(
+        "GET",
+        "/v1/voice/personas",
+        parse=lambda data: build_models(Persona, data["personas"], validation),
+        operation="voice.list_personas",
+    )
+
+
+def _list_languages_request(
+    validation: str = "strict",
+) -> RequestSpec[List[Language]]:
+    return RequestSpec(
+        "GET",
+        "/v1/voice/languages",
+        parse=lambda data: build_models(Language, data["languages"], validation),
+        operation="voice.list_languages",
+    )
+
+
+def _persona_key(persona: Persona) -> str:
+    return persona.key
+
+
+def _language_key(language: Language) -> str:
+    return language.code
+
+
+def _widget_token_request(
+    domain: str,
+    persona: str,
+    expires_in: int,
+) -> RequestSpec[str]:
+    payload = {
+        "domain": domain,
+        "persona": persona,
+        "expires_in": expires_in,
+    }
+
+    return RequestSpec(
+        "POST",
+        "/v1/voice/widget-token",
+        json=payload,
+        parse=lambda data: data["token"],
+        operation="voice.create_widget_token",
+    )
 
 
 class VoiceClient:
@@ -19,8 +160,17 @@ class VoiceClient:
     for web-based voice interactions.
     """
 
-    def __init__(self, http_client: httpx.Client) -> None:
-        self._client = http_client
+    def __init__(
+        self,
+        http_client: Union[httpx.Client, SyncTransport],
+        catalog: Optional[CatalogCache] = None,
+        synthesis_cache: Optional[SynthesisCache] = None,
+        validation: ValidationMode = "strict",
+    ) -> None:
+        self._transport = SyncTransport.wrap(http_client)
+        self._catalog = catalog
+        self._synthesis_cache = synthesis_cache
+        self._validation = check_mode(validation)
 
     def generate_response(
         self,
@@ -40,7 +190,9 @@ class VoiceClient:
             language: Language code (fr, en, es, ar, ary)
             context: Previous conversation messages for context
             knowledge_base_id: Optional KB ID for RAG
-            stream: Whether to stream the response
+            stream: Have the server stream the response; the stream is
+                    consumed and the final response returned. Use
+                    :meth:`stream_response` to handle chunks as they arrive.
 
         Returns:
             VoiceResponse with text and optional audio
@@ -53,52 +205,112 @@ class VoiceClient:
             )
             print(response.text)
         """
-        payload: Dict[str, Any] = {
-            "text": text,
-            "persona": persona,
-            "language": language,
-            "stream": stream,
-        }
+        if stream:
+            return self.stream_response(
+                text, persona, language, context, knowledge_base_id
+            ).get_final_response()
+
+        return self._transport.call(
+            _generate_request(
+                text, persona, language, context, knowledge_base_id, False
+            )
+        )
+
+    def stream_response(
+        self,
+        text: str,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        context: Optional[List[ConversationMessage]] = None,
+        knowledge_base_id: Optional[str] = None,
+    ) -> VoiceResponseStream:
+        """
+        Generate an AI voice response as a stream of incremental chunks.
+
+        The server may answer with Server-Sent Events or NDJSON; both are
+        decoded into VoiceChunk objects carrying text or audio deltas.
+
+        Args:
+            text: User input text
+            persona: Persona key (AGENCY, DENTAL, PROPERTY, etc.)
+            language: Language code (fr, en, es, ar, ary)
+            context: Previous conversation messages for context
+            knowledge_base_id: Optional KB ID for RAG
+
+        Returns:
+            VoiceResponseStream yielding VoiceChunk objects; its
+            ``response`` attribute holds the final VoiceResponse
+
+        Example:
+            with client.voice.stream_response("Quels sont vos horaires?") as s:
+                for chunk in s:
+                    if chunk.text:
+                        print(chunk.text, end="", flush=True)
+            print(s.response.confidence)
+        """
+        spec = _generate_request(
+            text, persona, language, context, knowledge_base_id, True
+        )
+        return VoiceResponseStream(self._transport, spec, persona, language)
+
+    def realtime(
+        self,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        **options: Any,
+    ) -> RealtimeSession:
+        """
+        Open a full-duplex realtime voice session over WebSocket.
 
-        if context:
-            payload["context"] = [msg.model_dump() for msg in context]
-        if knowledge_base_id:
-            payload["knowledge_base_id"] = knowledge_base_id
+        One socket carries audio up and transcripts, response text and
+        response audio down, replacing a transcribe + generate_response +
+        synthesize round-trip per turn.
 
-        response = self._client.post("/v1/voice/generate", json=payload)
-        response.raise_for_status()
+        Args:
+            persona: Persona key for the AI agent
+            language: Language code (fr, en, es, ar, ary)
+            **options: Session options (audio_format, sample_rate, frame_ms,
+                       pace, send_queue_size, receive_queue_size,
+                       auto_barge_in); see RealtimeSession
 
-        data = response.json()
-        return VoiceResponse(**data)
+        Returns:
+            RealtimeSession, connected on ``with`` or ``connect()``
+
+        Example:
+            with client.voice.realtime(persona="DENTAL") as session:
+                for frame in microphone:
+                    session.send_audio(frame)
+        """
+        return RealtimeSession(self._transport, persona, language, **options)
 
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: AudioSource,
         language: str = "fr",
         format: str = "webm",
     ) -> str:
         """
         Transcribe audio to text using Web Speech API backend.
 
+        The audio is streamed to the server without being loaded into
+        memory first. Sources of unknown length (iterators) are sent with
+        chunked transfer encoding, so transcription can start while the
+        audio is still being captured.
+
         Args:
-            audio_data: Raw audio bytes
+            audio_data: Raw audio as bytes, bytearray or memoryview, a file
+                        path, a binary file object, or an iterator of
+                        byte chunks
             language: Expected language code
             format: Audio format (webm, wav, mp3)
 
         Returns:
             Transcribed text
-        """
-        files = {"audio": ("audio." + format, audio_data, f"audio/{format}")}
-        params = {"language": language}
-
-        response = self._client.post(
-            "/v1/voice/transcribe",
-            files=files,
-            params=params,
-        )
-        response.raise_for_status()
 
-        return response.json()["text"]
+        Example:
+            text = client.voice.transcribe("call.wav", format="wav")
+        """
+        return self._transport.call(_transcribe_request(audio_data, language, format))
 
     def synthesize(
         self,
@@ -106,10 +318,14 @@ class VoiceClient:
         voice_id: Optional[str] = None,
         language: str = "fr",
         speed: float = 1.0,
-    ) -> bytes:
+    ) -> AudioData:
         """
         Convert text to speech audio.
 
+        With a synthesis cache configured, repeated requests are served
+        from it; cached files larger than its ``map_above`` are returned
+        as a read-only ``mmap`` owned (and closed) by the caller.
+
         Args:
             text: Text to synthesize
             voice_id: Optional specific voice ID
@@ -119,42 +335,117 @@ class VoiceClient:
         Returns:
             Audio bytes (MP3 format)
         """
-        payload = {
-            "text": text,
-            "language": language,
-            "speed": speed,
-        }
-        if voice_id:
-            payload["voice_id"] = voice_id
+        cache = self._synthesis_cache
+        if cache is None:
+            return self._transport.call(
+                _synthesize_request(text, voice_id, language, speed)
+            )
 
-        response = self._client.post("/v1/voice/synthesize", json=payload)
-        response.raise_for_status()
+        key = synthesis_key(text, voice_id, language, speed)
+        audio = cache.get(key)
+        if audio is None:
+            audio = self._transport.call(
+                _synthesize_request(text, voice_id, language, speed)
+            )
+            cache.put(key, audio)
+        return audio
 
-        return response.content
+    def synthesize_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        language: str = "fr",
+        speed: float = 1.0,
+        chunk_size: Optional[int] = None,
+    ) -> AudioStream:
+        """
+        Convert text to speech, yielding audio chunks as they are produced.
+
+        Playback can start on the first chunk instead of waiting for the
+        whole file; ``write_to`` sends the audio straight to a file or
+        socket without buffering it.
+
+        Args:
+            text: Text to synthesize
+            voice_id: Optional specific voice ID
+            language: Language code
+            speed: Speech speed (0.5 to 2.0)
+            chunk_size: Re-chunk to this many bytes (default: as received)
+
+        Returns:
+            AudioStream of audio byte chunks (MP3 format)
+
+        Example:
+            client.voice.synthesize_stream("Bienvenue").write_to(sock)
+        """
+        return AudioStream(
+            self._transport,
+            _synthesize_request(text, voice_id, language, speed, stream=True),
+            chunk_size,
+        )
 
     def list_personas(self) -> List[Persona]:
         """
         List available voice personas.
 
+        Served from the client's catalog cache when one is configured.
+
         Returns:
             List of Persona objects
         """
-        response = self._client.get("/v1/voice/personas")
-        response.raise_for_status()
-
-        return [Persona(**p) for p in response.json()["personas"]]
+        if self._catalog is None:
+            return self._transport.call(_list_personas_request(self._validation))
+        return self._catalog.get(
+            self._transport, _list_personas_request(self._validation), _persona_key
+        ).items
 
     def list_languages(self) -> List[Language]:
         """
         List supported languages.
 
+        Served from the client's catalog cache when one is configured.
+
         Returns:
             List of Language objects
         """
-        response = self._client.get("/v1/voice/languages")
-        response.raise_for_status()
+        if self._catalog is None:
+            return self._transport.call(_list_languages_request(self._validation))
+        return self._catalog.get(
+            self._transport, _list_languages_request(self._validation), _language_key
+        ).items
+
+    def get_persona(self, key: str) -> Optional[Persona]:
+        """
+        Look up a persona by key (e.g. "DENTAL").
+
+        Returns:
+            The Persona, or None if the key is unknown
+        """
+        if self._catalog is None:
+            personas = self.list_personas()
+            return {_persona_key(p): p for p in personas}.get(key)
+        return self._catalog.get(
+            self._transport, _list_personas_request(self._validation), _persona_key
+        ).index.get(key)
+
+    def get_language(self, code: str) -> Optional[Language]:
+        """
+        Look up a supported language by code (e.g. "fr").
 
-        return [Language(**lang) for lang in response.json()["languages"]]
+        Returns:
+            The Language, or None if the code is unsupported
+        """
+        if self._catalog is None:
+            languages = self.list_languages()
+            return {_language_key(lang): lang for lang in languages}.get(code)
+        return self._catalog.get(
+            self._transport, _list_languages_request(self._validation), _language_key
+        ).index.get(code)
+
+    def warm_catalog(self) -> None:
+        """Load the persona and language catalogs into the cache."""
+        self.list_personas()
+        self.list_languages()
 
     def create_widget_token(
         self,
@@ -173,13 +464,180 @@ class VoiceClient:
         Returns:
             Widget embed token
         """
-        payload = {
-            "domain": domain,
-            "persona": persona,
-            "expires_in": expires_in,
-        }
+        return self._transport.call(
+            _widget_token_request(domain, persona, expires_in)
+        )
+
+
+class AsyncVoiceClient:
+    """
+    Async client for VocalIA Voice Widget functionality.
+
+    Mirrors :class:`VoiceClient` method for method; both share the same
+    request builders and response parsers.
+    """
+
+    def __init__(
+        self,
+        http_client: Union[httpx.AsyncClient, AsyncTransport],
+        catalog: Optional[CatalogCache] = None,
+        synthesis_cache: Optional[SynthesisCache] = None,
+        validation: ValidationMode = "strict",
+    ) -> None:
+        self._transport = AsyncTransport.wrap(http_client)
+        self._catalog = catalog
+        self._synthesis_cache = synthesis_cache
+        self._validation = check_mode(validation)
+
+    async def generate_response(
+        self,
+        text: str,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        context: Optional[List[ConversationMessage]] = None,
+        knowledge_base_id: Optional[str] = None,
+        stream: bool = False,
+    ) -> VoiceResponse:
+        """Generate an AI voice response. See :meth:`VoiceClient.generate_response`."""
+        if stream:
+            return await self.stream_response(
+                text, persona, language, context, knowledge_base_id
+            ).get_final_response()
+
+        return await self._transport.call(
+            _generate_request(
+                text, persona, language, context, knowledge_base_id, False
+            )
+        )
+
+    def stream_response(
+        self,
+        text: str,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        context: Optional[List[ConversationMessage]] = None,
+        knowledge_base_id: Optional[str] = None,
+    ) -> AsyncVoiceResponseStream:
+        """Stream an AI voice response. See :meth:`VoiceClient.stream_response`."""
+        spec = _generate_request(
+            text, persona, language, context, knowledge_base_id, True
+        )
+        return AsyncVoiceResponseStream(self._transport, spec, persona, language)
 
-        response = self._client.post("/v1/voice/widget-token", json=payload)
-        response.raise_for_status()
+    def realtime(
+        self,
+        persona: str = "AGENCY",
+        language: str = "fr",
+        **options: Any,
+    ) -> AsyncRealtimeSession:
+        """Open a realtime voice session. See :meth:`VoiceClient.realtime`."""
+        return AsyncRealtimeSession(self._transport, persona, language, **options)
 
-        return response.json()["token"]
+    async def transcribe(
+        self,
+        audio_data: AudioSource,
+        language: str = "fr",
+        format: str = "webm",
+    ) -> str:
+        """
+        Transcribe audio to text. See :meth:`VoiceClient.transcribe`.
+
+        Also accepts async iterators of byte chunks.
+        """
+        return await self._transport.call(
+            _transcribe_request(audio_data, language, format)
+        )
+
+    async def synthesize(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        language: str = "fr",
+        speed: float = 1.0,
+    ) -> AudioData:
+        """Convert text to speech audio. See :meth:`VoiceClient.synthesize`."""
+        cache = self._synthesis_cache
+        if cache is None:
+            return await self._transport.call(
+                _synthesize_request(text, voice_id, language, speed)
+            )
+
+        key = synthesis_key(text, voice_id, language, speed)
+        # Disk hits read or map a file and the write fsyncs; keep both off
+        # the event loop
+        loop = asyncio.get_running_loop()
+        audio = await loop.run_in_executor(None, cache.get, key)
+        if audio is None:
+            audio = await self._transport.call(
+                _synthesize_request(text, voice_id, language, speed)
+            )
+            await loop.run_in_executor(None, cache.put, key, audio)
+        return audio
+
+    def synthesize_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        language: str = "fr",
+        speed: float = 1.0,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncAudioStream:
+        """Stream synthesized audio. See :meth:`VoiceClient.synthesize_stream`."""
+        return AsyncAudioStream(
+            self._transport,
+            _synthesize_request(text, voice_id, language, speed, stream=True),
+            chunk_size,
+        )
+
+    async def list_personas(self) -> List[Persona]:
+        """List available voice personas."""
+        if self._catalog is None:
+            return await self._transport.call(_list_personas_request(self._validation))
+        entry = await self._catalog.aget(
+            self._transport, _list_personas_request(self._validation), _persona_key
+        )
+        return entry.items
+
+    async def list_languages(self) -> List[Language]:
+        """List supported languages."""
+        if self._catalog is None:
+            return await self._transport.call(_list_languages_request(self._validation))
+        entry = await self._catalog.aget(
+            self._transport, _list_languages_request(self._validation), _language_key
+        )
+        return entry.items
+
+    async def get_persona(self, key: str) -> Optional[Persona]:
+        """Look up a persona by key. See :meth:`VoiceClient.get_persona`."""
+        if self._catalog is None:
+            personas = await self.list_personas()
+            return {_persona_key(p): p for p in personas}.get(key)
+        entry = await self._catalog.aget(
+            self._transport, _list_personas_request(self._validation), _persona_key
+        )
+        return entry.index.get(key)
+
+    async def get_language(self, code: str) -> Optional[Language]:
+        """Look up a language by code. See :meth:`VoiceClient.get_language`."""
+        if self._catalog is None:
+            languages = await self.list_languages()
+            return {_language_key(lang): lang for lang in languages}.get(code)
+        entry = await self._catalog.aget(
+            self._transport, _list_languages_request(self._validation), _language_key
+        )
+        return entry.index.get(code)
+
+    async def warm_catalog(self) -> None:
+        """Load the persona and language catalogs into the cache."""
+        await asyncio.gather(self.list_personas(), self.list_languages())
+
+    async def create_widget_token(
+        self,
+        domain: str,
+        persona: str = "AGENCY",
+        expires_in: int = 3600,
+    ) -> str:
+        """Create a widget embed token. See :meth:`VoiceClient.create_widget_token`."""
+        return await self._transport.call(
+            _widget_token_request(domain, persona, expires_in)
+        )
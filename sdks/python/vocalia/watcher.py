@@ -0,0 +1,375 @@
+"""
+VocalIA Call Watcher - Multiplexed status tracking for many calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .exceptions import NotFoundError
+from .models import CallEvent, CallSession, CallStatus
+
+if TYPE_CHECKING:
+    from .telephony import AsyncTelephonyClient
+    from .webhooks import WebhookApp
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset(
+    {
+        CallStatus.COMPLETED,
+        CallStatus.FAILED,
+        CallStatus.BUSY,
+        CallStatus.NO_ANSWER,
+        CallStatus.CANCELED,
+    }
+)
+
+# Seconds between polls of a call, by its last known status
+DEFAULT_INTERVALS: Dict[Optional[CallStatus], float] = {
+    None: 2.0,
+    CallStatus.QUEUED: 1.0,
+    CallStatus.RINGING: 1.0,
+    CallStatus.IN_PROGRESS: 10.0,
+}
+
+# Status implied by push events that do not carry one
+_EVENT_STATUSES = {
+    "call.ringing": CallStatus.RINGING,
+    "call.started": CallStatus.IN_PROGRESS,
+    "call.completed": CallStatus.COMPLETED,
+    "call.failed": CallStatus.FAILED,
+}
+
+StatusSet = Collection[Union[CallStatus, str]]
+
+
+class _Watched:
+    __slots__ = ("call_id", "call", "status", "since", "due", "waiters")
+
+    def __init__(self, call_id: str) -> None:
+        self.call_id = call_id
+        self.call: Optional[CallSession] = None
+        self.status: Optional[CallStatus] = None
+        self.since = datetime.now(timezone.utc)
+        self.due = 0.0
+        self.waiters: List[Tuple[Set[CallStatus], "asyncio.Future[CallSession]"]] = []
+
+
+class CallWatcher:
+    """
+    Tracks the status of many calls from one background task.
+
+    Each watched call is polled at an interval chosen from its last known
+    status (fast while queued or ringing, slow while in progress) and
+    dropped once it reaches a terminal status. When many calls are due at
+    once they are refreshed with a paged ``iter_calls`` sweep instead of
+    one ``get_call`` each; calls the sweep misses fall back to
+    ``get_call``.
+
+    Push updates can be fed with :meth:`push` or by :meth:`attach`-ing a
+    :class:`~vocalia.webhooks.WebhookApp`: the affected call is refreshed
+    immediately, and while pushes keep arriving the polling intervals are
+    stretched by ``push_interval_factor`` as a safety net only.
+
+    Usage:
+        async with client.telephony.watcher() as watcher:
+            call = await client.telephony.initiate_call("+212600000000")
+            done = await watcher.wait(call.id, {CallStatus.COMPLETED})
+
+    Args:
+        telephony: AsyncTelephonyClient used for polling
+        intervals: Poll interval per status, merged over DEFAULT_INTERVALS
+        concurrency: Maximum ``get_call`` requests in flight
+        batch_threshold: Due calls from which a list sweep is used
+        sweep_limit: Maximum calls read by one sweep
+        push_interval_factor: Interval multiplier while pushes arrive
+        push_idle: Seconds without a push before normal polling resumes
+    """
+
+    def __init__(
+        self,
+        telephony: "AsyncTelephonyClient",
+        intervals: Optional[Mapping[Optional[CallStatus], float]] = None,
+        concurrency: int = 10,
+        batch_threshold: int = 25,
+        sweep_limit: int = 1000,
+        push_interval_factor: float = 6.0,
+        push_idle: float = 60.0,
+    ) -> None:
+        self.telephony = telephony
+        self.intervals = {**DEFAULT_INTERVALS, **(intervals or {})}
+        self.concurrency = concurrency
+        self.batch_threshold = batch_threshold
+        self.sweep_limit = sweep_limit
+        self.push_interval_factor = push_interval_factor
+        self.push_idle = push_idle
+        self._watched: Dict[str, _Watched] = {}
+        self._schedule: List[Tuple[float, str]] = []
+        self._last_push = float("-inf")
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    # Public API
+
+    def watch(self, call_id: str) -> None:
+        """Start tracking ``call_id`` (no-op if already tracked)."""
+        if call_id not in self._watched:
+            self._watched[call_id] = _Watched(call_id)
+            self._reschedule(call_id, 0.0)
+        self._ensure_running()
+
+    def unwatch(self, call_id: str) -> None:
+        """Stop tracking ``call_id``; pending waiters are cancelled."""
+        watched = self._watched.pop(call_id, None)
+        if watched is not None:
+            for _, future in watched.waiters:
+                future.cancel()
+
+    def status(self, call_id: str) -> Optional[CallStatus]:
+        """Last known status of a tracked call."""
+        watched = self._watched.get(call_id)
+        return watched.status if watched is not None else None
+
+    async def wait(
+        self,
+        call_id: str,
+        statuses: StatusSet = TERMINAL_STATUSES,
+        timeout: Optional[float] = None,
+    ) -> CallSession:
+        """
+        Wait until ``call_id`` reaches one of ``statuses``.
+
+        Also returns when the call reaches a terminal status outside
+        ``statuses`` (it can no longer change), so check ``call.status``.
+
+        Raises:
+            asyncio.TimeoutError: ``timeout`` elapsed first
+            NotFoundError: The call does not exist
+        """
+        wanted = {CallStatus(s) for s in statuses}
+        self.watch(call_id)
+        watched = self._watched[call_id]
+        if watched.call is not None and (
+            watched.status in wanted or watched.status in TERMINAL_STATUSES
+        ):
+            return watched.call
+
+        future: "asyncio.Future[CallSession]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        watched.waiters.append((wanted, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if not future.done():
+                future.cancel()
+            if call_id in self._watched:
+                watched.waiters = [w for w in watched.waiters if w[1] is not future]
+
+    def push(self, event: CallEvent) -> None:
+        """
+        Feed a push update (e.g. a webhook event).
+
+        The call is refreshed right away; its status is applied at once
+        when the event states it.
+        """
+        self._last_push = time.monotonic()
+        if event.call_id is None or event.call_id not in self._watched:
+            return
+        status = event.data.get("status") or _EVENT_STATUSES.get(event.event_type)
+        watched = self._watched[event.call_id]
+        if status is not None:
+            try:
+                watched.status = CallStatus(status)
+            except ValueError:
+                pass
+        self._reschedule(event.call_id, 0.0)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def attach(self, app: "WebhookApp") -> None:
+        """Receive pushes from a WebhookApp's deliveries."""
+
+        async def on_event(event: CallEvent) -> None:
+            self.push(event)
+
+        app.add_handler("*", on_event)
+
+    async def aclose(self) -> None:
+        """Stop the polling task and cancel pending waiters."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for call_id in list(self._watched):
+            self.unwatch(call_id)
+
+    async def __aenter__(self) -> "CallWatcher":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    # Scheduling
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        else:
+            assert self._wakeup is not None
+            self._wakeup.set()
+
+    def _interval(self, status: Optional[CallStatus]) -> float:
+        interval = self.intervals.get(status, self.intervals[None])
+        if time.monotonic() - self._last_push < self.push_idle:
+            interval *= self.push_interval_factor
+        # Jitter keeps calls started together from being polled together
+        return interval * random.uniform(0.9, 1.1)
+
+    def _reschedule(self, call_id: str, delay: float) -> None:
+        watched = self._watched[call_id]
+        watched.due = time.monotonic() + delay
+        heapq.heappush(self._schedule, (watched.due, call_id))
+
+    def _pop_due(self) -> List[str]:
+        now = time.monotonic()
+        due: List[str] = []
+        while self._schedule and self._schedule[0][0] <= now:
+            at, call_id = heapq.heappop(self._schedule)
+            watched = self._watched.get(call_id)
+            # Skip stale heap entries left by earlier reschedules
+            if watched is not None and watched.due == at and call_id not in due:
+                due.append(call_id)
+        return due
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        try:
+            while self._watched:
+                due = self._pop_due()
+                if due:
+                    try:
+                        await self._refresh(due)
+                    except Exception:
+                        logger.exception("Refreshing %d watched calls failed", len(due))
+                        self._retry_later(due)
+                    continue
+                self._wakeup.clear()
+                delay = None
+                if self._schedule:
+                    delay = self._schedule[0][0] - time.monotonic()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        except Exception as e:
+            # Nothing would resolve the waiters any more; hand them the error
+            logger.exception("Call watcher stopped")
+            for call_id in list(self._watched):
+                self._fail(call_id, e)
+
+    def _retry_later(self, call_ids: List[str]) -> None:
+        now = time.monotonic()
+        for call_id in call_ids:
+            watched = self._watched.get(call_id)
+            # Calls refreshed before the failure are already rescheduled
+            if watched is not None and watched.due <= now:
+                self._reschedule(call_id, self._interval(watched.status))
+
+    async def _refresh(self, call_ids: List[str]) -> None:
+        remaining = set(call_ids)
+        if len(call_ids) >= self.batch_threshold:
+            for call in await self._sweep(remaining):
+                remaining.discard(call.id)
+                self._update(call.id, call)
+
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(call_id: str) -> None:
+            async with slots:
+                try:
+                    self._update(call_id, await self.telephony.get_call(call_id))
+                except NotFoundError as e:
+                    self._fail(call_id, e)
+                except Exception:
+                    logger.warning("Polling call %s failed", call_id, exc_info=True)
+                    self._retry_later([call_id])
+
+        await asyncio.gather(*(fetch(call_id) for call_id in remaining))
+
+    async def _sweep(self, wanted: Set[str]) -> List[CallSession]:
+        """Read recent calls page by page until every wanted ID is seen."""
+        since = min(self._watched[c].since for c in wanted if c in self._watched)
+        found: List[CallSession] = []
+        missing = set(wanted)
+        pages = self.telephony.iter_calls(
+            from_date=since - timedelta(minutes=5), max_items=self.sweep_limit
+        )
+        try:
+            async for call in pages:
+                if call.id in missing:
+                    missing.discard(call.id)
+                    found.append(call)
+                    if not missing:
+                        break
+        except Exception:
+            # The individual fallback covers what was not found
+            logger.warning("Call sweep failed", exc_info=True)
+        finally:
+            await pages.aclose()
+        return found
+
+    def _update(self, call_id: str, call: CallSession) -> None:
+        watched = self._watched.get(call_id)
+        if watched is None:
+            return
+        watched.call = call
+        watched.status = CallStatus(call.status)
+        started_at = getattr(call, "started_at", None)
+        if started_at is not None:
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=timezone.utc)
+            watched.since = min(watched.since, started_at)
+
+        terminal = watched.status in TERMINAL_STATUSES
+        pending = []
+        for wanted, future in watched.waiters:
+            if future.done():
+                continue
+            if watched.status in wanted or terminal:
+                future.set_result(call)
+            else:
+                pending.append((wanted, future))
+        watched.waiters = pending
+
+        if terminal:
+            del self._watched[call_id]
+        else:
+            self._reschedule(call_id, self._interval(watched.status))
+
+    def _fail(self, call_id: str, error: BaseException) -> None:
+        watched = self._watched.pop(call_id, None)
+        if watched is None:
+            return
+        for _, future in watched.waiters:
+            if not future.done():
+                future.set_exception(error)
@@ -0,0 +1,422 @@
+"""
+VocalIA Webhooks - Signature verification and event delivery
+
+Usage:
+    from vocalia.webhooks import WebhookApp
+
+    app = WebhookApp(secret=os.environ["VOCALIA_WEBHOOK_SECRET"])
+
+    @app.on("call.completed")
+    async def completed(event):
+        await store.save(event.call_id, event.data)
+
+    # uvicorn module:app
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from pydantic import ValidationError as PydanticValidationError
+
+from .exceptions import WebhookVerificationError
+from .models import CallEvent
+
+SIGNATURE_HEADER = "X-VocalIA-Signature"
+EVENT_ID_HEADER = "X-VocalIA-Idempotency-Key"
+
+DEFAULT_TOLERANCE = 300.0
+
+Secret = Union[str, bytes]
+EventHandler = Callable[[CallEvent], Union[Awaitable[None], None]]
+
+
+def _key(secret: Secret) -> bytes:
+    return secret.encode() if isinstance(secret, str) else secret
+
+
+def compute_signature(secret: Secret, body: bytes) -> str:
+    """Hex HMAC-SHA256 of ``body``, as sent in X-VocalIA-Signature."""
+    return hmac.new(_key(secret), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(
+    body: bytes,
+    signature: Optional[str],
+    secret: Union[Secret, Sequence[Secret]],
+) -> None:
+    """
+    Check a webhook signature in constant time.
+
+    Accepts the bare hex digest or a ``sha256=`` prefixed one. Pass several
+    secrets while rotating; any match is accepted.
+
+    Raises:
+        WebhookVerificationError: Missing or invalid signature
+    """
+    if not signature:
+        raise WebhookVerificationError("Missing webhook signature.")
+    if signature.startswith("sha256="):
+        signature = signature[7:]
+    secrets = [secret] if isinstance(secret, (str, bytes)) else list(secret)
+    received = signature.strip().lower().encode()
+    # Every secret is tried so timing does not reveal which one matched
+    valid = False
+    for candidate in secrets:
+        expected = compute_signature(candidate, body).encode()
+        valid |= hmac.compare_digest(expected, received)
+    if not valid:
+        raise WebhookVerificationError()
+
+
+def parse_event(body: Union[bytes, bytearray, memoryview, str]) -> CallEvent:
+    """
+    Parse a raw webhook body into a :class:`CallEvent`.
+
+    The bytes are validated directly by pydantic-core, without decoding to
+    ``str`` or building an intermediate dict.
+    """
+    if isinstance(body, memoryview):
+        body = bytes(body)
+    return CallEvent.model_validate_json(body)
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+class DedupeWindow:
+    """
+    Remembers event IDs for ``ttl`` seconds (at most ``max_size`` of them)
+    so redelivered events are processed once.
+
+    An ID is *claimed* when processing starts and either kept when it
+    succeeds or released when it fails, so a retry after an error is
+    processed again while concurrent duplicates are dropped. Thread-safe.
+    """
+
+    def __init__(self, ttl: float = 3600.0, max_size: int = 100_000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def claim(self, event_id: str) -> bool:
+        """Return True if ``event_id`` was not seen within the window."""
+        now = time.monotonic()
+        with self._lock:
+            expires = self._expires
+            # Entries are kept in insertion order with a fixed TTL, so the
+            # oldest ones are at the front.
+            while expires:
+                oldest, deadline = next(iter(expires.items()))
+                if deadline > now:
+                    break
+                del expires[oldest]
+            if event_id in expires:
+                return False
+            while len(expires) >= self.max_size:
+                expires.popitem(last=False)
+            expires[event_id] = now + self.ttl
+            return True
+
+    def release(self, event_id: str) -> None:
+        """Forget ``event_id`` so a redelivery is processed."""
+        with self._lock:
+            self._expires.pop(event_id, None)
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+class WebhookVerifier:
+    """
+    Framework-agnostic verification: signature, parsing and freshness.
+
+    The signature covers the raw body, which carries the event timestamp,
+    so the freshness check uses that signed value. Events older (or newer)
+    than ``tolerance`` seconds are rejected as possible replays.
+
+    Args:
+        secret: Webhook secret given to ``configure_webhook``, or several
+                while rotating
+        tolerance: Accepted clock difference in seconds; None disables it
+    """
+
+    def __init__(
+        self,
+        secret: Union[Secret, Sequence[Secret]],
+        tolerance: Optional[float] = DEFAULT_TOLERANCE,
+    ) -> None:
+        self.secret = secret
+        self.tolerance = tolerance
+
+    def verify(self, body: bytes, headers: Mapping[str, str]) -> CallEvent:
+        """
+        Verify and parse one delivery.
+
+        Raises:
+            WebhookVerificationError: Bad signature or stale timestamp
+        """
+        verify_signature(body, _header(headers, SIGNATURE_HEADER), self.secret)
+        try:
+            event = self.parse(body, headers)
+        except PydanticValidationError as e:
+            raise WebhookVerificationError(f"Malformed webhook body: {e}") from e
+        self.check_timestamp(event)
+        return event
+
+    def parse(self, body: bytes, headers: Mapping[str, str]) -> CallEvent:
+        """
+        Parse a delivery whose signature was already checked, taking the
+        event ID from the header when the body has none.
+
+        Raises:
+            pydantic.ValidationError: Body is not a valid event
+        """
+        event = parse_event(body)
+        if event.id is None:
+            event.id = _header(headers, EVENT_ID_HEADER)
+        return event
+
+    def check_timestamp(self, event: CallEvent) -> None:
+        """
+        Reject ``event`` when its timestamp is outside ``tolerance``.
+
+        Raises:
+            WebhookVerificationError: Stale or future timestamp
+        """
+        if self.tolerance is None:
+            return
+        timestamp = event.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        age = abs(datetime.now(timezone.utc).timestamp() - timestamp.timestamp())
+        if age > self.tolerance:
+            raise WebhookVerificationError(
+                f"Webhook timestamp outside tolerance ({age:.0f}s)."
+            )
+
+
+class WebhookApp:
+    """
+    ASGI application receiving VocalIA webhooks.
+
+    Each POST is verified, de-duplicated by event ID and dispatched to the
+    handlers registered for its type (and to ``"*"`` handlers). At most
+    ``concurrency`` handlers run at once; when no slot frees up within
+    ``queue_timeout`` the request is answered ``503`` with ``Retry-After``
+    so the sender redelivers later instead of the app queueing without
+    bound. Handler errors answer ``500`` and release the event ID, so the
+    redelivery is processed.
+
+    Responses: 200 processed or duplicate, 400 malformed body,
+    401 verification failed, 405 wrong method, 413 body too large,
+    500 handler error, 503 busy.
+
+    Args:
+        secret: Webhook secret, or several while rotating
+        handlers: Optional ``{event_type: handler}`` mapping
+        concurrency: Maximum handlers running at once
+        queue_timeout: Seconds a request waits for a handler slot
+        tolerance: Timestamp tolerance, see :class:`WebhookVerifier`
+        dedupe: Dedupe window; defaults to a new one-hour window
+        max_body_size: Largest accepted body in bytes
+    """
+
+    def __init__(
+        self,
+        secret: Union[Secret, Sequence[Secret]],
+        handlers: Optional[Mapping[str, EventHandler]] = None,
+        concurrency: int = 64,
+        queue_timeout: float = 5.0,
+        tolerance: Optional[float] = DEFAULT_TOLERANCE,
+        dedupe: Optional[DedupeWindow] = None,
+        max_body_size: int = 1024 * 1024,
+    ) -> None:
+        self.verifier = WebhookVerifier(secret, tolerance)
+        self.handlers: Dict[str, List[EventHandler]] = {}
+        for event_type, handler in (handlers or {}).items():
+            self.add_handler(event_type, handler)
+        self.concurrency = concurrency
+        self.queue_timeout = queue_timeout
+        self.dedupe = dedupe if dedupe is not None else DedupeWindow()
+        self.max_body_size = max_body_size
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def add_handler(self, event_type: str, handler: EventHandler) -> None:
+        """Register ``handler`` for ``event_type`` (``"*"`` for all events)."""
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def on(self, event_type: str) -> Callable[[EventHandler], EventHandler]:
+        """Decorator form of :meth:`add_handler`."""
+
+        def register(handler: EventHandler) -> EventHandler:
+            self.add_handler(event_type, handler)
+            return handler
+
+        return register
+
+    async def dispatch(self, event: CallEvent) -> None:
+        """Run every handler registered for ``event``."""
+        handlers = self.handlers.get(event.event_type, []) + self.handlers.get(
+            "*", []
+        )
+        loop = asyncio.get_running_loop()
+        for handler in handlers:
+            if asyncio.iscoroutinefunction(handler):
+                await handler(event)
+            else:
+                # Plain functions run in the default executor
+                result = await loop.run_in_executor(None, handler, event)
+                if asyncio.iscoroutine(result):
+                    await result
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            await _respond(send, 405, b"method not allowed", [(b"allow", b"POST")])
+            return
+
+        body = await self._read_body(receive)
+        if body is None:
+            await _respond(send, 413, b"body too large")
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        verifier = self.verifier
+        try:
+            verify_signature(body, _header(headers, SIGNATURE_HEADER), verifier.secret)
+        except WebhookVerificationError as e:
+            await _respond(send, 401, e.message.encode())
+            return
+        try:
+            event = verifier.parse(body, headers)
+        except PydanticValidationError:
+            await _respond(send, 400, b"malformed webhook body")
+            return
+        try:
+            verifier.check_timestamp(event)
+        except WebhookVerificationError as e:
+            await _respond(send, 401, e.message.encode())
+            return
+
+        event_id = event.id
+        if self.dedupe is not None and event_id and not self.dedupe.claim(event_id):
+            await _respond(send, 200, b"duplicate")
+            return
+
+        # The claim is kept only once the handlers succeeded; any other exit,
+        # including cancellation while waiting or dispatching, releases it so
+        # the redelivery is processed.
+        processed = False
+        try:
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.concurrency)
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                retry_after = str(max(1, int(self.queue_timeout))).encode()
+                await _respond(send, 503, b"busy", [(b"retry-after", retry_after)])
+                return
+
+            try:
+                await self.dispatch(event)
+            except Exception:
+                await _respond(send, 500, b"handler error")
+                return
+            finally:
+                self._slots.release()
+            processed = True
+        finally:
+            if not processed:
+                self._release(event_id)
+        await _respond(send, 200, b"ok")
+
+    def _release(self, event_id: Optional[str]) -> None:
+        if self.dedupe is not None and event_id:
+            self.dedupe.release(event_id)
+
+    async def _read_body(
+        self, receive: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Optional[bytes]:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    async def _lifespan(
+        self,
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _respond(
+    send: Callable[[Dict[str, Any]], Awaitable[None]],
+    status: int,
+    body: bytes,
+    headers: Optional[List[Any]] = None,
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"text/plain"),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})